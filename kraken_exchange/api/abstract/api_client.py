@@ -1,14 +1,35 @@
 import base64
 import hashlib
 import hmac
+import time
 import urllib.parse
 import requests
 import simplejson as json
 from decimal import Decimal
 from json import JSONDecodeError
-from typing import Callable, List, Protocol, Union
-from ..errors import ApiException, RequestFailedException
+from typing import Dict, List, Tuple, Union
+from ..errors import (
+    ApiException,
+    CircuitOpenException,
+    RateLimitExceededException,
+    RequestFailedException,
+    ServiceUnavailableException,
+)
+from ..metrics.request_metrics import RequestMetrics
+from ..streaming.json_item_stream import JsonItemStream
 from .api_model_base import ApiModelBase
+from .circuit_breaker import CircuitBreaker
+from .class_or_instance_method import ClassOrInstanceMethod
+from .hook_registry import (
+    HookRegistry,
+    ItemCallback,
+    PostRequestHook,
+    PreRequestHook,
+    TimingHook,
+)
+from .rate_limiter import RateLimiter
+from .response_dict import ResponseDict
+from .request_timing import RequestTiming
 
 
 class MockFactoryBase:
@@ -37,31 +58,12 @@ class MockFactoryResponse(requests.models.Response, MockFactoryBase):
     def json(self):
         return self._mock_json
 
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
 
-class PostRequestHook(Protocol):
-    def __call__(
-        self,
-        response: Union["MockFactoryResponse", requests.models.Response],
-        path: str,
-        post_data: dict,
-        query: dict,
-        headers: dict,
-        files: Union[list, None],
-        is_authenticated,
-    ) -> float:
-        pass
-
-
-class PreRequestHook(Protocol):
-    def __call__(
-        self,
-        path: str,
-        post_data: dict,
-        query: dict,
-        headers: dict,
-        files: Union[list, None],
-        is_authenticated,
-    ) -> float:
+    def close(self):
         pass
 
 
@@ -69,14 +71,65 @@ class ApiClient:
 
     BASE_URL: str = "https://api.kraken.com"
 
-    _pre_request_hooks: List[PreRequestHook] = list()
-    """Hooks added via add_post_request_hook(hook)"""
-
-    _post_request_hooks: List[PostRequestHook] = list()
-    """Hooks added via add_pre_request_hooks(hook)"""
+    _hooks: HookRegistry = HookRegistry()
+    """Hooks of every client, added via the add_*_hook class methods"""
 
     logged_in = False
 
+    SESSION: requests.Session | None = None
+    """Connection pool used by the client. None opens a connection per request."""
+
+    TIMEOUT: Tuple[float, float] | None = (5.0, 30.0)
+    """Connect and read timeouts in seconds. None waits forever."""
+
+    CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] | None = {}
+    """Circuit breaker per endpoint group, created on first use. None disables them."""
+
+    STREAM_CHUNK_SIZE: int = 65536
+    """Bytes read off the socket at a time when streaming a response"""
+
+    METRICS: RequestMetrics | None = RequestMetrics()
+    """Latency, response size and errors per path. None disables them."""
+
+    TRADING_ENDPOINTS: Tuple[str, ...] = (
+        "AddOrder",
+        "AddOrderBatch",
+        "EditOrder",
+        "CancelOrder",
+        "CancelOrderBatch",
+        "CancelAll",
+        "CancelAllOrdersAfter",
+    )
+    FUNDING_ENDPOINT_PREFIXES: Tuple[str, ...] = ("Deposit", "Withdraw", "Wallet")
+
+    COSTS: Dict[str, float] = {
+        "Ledgers": 2,
+        "QueryLedgers": 2,
+        "TradesHistory": 2,
+        "ClosedOrders": 2,
+        "WithdrawStatus": 2,
+    }
+    """Cost of private endpoints on the API counter, other than DEFAULT_COST.
+    Trading endpoints have their own limiter and cost nothing."""
+
+    DEFAULT_COST: float = 1
+
+    COUNTERS: Dict[str, RateLimiter] | None = None
+    """Model of the API counter per API key, created on first use. Off by default:
+    set it to {} on a subclass to enable it for the clients of that class.
+
+    Only while it is enabled are dict responses returned as ResponseDict,
+    carrying the counter state after the call; otherwise they are plain dicts.
+
+    It only observes the calls made, and RequestScheduler, KeyPool and the
+    resilience components throttle on their own RateLimiter, so enable it
+    only for clients that are not used by them, or its headroom is wrong.
+    """
+
+    def __init__(self, hooks: HookRegistry | None = None) -> None:
+        self.hooks = hooks if hooks is not None else HookRegistry()
+        """Hooks of this client only, run after the ones of every client"""
+
     @classmethod
     def check_response(
         cls,
@@ -99,19 +152,27 @@ class ApiClient:
 
         try:
             debug_dict["response"] = response.json()
+        except ValueError:
+            # e.g. an HTML error page from a proxy in front of the API
+            pass
         finally:
             print(f"Debug data for response to {path} ({response.status_code})")
             print(json.dumps(debug_dict, indent=4))
 
         """Checks the response to see if there's an issue."""
         # Use simplejson's loads method with Decimal parsing
-        resp_dict = json.loads(response.text, use_decimal=True)
-        if "error" in resp_dict:
+        try:
+            resp_dict = json.loads(response.text, use_decimal=True)
+        except ValueError:
+            resp_dict = None
+        if isinstance(resp_dict, dict) and "error" in resp_dict:
             for error in resp_dict["error"]:
                 exception_class = ApiException.get_exception_class(error)
                 raise exception_class()
 
         if response.status_code in [200, 201, 202, 301]:
+            if resp_dict is None:
+                return response.text
             try:
                 # As simplejson is used, there's no need to decode again
                 response_dict = resp_dict
@@ -134,6 +195,165 @@ class ApiClient:
             headers=headers,
         )
 
+    @classmethod
+    def get_endpoint_group(cls, path: str) -> str:
+        """Groups endpoints that tend to degrade together: public, trading, funding or account."""
+        if "/public/" in path:
+            return "public"
+        endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint in cls.TRADING_ENDPOINTS:
+            return "trading"
+        if endpoint.startswith(cls.FUNDING_ENDPOINT_PREFIXES):
+            return "funding"
+        return "account"
+
+    @classmethod
+    def create_circuit_breaker(cls, group: str) -> CircuitBreaker:
+        """Override to tune thresholds, per group if needed."""
+        return CircuitBreaker()
+
+    @classmethod
+    def get_circuit_breaker(cls, path: str) -> CircuitBreaker | None:
+        if cls.CIRCUIT_BREAKERS is None:
+            return None
+        group = cls.get_endpoint_group(path)
+        breaker = cls.CIRCUIT_BREAKERS.get(group)
+        if breaker is None:
+            breaker = cls.CIRCUIT_BREAKERS.setdefault(
+                group, cls.create_circuit_breaker(group)
+            )
+        return breaker
+
+    @classmethod
+    def get_cost(cls, request: ApiModelBase) -> float:
+        """Cost of the request on the private API counter. Public requests are free."""
+        path = request.get_path()
+        if not request.AUTHENTICATE or cls.get_endpoint_group(path) == "public":
+            return 0
+        endpoint = path.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint in cls.TRADING_ENDPOINTS:
+            return 0
+        return cls.COSTS.get(endpoint, cls.DEFAULT_COST)
+
+    @classmethod
+    def get_burst_cost(cls, batch: List[ApiModelBase]) -> float:
+        """Cost of sending all the requests in batch"""
+        return sum(cls.get_cost(request) for request in batch)
+
+    @classmethod
+    def create_counter(cls, api_key: str) -> RateLimiter:
+        """Override to match the account's tier."""
+        return RateLimiter()
+
+    @classmethod
+    def get_counter(cls, api_key: str) -> RateLimiter | None:
+        if cls.COUNTERS is None:
+            return None
+        counter = cls.COUNTERS.get(api_key)
+        if counter is None:
+            counter = cls.COUNTERS.setdefault(api_key, cls.create_counter(api_key))
+        return counter
+
+    @classmethod
+    def get_counter_state(cls, api_key: str) -> dict | None:
+        counter = cls.get_counter(api_key)
+        if counter is None:
+            return None
+        value = counter.counter
+        return {
+            "counter": value,
+            "max_counter": counter.max_counter,
+            "headroom": counter.max_counter - value,
+        }
+
+    @classmethod
+    def get_time_until(cls, api_key: str, units: float) -> float | None:
+        """Seconds until units of the counter are free, e.g. for a burst's cost.
+
+        None when COUNTERS is not enabled, as nothing is known then.
+        """
+        counter = cls.get_counter(api_key)
+        if counter is None:
+            return None
+        if units > counter.max_counter:
+            raise ValueError(
+                "{0} units never fit under a max_counter of {1}".format(
+                    units, counter.max_counter
+                )
+            )
+        return counter.get_wait(units)
+
+    @classmethod
+    def is_outage(cls, error: Exception) -> bool:
+        """Whether the error counts against the endpoint group's circuit breaker"""
+        if isinstance(error, RequestFailedException):
+            return error.response.status_code >= 500
+        return isinstance(
+            error, (ServiceUnavailableException, requests.RequestException)
+        )
+
+    def run_post_request_hooks(
+        self,
+        response: Union["MockFactoryResponse", requests.models.Response],
+        path: str,
+        post_data: dict,
+        query: dict,
+        headers: dict,
+        files: list,
+        request: ApiModelBase,
+    ) -> None:
+        """Runs the hooks of every client, then those of this client.
+
+        For streamed responses the hooks run once the body has been read, so
+        its content is no longer available to them.
+        """
+        for hooks in (self._hooks, self.hooks):
+            hooks.run_post_request_hooks(
+                response, path, post_data, query, headers, files, request.AUTHENTICATE
+            )
+
+    @classmethod
+    def check_stream(
+        cls,
+        response: requests.models.Response,
+        stream: JsonItemStream,
+        on_item: ItemCallback,
+        method,
+        path,
+        post_data=None,
+        query=None,
+        headers=None,
+        timing: RequestTiming | None = None,
+    ):
+        """Like check_response, but passes the items of the stream to on_item as they arrive.
+
+        The response is closed whatever happens, so its connection goes back
+        to the pool even when on_item raises. Reading each chunk is marked as
+        read on timing, and parsing it and handling its items as decode.
+        """
+        timing = timing if timing is not None else RequestTiming()
+        with response:
+            if response.status_code not in [200, 201, 202]:
+                response.content  # the body, read before it is decoded
+                timing.mark("read")
+                return cls.check_response(
+                    response, method, path, post_data, query, headers
+                )
+
+            for chunk in response.iter_content(cls.STREAM_CHUNK_SIZE):
+                timing.mark("read")
+                for key, value in stream.feed(chunk):
+                    on_item(key, value)
+                timing.mark("decode")
+            timing.mark("read")
+
+        resp_dict = stream.close()
+        if isinstance(resp_dict, dict) and "error" in resp_dict:
+            for error in resp_dict["error"]:
+                exception_class = ApiException.get_exception_class(error)
+                raise exception_class()
+        return resp_dict
+
     @classmethod
     def get_url(cls, path: str, query: dict | None = None):
         """Helper function for creating a URL from the query"""
@@ -176,11 +396,14 @@ class ApiClient:
             files,
             authenticated
         )
+
+        It runs in the request path of every client. For one client only, use
+        client.hooks.add_pre_request_hook(hook).
         """
-        cls._pre_request_hooks.append(hook)
+        cls._hooks.add_pre_request_hook(hook)
 
     @classmethod
-    def add_post_request_hook(cls, hook: PostRequestHook):
+    def add_post_request_hook(cls, hook: PostRequestHook, synchronous: bool = False):
         """Adds a handler for the post request hook.
 
         The hook will be called with the following code:
@@ -194,12 +417,53 @@ class ApiClient:
             files,
             authenticated
         )
+
+        Unless synchronous, it runs on a background thread after the response
+        is returned, and calls are dropped while too many are queued (see
+        HookDispatcher). For one client only, use
+        client.hooks.add_post_request_hook(hook).
         """
-        cls._post_request_hooks.append(hook)
+        cls._hooks.add_post_request_hook(hook, synchronous)
+
+    @classmethod
+    def add_timing_hook(cls, hook: TimingHook, synchronous: bool = False):
+        """Adds a handler called with the RequestTiming of every successful request.
+
+        Like post request hooks, it runs on a background thread unless synchronous.
+        """
+        cls._hooks.add_timing_hook(hook, synchronous)
+
+    def record_timing(self, timing: RequestTiming) -> None:
+        """Passes a finished request's timing to the timing hooks and METRICS."""
+        self._hooks.run_timing_hooks(timing)
+        self.hooks.run_timing_hooks(timing)
+        if self.METRICS is not None and timing.path is not None:
+            self.METRICS.record_phases(timing.path, timing.durations)
+
+    @classmethod
+    def to_json_value(cls, value):
+        """Converts nested models to what Kraken expects in a JSON body."""
+        if isinstance(value, ApiModelBase):
+            return cls.to_json_value(value.get_properties_in("body"))
+        elif isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                item = cls.to_json_value(item)
+                # Unset child models (e.g. an empty close order) are left out.
+                if item is not None and item != {}:
+                    result[key] = item
+            return result
+        elif isinstance(value, list):
+            return [cls.to_json_value(item) for item in value]
+        elif isinstance(value, bool):
+            return value
+        elif isinstance(value, Decimal):
+            return str(value)
+        return value
 
     @classmethod
     def get_kraken_signature(
-        cls, security_key: str, path: str, nonce: str | Decimal, data: dict
+        cls, security_key: str, path: str, nonce: str | Decimal, data: dict | str
     ):
         # Helper function to add padding if necessary
         def decode_base64(data):
@@ -208,7 +472,8 @@ class ApiClient:
                 data += "=" * (4 - missing_padding)
             return base64.b64decode(data)
 
-        postdata = urllib.parse.urlencode(data)
+        # JSON bodies are signed exactly as sent.
+        postdata = data if isinstance(data, str) else urllib.parse.urlencode(data)
         encoded = (str(nonce) + postdata).encode()
         message = path.encode() + hashlib.sha256(encoded).digest()
 
@@ -222,15 +487,39 @@ class ApiClient:
         sigdigest = base64.b64encode(mac.digest())
         return sigdigest.decode()
 
-    @classmethod
+    @ClassOrInstanceMethod
     def submit(
-        cls,
+        self,
         request: ApiModelBase,
         nonce: str,
         api_key: str,
         security_key: str,
         use_mock: bool,
+        timing: RequestTiming | None = None,
+        on_item: ItemCallback | None = None,
     ) -> dict:
+        """Sends the request and returns the checked response.
+
+        The phases of the request are marked on timing. When no timing is
+        given, the client records its own, and passes it to the timing hooks
+        once the response is checked.
+
+        With on_item, a request with a STREAM_PATH has its response parsed as
+        it arrives: on_item is called with the key and value of each item of
+        that container (e.g. txid and order), and the response returned
+        leaves the container empty.
+
+        Calling it on the class, as before clients had hooks of their own, is
+        deprecated: it still works, on a new default instance.
+
+        When COUNTERS is enabled and the response is a dict, it is returned as
+        a ResponseDict carrying the counter state after the call; otherwise
+        it is returned as it was decoded.
+        """
+        owns_timing = timing is None
+        if timing is None:
+            timing = RequestTiming()
+
         # verify all of the args
         if not isinstance(request, ApiModelBase):
             raise ValueError("request must be an instance of ApiModelBase | ApiModel")
@@ -265,63 +554,193 @@ class ApiClient:
                 "The request's path is None. This is not allowed. The request must have a path."
             )
 
-        url = cls.get_url(path, query)
+        url = self.get_url(path, query)
+        timing.path = path
 
         if "nonce" not in post_data:
             post_data["nonce"] = nonce
 
+        if request.JSON_BODY:
+            post_data = self.to_json_value(post_data)
+
         if headers is None:
             headers = {}
 
         header_keys = list(map(lambda k: k.lower(), headers.keys()))
+        timing.mark("validate")
+
+        for hooks in (self._hooks, self.hooks):
+            hooks.run_pre_request_hooks(
+                path, post_data, query, headers, files_list, request.AUTHENTICATE
+            )
+        timing.mark("pre_hooks")
 
-        for hook in cls._pre_request_hooks:
-            hook(path, post_data, query, headers, files_list, request.AUTHENTICATE)
+        body: dict | str = post_data
+        if request.JSON_BODY:
+            body = json.dumps(post_data)
+            headers["Content-Type"] = "application/json"
+        timing.mark("encode")
 
         if request.AUTHENTICATE and "API-Key" not in header_keys:
             if api_key is None:
                 raise Exception("API Key is required for this request.")
             headers["API-Key"] = api_key
-            headers["API-Sign"] = cls.get_kraken_signature(
-                security_key, path, nonce, post_data
-            )
-        response: Union["MockFactoryResponse", requests.models.Response, None] = None
-        if use_mock:
-            print("Using mock factory responses; no requests will be made.")
-            response = MockFactoryResponse(request)
-        else:
-            try:
-                response = None
-                match method:
-                    case "GET":
-                        response = requests.get(url, headers=headers)
-                    case "DELETE":
-                        response = requests.delete(url, headers=headers)
-                    case "PATCH":
-                        response = requests.patch(url, headers=headers, data=post_data)
-                    case "POST":
-                        response = requests.post(url, data=post_data, headers=headers)
-
-            except requests.RequestException as e:
-                response = e.response
-
-        if response is None:
-            raise Exception("Response is None. This should never happen.")
-
-        # run post request hooks
-        for post_req_hook in cls._post_request_hooks:
-            post_req_hook(
-                response,
-                path,
-                post_data,
-                query,
-                headers,
-                files_list,
-                request.AUTHENTICATE,
+            headers["API-Sign"] = self.get_kraken_signature(
+                security_key, path, nonce, body
             )
+        timing.mark("sign")
 
-        if isinstance(response, requests.models.Response):
-            response_dict: dict = cls.check_response(
-                response, method, path, post_data, query, headers
+        breaker = None if use_mock else self.get_circuit_breaker(path)
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenException(
+                self.get_endpoint_group(path), breaker.get_retry_after()
             )
+
+        counter = None
+        if request.AUTHENTICATE and self.get_endpoint_group(path) != "public":
+            counter = self.get_counter(api_key)
+        counter_state: dict | None = None
+        if counter is not None:
+            # Kraken counts calls that fail too, so the cost is added up front.
+            cost = self.get_cost(request)
+            counter.add(cost)
+            counter_state = dict(self.get_counter_state(api_key) or {}, cost=cost)
+        timing.mark("admit")
+
+        streaming = on_item is not None and request.STREAM_PATH is not None
+        stream: JsonItemStream | None = None
+        response: Union["MockFactoryResponse", requests.models.Response, None] = None
+        latency: float | None = None
+        error: Exception | None = None
+        started = time.monotonic()
+        try:
+            if use_mock:
+                print("Using mock factory responses; no requests will be made.")
+                response = MockFactoryResponse(request)
+            else:
+                http = self.SESSION if self.SESSION is not None else requests
+                try:
+                    response = None
+                    match method:
+                        case "GET":
+                            response = http.get(
+                                url,
+                                headers=headers,
+                                timeout=self.TIMEOUT,
+                                stream=streaming,
+                            )
+                        case "DELETE":
+                            response = http.delete(
+                                url,
+                                headers=headers,
+                                timeout=self.TIMEOUT,
+                                stream=streaming,
+                            )
+                        case "PATCH":
+                            response = http.patch(
+                                url,
+                                headers=headers,
+                                data=body,
+                                timeout=self.TIMEOUT,
+                                stream=streaming,
+                            )
+                        case "POST":
+                            response = http.post(
+                                url,
+                                data=body,
+                                headers=headers,
+                                timeout=self.TIMEOUT,
+                                stream=streaming,
+                            )
+
+                except requests.RequestException as e:
+                    # Without a response (timeouts, refused connections), the
+                    # transport error is the most useful thing to raise.
+                    if e.response is None:
+                        raise
+                    response = e.response
+            latency = time.monotonic() - started
+            timing.mark("read")
+            if response is not None and not use_mock:
+                # elapsed stops at the response headers; the rest is the body.
+                timing.split("read", "wait", response.elapsed.total_seconds())
+            else:
+                timing.split("read", "wait", timing.durations["read"])
+
+            if response is None:
+                raise Exception("Response is None. This should never happen.")
+            response.counter_state = counter_state  # type: ignore[union-attr]
+
+            # run post request hooks
+            if not streaming:
+                self.run_post_request_hooks(
+                    response, path, post_data, query, headers, files_list, request
+                )
+                timing.mark("post_hooks")
+
+            response_dict: dict | None = None
+            if isinstance(response, requests.models.Response):
+                if streaming:
+                    stream = JsonItemStream(request.STREAM_PATH)
+                    try:
+                        response_dict = self.check_stream(
+                            response,
+                            stream,
+                            on_item,
+                            method,
+                            path,
+                            post_data,
+                            query,
+                            headers,
+                            timing,
+                        )
+                    finally:
+                        # Only once the body is read, so no hook races the stream.
+                        self.run_post_request_hooks(
+                            response,
+                            path,
+                            post_data,
+                            query,
+                            headers,
+                            files_list,
+                            request,
+                        )
+                        timing.mark("post_hooks")
+                else:
+                    response_dict = self.check_response(
+                        response, method, path, post_data, query, headers
+                    )
+            if counter_state is not None and isinstance(response_dict, dict):
+                response_dict = ResponseDict(response_dict, counter_state)
+            timing.mark("decode")
+            if owns_timing:
+                self.record_timing(timing)
             return response_dict
+        except Exception as e:
+            error = e
+            if isinstance(e, RateLimitExceededException) and counter is not None:
+                # Kraken's counter is full, whatever the model says.
+                counter.add(counter.max_counter)
+            raise
+        finally:
+            if latency is None:
+                latency = time.monotonic() - started
+            # Every call the breaker let through must be recorded, or a
+            # half-open breaker would wait on its probe forever.
+            if breaker is not None:
+                if error is not None and self.is_outage(error):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success(latency)
+            if self.METRICS is not None:
+                size: int | None = None
+                if stream is not None:
+                    size = stream.size
+                elif response is not None:
+                    size = len(response.content)
+                self.METRICS.record(
+                    path,
+                    latency,
+                    size,
+                    error,
+                )
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Any, Union
+from typing import Any, Callable, Union
 from ..errors import (
     GetFactoryResponseNotImplemented,
     GetMethodNotImplemented,
@@ -10,6 +10,9 @@ from ..errors import (
 )
 from .api_client import ApiClient
 from .api_model_base import ApiModelBase, HasToDict
+from .model_map import ModelMap
+from .request_timing import RequestTiming
+from .response_dict import ResponseDict
 
 
 class ApiModel(ApiModelBase):
@@ -62,6 +65,9 @@ class ApiModel(ApiModelBase):
         self._original = values
 
         object.__setattr__(self, "_values", _values)
+        if self.LAZY:
+            # Fields are converted by _decode_field() when first read.
+            return
         for property, field in vars(self.__class__).items():
             if isinstance(field, ApiModelBase.Fields.ResponseField):
                 alias = field.alias if field.alias is not None else property
@@ -70,9 +76,33 @@ class ApiModel(ApiModelBase):
                 else:
                     _values[property] = field.check_value(field.get_default_value())
 
+    def _decode_field(
+        self, property: str, field: ApiModelBase.Fields.ResponseField
+    ) -> Any:
+        """Converts a field of a LAZY model from the source values and caches it."""
+        values = self._original
+        alias = field.alias if field.alias is not None else property
+        if alias in values:
+            value = field.check_value(values.get(alias))
+        else:
+            value = field.check_value(field.get_default_value())
+        self._values[property] = value
+        return value
+
+    def _decode_all(self) -> None:
+        """Converts every field of a LAZY model not read yet."""
+        for property, field in vars(self.__class__).items():
+            if (
+                isinstance(field, ApiModelBase.Fields.ResponseField)
+                and property not in self._values
+            ):
+                self._decode_field(property, field)
+
     def _to_dict(self) -> dict[str, Any]:
         """Converts the response model to a dict"""
         self.verify_structure()
+        if self.LAZY:
+            self._decode_all()
 
         # get the ResponseField instances
         fields = self.get_all_fields()
@@ -94,6 +124,10 @@ class ApiModel(ApiModelBase):
                 # For lists, we need to serialize any objects within
                 # the list. That's too long to leave here.
                 result[property] = self._list_to_dict(currVal)
+            elif isinstance(currVal, ModelMap):
+                result[property] = {
+                    key: model.__dict__ for key, model in currVal.items()
+                }
             elif currVal is None and field.required and field.default is not None:
                 result[property] = field.default
             elif currVal is not None and isinstance(currVal, Decimal):
@@ -141,11 +175,17 @@ class ApiModel(ApiModelBase):
 
         if isinstance(val, ApiModelBase.Fields.ResponseField):
             _values = super().__getattribute__("_values")
+            if name not in _values and super().__getattribute__("LAZY"):
+                return super().__getattribute__("_decode_field")(name, val)
             return _values.get(name, None)
         return val
 
     def __delattr__(self, name):
-        if name in self._values:
+        field = getattr(self.__class__, name, None)
+        if self.LAZY and isinstance(field, ApiModelBase.Fields.ResponseField):
+            # Leaving it out of _values would decode it again.
+            self._values[name] = None
+        elif name in self._values:
             del self._values[name]
 
     def get_method(self):
@@ -232,7 +272,7 @@ class ApiModel(ApiModelBase):
     @classmethod
     def get_response_class(cls, values: dict) -> Any:
         """For defining a response class to use for responding."""
-        return None
+        return cls.RESPONSE_CLASS
 
     def get_path(self) -> str | None:
         """For non-child request classes, returns the path part of the API request"""
@@ -252,16 +292,20 @@ class ApiModel(ApiModelBase):
         Returns a dict of properties that are in the specified location.
         """
         result: dict = dict()
+        if self.LAZY:
+            self._decode_all()
         for property, field in vars(self.__class__).items():
             if isinstance(field, ApiModelBase.Fields.ResponseField):
                 currVal = self._values.get(property, None)
+                # The alias is the name Kraken expects on the wire.
+                key = field.alias if field.alias is not None else property
                 if currVal is not None:
                     if location == "body" and (
                         field.location == location or field.location is None
                     ):
-                        result[property] = currVal
+                        result[key] = currVal
                     elif field.location == location:
-                        result[property] = currVal
+                        result[key] = currVal
         return result
 
     def submit(
@@ -270,18 +314,24 @@ class ApiModel(ApiModelBase):
         nonce: str | Decimal | int,
         api_key: str,
         security_key: str,
+        client: ApiClient | None = None,
+        on_item: Callable[[Any, Any], None] | None = None,
     ) -> Union[dict, "ApiModel", "ApiModelBase"]:
         if isinstance(nonce, Decimal) or isinstance(nonce, int):
             nonce = str(nonce)
 
         """Submits as a request and returns either an API model or  """
-        client: ApiClient = ApiClient()
+        timing = RequestTiming()
+        if client is None:
+            client = ApiClient()
         response: dict = client.submit(
             request=self,
             use_mock=use_mock,
             nonce=nonce,
             api_key=api_key,
             security_key=security_key,
+            timing=timing,
+            on_item=on_item,
         )
 
         if "result" in response and isinstance(response["result"], dict):
@@ -293,7 +343,15 @@ class ApiModel(ApiModelBase):
             values=response_dict
         )
 
+        result: Union[dict, "ApiModel"] = response_dict
         if response_class:
-            return response_class(values=response_dict)
+            result = response_class(values=response_dict)
+            object.__setattr__(
+                result, "counter_state", getattr(response, "counter_state", None)
+            )
+        elif isinstance(response, ResponseDict) and response_dict is not response:
+            result = ResponseDict(response_dict, response.counter_state)
 
-        return response_dict
+        timing.mark("construct")
+        client.record_timing(timing)
+        return result
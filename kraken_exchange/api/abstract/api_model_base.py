@@ -1,7 +1,8 @@
 from decimal import Decimal
 from datetime import datetime
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, List, Tuple, Union
 from ..errors import InvalidValue
+from .model_map import ModelMap
 
 
 class HasToDict:
@@ -12,6 +13,14 @@ class ApiModelBase(HasToDict):
     _is_request = True
     TYPE_HEADER = "HEADER"
     AUTHENTICATE = True
+    JSON_BODY = False
+    """Sends the body as JSON instead of form data, for nested bodies."""
+    LAZY = False
+    """Converts fields from the source values on first access, instead of in update()."""
+    RESPONSE_CLASS: type | None = None
+    """Model the result is built into, e.g. ClosedOrderList. None returns a dict."""
+    STREAM_PATH: Tuple[str, ...] | None = None
+    """Keys of the response container whose items can be streamed, e.g. ("result", "closed")"""
     _structure_verified: bool = False
     """Indicates whether this request is authenticated."""
 
@@ -99,11 +108,12 @@ class ApiModelBase(HasToDict):
                 super().__init__(
                     location=location, required=required, alias=alias, default=default
                 )
-                if min is not None:
-                    self.min = Decimal(str(min))
-
-                if max is not None:
-                    self.max = Decimal(str(max))
+                self.min: Decimal | None = (
+                    Decimal(str(min)) if min is not None else None
+                )
+                self.max: Decimal | None = (
+                    Decimal(str(max)) if max is not None else None
+                )
 
             def check_value(
                 self, value: int | Decimal | float | str | datetime | None
@@ -215,6 +225,27 @@ class ApiModelBase(HasToDict):
 
                 return self.related(values=value)
 
+        class MapField(ResponseField):
+            """A dict of models keyed by e.g. txid or pair, built on first access."""
+
+            def __init__(
+                self,
+                related: type,
+                location: str | None = None,
+                alias: str | None = None,
+                required: bool | None = None,
+            ) -> None:
+                super().__init__(location=location, required=required, alias=alias)
+                self.related = related
+
+            def get_default_value(self) -> Any:
+                return ModelMap({}, self.related)
+
+            def check_value(self, value: Any):
+                if value is None or isinstance(value, ModelMap):
+                    return value
+                return ModelMap(value, self.related)
+
     def get_original(self) -> dict:
         """Returns the original source object."""
         return {}
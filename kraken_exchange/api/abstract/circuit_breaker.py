@@ -0,0 +1,99 @@
+import threading
+import time
+from typing import Callable
+
+
+class CircuitBreaker:
+    """Stops calling an endpoint group that keeps failing.
+
+    While closed, calls go through. After failure_threshold consecutive
+    failures (transport errors, unavailability, or calls slower than
+    latency_threshold) the breaker opens and calls fail fast. After
+    reset_timeout seconds it is half-open: up to half_open_probes calls are let
+    through, and the first result decides whether it closes or opens again.
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        latency_threshold: float | None = None,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.latency_threshold = latency_threshold
+        """Seconds above which a successful call counts as a failure"""
+
+        self.half_open_probes = half_open_probes
+        self.trip_count = 0
+        """Number of times the breaker opened"""
+
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _update_state(self) -> None:
+        """Moves from open to half-open once reset_timeout passed. The lock must be held."""
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probes = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def get_retry_after(self) -> float:
+        """Seconds until the breaker lets a probe through"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may be made now. Every allowed call must be recorded."""
+        with self._lock:
+            self._update_state()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self, latency: float | None = None) -> None:
+        if (
+            self.latency_threshold is not None
+            and latency is not None
+            and latency > self.latency_threshold
+        ):
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._failures = 0
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self.trip_count += 1
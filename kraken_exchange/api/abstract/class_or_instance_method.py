@@ -0,0 +1,37 @@
+import functools
+import warnings
+from typing import Any, Callable
+
+
+class ClassOrInstanceMethod:
+    """A method that can still be called on the class, as it once could.
+
+    Called on the class, it runs on a new default instance of that class
+    and warns with a DeprecationWarning, so old class level callers keep
+    working until they move to an instance.
+    """
+
+    def __init__(self, method: Callable) -> None:
+        self.method = method
+        functools.update_wrapper(self, method)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Callable:
+        if instance is not None:
+            return self.method.__get__(instance, owner)
+
+        @functools.wraps(self.method)
+        def call_on_default_instance(*args, **kwargs):
+            warnings.warn(
+                "Calling {0}.{1} on the class is deprecated, "
+                "call it on an instance, e.g. {0}().{1}(...)".format(
+                    owner.__name__, self.name
+                ),
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return self.method(owner(), *args, **kwargs)
+
+        return call_on_default_instance
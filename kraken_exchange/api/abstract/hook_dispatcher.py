@@ -0,0 +1,75 @@
+import queue
+import threading
+from typing import Callable
+
+
+class HookDispatcher:
+    """Runs hooks on a background thread, off the request path.
+
+    Calls wait in a bounded queue. When the hooks fall behind and the queue is
+    full, new calls are dropped and counted rather than slowing requests
+    down. A failing hook is counted too, and its error kept in last_error.
+    """
+
+    def __init__(self, max_queue_size: int = 1000) -> None:
+        self.max_queue_size = max_queue_size
+        self.dispatched_count = 0
+        self.completed_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0
+        """Calls discarded because the queue was full"""
+
+        self.last_error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue(max_queue_size)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self.__class__.__name__, daemon=True
+                )
+                self._thread.start()
+
+    def dispatch(self, hook: Callable, *args) -> bool:
+        """Queues hook(*args), returning False when it was dropped."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((hook, args))
+        except queue.Full:
+            with self._lock:
+                self.dropped_count += 1
+            return False
+        with self._lock:
+            self.dispatched_count += 1
+        return True
+
+    def get_pending_count(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        """Waits until every queued call has run."""
+        self._queue.join()
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": self.get_pending_count(),
+            "dispatched": self.dispatched_count,
+            "completed": self.completed_count,
+            "failed": self.failed_count,
+            "dropped": self.dropped_count,
+        }
+
+    def _run(self) -> None:
+        while True:
+            hook, args = self._queue.get()
+            try:
+                hook(*args)
+                self.completed_count += 1
+            except Exception as e:
+                self.failed_count += 1
+                self.last_error = e
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,90 @@
+import requests
+from typing import TYPE_CHECKING, Any, List, Protocol, Tuple, Union
+from .hook_dispatcher import HookDispatcher
+from .request_timing import RequestTiming
+
+if TYPE_CHECKING:
+    from .api_client import MockFactoryResponse
+
+
+class PostRequestHook(Protocol):
+    def __call__(
+        self,
+        response: Union["MockFactoryResponse", requests.models.Response],
+        path: str,
+        post_data: dict,
+        query: dict,
+        headers: dict,
+        files: Union[list, None],
+        is_authenticated,
+    ) -> float:
+        pass
+
+
+class PreRequestHook(Protocol):
+    def __call__(
+        self,
+        path: str,
+        post_data: dict,
+        query: dict,
+        headers: dict,
+        files: Union[list, None],
+        is_authenticated,
+    ) -> float:
+        pass
+
+
+class TimingHook(Protocol):
+    def __call__(self, timing: RequestTiming) -> None:
+        pass
+
+
+class ItemCallback(Protocol):
+    def __call__(self, key: Any, value: Any) -> None:
+        pass
+
+
+class HookRegistry:
+    """The hooks run around the requests of an ApiClient.
+
+    Pre-request hooks may change the request, so they always run in the
+    request path. Post-request and timing hooks only observe, and unless added
+    as synchronous they are handed to the HookDispatcher, so a slow hook
+    doesn't delay the response.
+    """
+
+    def __init__(self, dispatcher: HookDispatcher | None = None) -> None:
+        self.pre_request_hooks: List[PreRequestHook] = []
+        self.post_request_hooks: List[Tuple[PostRequestHook, bool]] = []
+        """Hooks with whether they are synchronous"""
+
+        self.timing_hooks: List[Tuple[TimingHook, bool]] = []
+        self.dispatcher = dispatcher if dispatcher is not None else HookDispatcher()
+
+    def add_pre_request_hook(self, hook: PreRequestHook) -> None:
+        self.pre_request_hooks.append(hook)
+
+    def add_post_request_hook(
+        self, hook: PostRequestHook, synchronous: bool = False
+    ) -> None:
+        self.post_request_hooks.append((hook, synchronous))
+
+    def add_timing_hook(self, hook: TimingHook, synchronous: bool = False) -> None:
+        self.timing_hooks.append((hook, synchronous))
+
+    def run_pre_request_hooks(self, *args) -> None:
+        for hook in self.pre_request_hooks:
+            hook(*args)
+
+    def run_post_request_hooks(self, *args) -> None:
+        self._run(self.post_request_hooks, args)
+
+    def run_timing_hooks(self, timing: RequestTiming) -> None:
+        self._run(self.timing_hooks, (timing,))
+
+    def _run(self, hooks: List[tuple], args: tuple) -> None:
+        for hook, synchronous in hooks:
+            if synchronous:
+                hook(*args)
+            else:
+                self.dispatcher.dispatch(hook, *args)
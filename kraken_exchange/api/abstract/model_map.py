@@ -0,0 +1,36 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+
+class ModelMap(Mapping):
+    """Read-only mapping of keys to models, built on first access.
+
+    Wraps a decoded dict such as ClosedOrders' txid to order map: reading one
+    order builds one model, and the others stay plain dicts.
+    """
+
+    def __init__(self, values: dict, related: type) -> None:
+        self._raw = values
+        self._related = related
+        self._models: Dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        model = self._models.get(key)
+        if model is None:
+            value = self._raw[key]
+            if isinstance(value, self._related):
+                model = value
+            else:
+                model = self._related(values=value)
+            self._models[key] = model
+        return model
+
+    def __iter__(self) -> Iterator:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def get_raw(self) -> dict:
+        """The wrapped dict, without building any model"""
+        return self._raw
@@ -0,0 +1,27 @@
+import threading
+import time
+from typing import Callable
+
+
+class NonceGenerator:
+    """Generates strictly increasing nonces for a single API key.
+
+    Kraken rejects any nonce that isn't larger than the previous one used with the
+    same key, so a generator must be shared by everything submitting with that key.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.time_ns) -> None:
+        self._clock = clock
+        self._last: int = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        return self.next()
+
+    def next(self) -> str:
+        """Returns the next nonce as a string, ready to be passed to submit()"""
+        with self._lock:
+            # Microseconds keep the value well inside Kraken's 64 bit limit.
+            nonce = max(self._clock() // 1000, self._last + 1)
+            self._last = nonce
+        return str(nonce)
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Client side model of Kraken's API call counter.
+
+    Every call adds its cost to the counter and the counter decays by
+    decay_per_second. Kraken refuses calls once the counter passes its maximum,
+    so acquire() waits until the call fits instead.
+
+    The defaults are those of a starter tier account.
+    """
+
+    def __init__(
+        self,
+        max_counter: float = 15,
+        decay_per_second: float = 0.33,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_counter <= 0:
+            raise ValueError("max_counter must be greater than 0")
+
+        if decay_per_second <= 0:
+            raise ValueError("decay_per_second must be greater than 0")
+
+        self.max_counter = float(max_counter)
+        self.decay_per_second = float(decay_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._counter: float = 0.0
+        self._updated_at: float = clock()
+        self._lock = threading.Lock()
+
+    def _decay(self) -> None:
+        """Applies the decay since the last update. The lock must be held."""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if elapsed > 0:
+            self._counter = max(0.0, self._counter - elapsed * self.decay_per_second)
+
+    @property
+    def counter(self) -> float:
+        """The current value of the counter"""
+        with self._lock:
+            self._decay()
+            return self._counter
+
+    def add(self, cost: float) -> float:
+        """Adds cost without waiting, e.g. for a call already made, up to the maximum.
+
+        Returns the new value of the counter.
+        """
+        with self._lock:
+            self._decay()
+            self._counter = min(self.max_counter, self._counter + cost)
+            return self._counter
+
+    def try_acquire(self, cost: float = 1, reserve: float = 0) -> bool:
+        """Adds cost to the counter if it fits, without waiting.
+
+        reserve keeps that much of the maximum free, for more urgent calls.
+        """
+        with self._lock:
+            self._decay()
+            if self._counter + cost <= self.max_counter - reserve:
+                self._counter += cost
+                return True
+            return False
+
+    def get_wait(self, cost: float = 1, reserve: float = 0) -> float:
+        """Seconds until cost fits under the maximum, less reserve."""
+        with self._lock:
+            self._decay()
+            excess = self._counter + cost - (self.max_counter - reserve)
+            return max(0.0, excess / self.decay_per_second)
+
+    def acquire(self, cost: float = 1) -> float:
+        """Waits until cost fits under the maximum, then adds it to the counter.
+
+        Returns the number of seconds spent waiting.
+        """
+        if cost > self.max_counter:
+            raise ValueError(
+                "cost {0} can never fit under a max_counter of {1}".format(
+                    cost, self.max_counter
+                )
+            )
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._decay()
+                if self._counter + cost <= self.max_counter:
+                    self._counter += cost
+                    return waited
+                wait = (self._counter + cost - self.max_counter) / self.decay_per_second
+
+            self._sleep(wait)
+            waited += wait
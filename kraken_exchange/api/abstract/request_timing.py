@@ -0,0 +1,74 @@
+import time
+from typing import Callable, Dict, Tuple
+
+
+class RequestTiming:
+    """Where the time of one request went, phase by phase.
+
+    Each mark() closes the phase that ran since the previous mark, so the
+    durations add up to the whole request. A phase marked more than once,
+    such as read and decode while a response is streamed, accumulates. The
+    phases, in order:
+
+    - validate: checking arguments and reading the request's fields
+    - pre_hooks: pre request hooks
+    - encode: serializing the body
+    - sign: computing API-Sign
+    - admit: the circuit breaker and API counter checks
+    - wait: DNS, connect, TLS, sending and waiting for the response headers
+    - read: reading the response body
+    - post_hooks: running or dispatching the post request hooks
+    - decode: parsing the JSON and checking it for errors, with the on_item
+      callbacks of a streamed response
+    - construct: building the response model (ApiModel.submit only)
+
+    requests doesn't report DNS, connect and TLS apart, so they are all part of
+    wait; on a reused connection wait is the time to first byte.
+    """
+
+    PHASES: Tuple[str, ...] = (
+        "validate",
+        "pre_hooks",
+        "encode",
+        "sign",
+        "admit",
+        "wait",
+        "read",
+        "post_hooks",
+        "decode",
+        "construct",
+    )
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.path: str | None = None
+        self.durations: Dict[str, float] = {}
+        """Seconds spent in each phase"""
+
+        self._clock = clock
+        self.started = self._last = clock()
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started
+
+    def mark(self, phase: str) -> float:
+        """Ends phase now, returning how long it took this time."""
+        now = self._clock()
+        duration = now - self._last
+        self._last = now
+        self.durations[phase] = self.durations.get(phase, 0.0) + duration
+        return duration
+
+    def split(self, phase: str, into: str, seconds: float) -> None:
+        """Moves up to seconds of phase into another phase."""
+        seconds = min(max(0.0, seconds), self.durations.get(phase, 0.0))
+        self.durations[phase] -= seconds
+        self.durations[into] = self.durations.get(into, 0.0) + seconds
+
+    def get_breakdown(self) -> Dict[str, float]:
+        """Durations in phase order"""
+        return {
+            phase: self.durations[phase]
+            for phase in self.PHASES
+            if phase in self.durations
+        }
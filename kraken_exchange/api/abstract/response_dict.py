@@ -0,0 +1,12 @@
+class ResponseDict(dict):
+    """A response dict that also carries the API counter state after the call.
+
+    Clients only return it when their COUNTERS are enabled and the response
+    is a dict. It compares and serializes like the plain dict, so callers
+    that don't care about the counter see no difference.
+    """
+
+    def __init__(self, values: dict, counter_state: dict | None = None) -> None:
+        super().__init__(values)
+        self.counter_state = counter_state
+        """counter, max_counter, headroom and the cost of the call"""
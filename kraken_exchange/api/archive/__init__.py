@@ -0,0 +1,4 @@
+from .archive_day_file import ArchiveDayFile
+from .mmap_archive import MmapArchive
+from .trade_archive import TradeArchive
+from .spread_archive import SpreadArchive
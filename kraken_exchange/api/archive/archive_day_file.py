@@ -0,0 +1,104 @@
+import os
+import numpy as np
+
+
+class ArchiveDayFile:
+    """One day of fixed-width records for one pair, read through a memory map.
+
+    The file starts with a 16 byte header holding a magic value and the number
+    of committed records. Appends write the records past the committed ones,
+    fsync, and only then rewrite the count, so a crash mid-append leaves the
+    previous count and any partially written records are ignored and later
+    overwritten.
+
+    Records must be appended in time order. A sparse index holding every
+    INDEX_STRIDE-th timestamp narrows time lookups down to one block, so a
+    lookup only touches a few pages of the file.
+    """
+
+    MAGIC = b"KRKARC01"
+    HEADER_SIZE = 16
+    INDEX_STRIDE = 1024
+
+    def __init__(self, path: str, dtype: np.dtype) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self._records: np.ndarray | None = None
+        self._index: np.ndarray = np.empty(0, dtype=np.int64)
+
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                file.write(self._header(0))
+                file.flush()
+                os.fsync(file.fileno())
+
+        self._count = self._read_count()
+
+    def _header(self, count: int) -> bytes:
+        return self.MAGIC + np.uint64(count).tobytes()
+
+    def _read_count(self) -> int:
+        with open(self.path, "rb") as file:
+            header = file.read(self.HEADER_SIZE)
+        if len(header) != self.HEADER_SIZE or header[:8] != self.MAGIC:
+            raise ValueError("{0} is not an archive file".format(self.path))
+        return int(np.frombuffer(header[8:], dtype=np.uint64)[0])
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def records(self) -> np.ndarray:
+        """Read-only memory mapped view of the committed records."""
+        if self._records is None or len(self._records) != self._count:
+            if self._count == 0:
+                self._records = np.empty(0, dtype=self.dtype)
+            else:
+                self._records = np.memmap(
+                    self.path,
+                    dtype=self.dtype,
+                    mode="r",
+                    offset=self.HEADER_SIZE,
+                    shape=(self._count,),
+                )
+            self._index = np.array(self._records["time"][:: self.INDEX_STRIDE])
+        return self._records
+
+    @property
+    def last_time(self) -> int | None:
+        if self._count == 0:
+            return None
+        return int(self.records["time"][-1])
+
+    def append(self, records: np.ndarray) -> None:
+        """Durably appends time ordered records."""
+        if len(records) == 0:
+            return
+
+        with open(self.path, "r+b") as file:
+            file.seek(self.HEADER_SIZE + self._count * self.dtype.itemsize)
+            file.write(records.astype(self.dtype, copy=False).tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+
+            file.seek(0)
+            file.write(self._header(self._count + len(records)))
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._count += len(records)
+
+    def find(self, time: int, side: str = "left") -> int:
+        """Like np.searchsorted on the time column, using the sparse index."""
+        times = self.records["time"]
+        block = int(np.searchsorted(self._index, time, side=side))
+        low = max(block - 1, 0) * self.INDEX_STRIDE
+        high = min(block * self.INDEX_STRIDE + 1, len(times))
+        return low + int(np.searchsorted(times[low:high], time, side=side))
+
+    def query(self, start: int | None = None, end: int | None = None) -> np.ndarray:
+        """Zero-copy view of the records with start <= time < end."""
+        records = self.records
+        low = self.find(start, "left") if start is not None else 0
+        high = self.find(end, "left") if end is not None else len(records)
+        return records[low:high]
@@ -0,0 +1,138 @@
+import datetime
+import os
+import threading
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from ..errors import NotImplemented
+from .archive_day_file import ArchiveDayFile
+
+
+class MmapArchive:
+    """Append-only archive keeping one memory mapped file per pair per UTC day.
+
+    Subclasses define the record layout, which must have an int64 "time" field
+    in microseconds since the epoch, and how rows from Kraken are decoded.
+
+    An archive can be passed as the store of TradeSync or SpreadSync, as it
+    implements append(pair, rows).
+    """
+
+    DTYPE: np.dtype = np.dtype([("time", np.int64)])
+    SUFFIX: str = ".bin"
+    DAY_US: int = 86_400 * 1_000_000
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.late_count = 0
+        """Number of records dropped for being older than the last archived one"""
+
+        self._files: Dict[Tuple[str, int], ArchiveDayFile] = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def decode_rows(self, rows: Sequence[Sequence]) -> np.ndarray:
+        """Converts rows from Kraken into records of DTYPE."""
+        raise NotImplemented(
+            "{0}.decode_rows() was not implemented".format(self.__class__.__name__)
+        )
+
+    def get_file_path(self, pair: str, day: int) -> str:
+        date = datetime.datetime.fromtimestamp(
+            day * 86_400, tz=datetime.timezone.utc
+        ).strftime("%Y-%m-%d")
+        return os.path.join(self.directory, pair, date + self.SUFFIX)
+
+    def get_day_file(
+        self, pair: str, day: int, create: bool = False
+    ) -> ArchiveDayFile | None:
+        """The file for the pair on the day, counted in days since the epoch."""
+        key = (pair, day)
+        if key not in self._files:
+            path = self.get_file_path(pair, day)
+            if not create and not os.path.exists(path):
+                return None
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._files[key] = ArchiveDayFile(path, self.DTYPE)
+        return self._files[key]
+
+    def get_days(self, pair: str) -> List[int]:
+        """Days, since the epoch, that have a file for the pair."""
+        try:
+            names = os.listdir(os.path.join(self.directory, pair))
+        except FileNotFoundError:
+            return []
+
+        days = []
+        for name in names:
+            if name.endswith(self.SUFFIX):
+                date = datetime.datetime.strptime(
+                    name[: -len(self.SUFFIX)], "%Y-%m-%d"
+                ).replace(tzinfo=datetime.timezone.utc)
+                days.append(int(date.timestamp()) // 86_400)
+        return sorted(days)
+
+    def append(self, pair: str, rows: Sequence[Sequence]) -> int:
+        """Decodes and archives rows, returning the number of records written."""
+        if len(rows) == 0:
+            return 0
+        return self.append_records(pair, self.decode_rows(rows))
+
+    def append_records(self, pair: str, records: np.ndarray) -> int:
+        """Archives records, splitting them by day."""
+        if len(records) == 0:
+            return 0
+
+        records = records[np.argsort(records["time"], kind="stable")]
+        days = records["time"] // self.DAY_US
+        boundaries = np.flatnonzero(days[1:] != days[:-1]) + 1
+
+        written = 0
+        with self._lock:
+            for part in np.split(records, boundaries):
+                day = int(part["time"][0] // self.DAY_US)
+                day_file = self.get_day_file(pair, day, create=True)
+                if day_file is None:
+                    continue
+                last_time = day_file.last_time
+                if last_time is not None:
+                    late = part["time"] < last_time
+                    if late.any():
+                        self.late_count += int(late.sum())
+                        part = part[~late]
+                day_file.append(part)
+                written += len(part)
+        return written
+
+    def query(
+        self, pair: str, start: int | None = None, end: int | None = None
+    ) -> List[np.ndarray]:
+        """Zero-copy views of the records with start <= time < end, one per day."""
+        days = self.get_days(pair)
+        if start is not None:
+            days = [day for day in days if day >= start // self.DAY_US]
+        if end is not None:
+            days = [day for day in days if day * self.DAY_US < end]
+
+        result = []
+        for day in days:
+            day_file = self.get_day_file(pair, day)
+            if day_file is None:
+                continue
+            records = day_file.query(start, end)
+            if len(records) > 0:
+                result.append(records)
+        return result
+
+    def query_records(
+        self, pair: str, start: int | None = None, end: int | None = None
+    ) -> np.ndarray:
+        """The records with start <= time < end as a single array.
+
+        Ranges within one day are returned as a view, longer ones are copied.
+        """
+        parts = self.query(pair, start, end)
+        if len(parts) == 0:
+            return np.empty(0, dtype=self.DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
@@ -0,0 +1,19 @@
+from typing import Sequence
+import numpy as np
+from .mmap_archive import MmapArchive
+
+
+class SpreadArchive(MmapArchive):
+    """Archive of SpreadListRequest rows ([time, bid, ask])."""
+
+    DTYPE = np.dtype([("time", np.int64), ("bid", np.float64), ("ask", np.float64)])
+    SUFFIX = ".spreads"
+
+    def decode_rows(self, rows: Sequence[Sequence]) -> np.ndarray:
+        columns = list(zip(*rows))
+        records = np.empty(len(rows), dtype=self.DTYPE)
+        time = np.array(columns[0], dtype=np.float64)
+        records["time"] = np.rint(time * 1_000_000).astype(np.int64)
+        records["bid"] = np.array(columns[1], dtype=np.float64)
+        records["ask"] = np.array(columns[2], dtype=np.float64)
+        return records
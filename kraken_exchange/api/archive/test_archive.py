@@ -0,0 +1,59 @@
+import numpy as np
+from ..pagination.checkpoint_store import CheckpointStore
+from ..sync.trade_sync import TradeSync
+from .archive_day_file import ArchiveDayFile
+from .spread_archive import SpreadArchive
+from .trade_archive import TradeArchive
+
+DAY = 86_400
+
+
+def test_trade_archive_is_fed_by_trade_sync(tmp_path):
+    archive = TradeArchive(str(tmp_path / "archive"))
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    sync = TradeSync(checkpoints, archive, use_mock=True)
+    sync.poll("XBTUSD")
+    sync.poll("XBTUSD")
+
+    trades = archive.query_columns("XBTUSD")
+    assert list(trades.id) == [61044952, 61044953, 61044956]
+    assert isinstance(archive.query("XBTUSD")[0], np.memmap)
+
+    reopened = TradeArchive(archive.directory)
+    later = reopened.query_records("XBTUSD", start=1688669598_000000)
+    assert list(later["id"]) == [61044953, 61044956]
+
+
+def test_spread_archive_range_query_across_days(tmp_path):
+    archive = SpreadArchive(str(tmp_path))
+    rows = [[DAY - 10 + i * 5, "1", "2"] for i in range(5)]
+    assert archive.append("XBTUSD", rows) == 5
+    assert archive.append("XBTUSD", [[0, "1", "2"]]) == 0
+    assert archive.late_count == 1
+
+    parts = archive.query("XBTUSD", (DAY - 5) * 1_000_000, (DAY + 10) * 1_000_000)
+    assert [len(part) for part in parts] == [1, 2]
+    assert archive.get_days("XBTUSD") == [0, 1]
+
+
+def test_archive_day_file_ignores_uncommitted_records(tmp_path):
+    path = str(tmp_path / "day.bin")
+    dtype = SpreadArchive.DTYPE
+    ArchiveDayFile.INDEX_STRIDE = 4
+    try:
+        day_file = ArchiveDayFile(path, dtype)
+        records = np.zeros(10, dtype=dtype)
+        records["time"] = np.arange(10) * 2
+        day_file.append(records)
+
+        # Simulate a crash after writing records but before committing the count.
+        with open(path, "ab") as file:
+            file.write(b"\xff" * dtype.itemsize * 3)
+
+        reopened = ArchiveDayFile(path, dtype)
+        assert len(reopened) == 10
+        assert reopened.find(7) == 4
+        assert reopened.find(8, "right") == 5
+        assert list(reopened.query(5, 13)["time"]) == [6, 8, 10, 12]
+    finally:
+        ArchiveDayFile.INDEX_STRIDE = 1024
@@ -0,0 +1,28 @@
+from typing import Sequence
+import numpy as np
+from ..columnar.trade_columns import TradeColumns
+from .mmap_archive import MmapArchive
+
+
+class TradeArchive(MmapArchive):
+    """Archive of Trades rows, stored as TradeColumns.to_structured() records."""
+
+    DTYPE = TradeColumns.empty().to_structured().dtype
+    SUFFIX = ".trades"
+
+    def decode_rows(self, rows: Sequence[Sequence]) -> np.ndarray:
+        return TradeColumns.from_rows(rows).to_structured()
+
+    def query_columns(
+        self, pair: str, start: int | None = None, end: int | None = None
+    ) -> TradeColumns:
+        """The trades with start <= time < end, as columns viewing the records."""
+        records = self.query_records(pair, start, end)
+        return TradeColumns(
+            price=records["price"],
+            volume=records["volume"],
+            time=records["time"],
+            side=records["side"],
+            type=records["type"],
+            id=records["id"],
+        )
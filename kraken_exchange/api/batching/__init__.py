@@ -0,0 +1,3 @@
+from .coalescer import Coalescer
+from .order_batcher import OrderBatcher
+from .cancel_batcher import CancelBatcher
@@ -0,0 +1,83 @@
+from concurrent.futures import Future
+from typing import Hashable, List, Tuple
+from ..abstract.nonce_generator import NonceGenerator
+from ..requests.order_cancel_all_request import OrderCancelAllRequest
+from ..requests.order_cancel_batch_request import OrderCancelBatchRequest
+from ..requests.order_cancel_request import OrderCancelRequest
+from .coalescer import Coalescer
+
+
+class CancelBatcher(Coalescer):
+    """Coalesces bursts of OrderCancelRequests into CancelOrderBatch calls.
+
+    Cancels submitted within window seconds of each other are sent together,
+    up to 50 txids or userrefs per call. When cancel_all_threshold is set and
+    that many cancels are waiting, a single CancelAll is sent instead. Note that
+    it also cancels orders nobody asked to cancel.
+
+    Kraken only returns the number of orders cancelled by a batch, so every
+    caller of a batch gets that same count. A lone cancel is sent with
+    CancelOrder and gets its own result.
+    """
+
+    BATCH: str = "batch"
+    CANCEL_ALL: str = "all"
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        window: float = 0.05,
+        max_batch_size: int = OrderCancelBatchRequest.MAX_ITEMS,
+        cancel_all_threshold: int | None = None,
+    ) -> None:
+        if not 2 <= max_batch_size <= OrderCancelBatchRequest.MAX_ITEMS:
+            raise ValueError(
+                "max_batch_size must be between 2 and {0}".format(
+                    OrderCancelBatchRequest.MAX_ITEMS
+                )
+            )
+        super().__init__(
+            api_key, security_key, use_mock, nonce_generator, window, max_batch_size
+        )
+        self.cancel_all_threshold = cancel_all_threshold
+        """Number of waiting cancels at which CancelAll is sent, or None to never"""
+
+    def submit(self, request: OrderCancelRequest) -> Future:
+        return self.enqueue(self.BATCH, request)
+
+    def pop_due(self) -> List[Tuple[Hashable, list]]:
+        if (
+            self.cancel_all_threshold is None
+            or self.get_pending_count() < self.cancel_all_threshold
+        ):
+            return super().pop_due()
+
+        entries = []
+        for _, group_entries in self._groups.values():
+            entries.extend(
+                entry
+                for entry in group_entries
+                if entry[-1].set_running_or_notify_cancel()
+            )
+        self._groups.clear()
+        return [(self.CANCEL_ALL, entries)]
+
+    def send(self, key: Hashable, entries: list) -> None:
+        self.order_count += len(entries)
+        if key == self.CANCEL_ALL:
+            result = self.submit_request(OrderCancelAllRequest())
+        elif len(entries) == 1:
+            request, future = entries[0]
+            future.set_result(self.submit_request(request))
+            return
+        else:
+            transaction_ids = [request.transaction_id for request, _ in entries]
+            result = self.submit_request(
+                OrderCancelBatchRequest(list(dict.fromkeys(transaction_ids)))
+            )
+
+        for _, future in entries:
+            future.set_result(dict(result))
@@ -0,0 +1,148 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, List, Tuple
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.request import Request
+from ..errors import NotImplemented
+
+
+class Coalescer:
+    """Base for merging requests submitted close together into fewer calls.
+
+    Entries are queued under a key, and all the entries of a key are sent
+    together once window seconds have passed since the first one, or as soon as
+    there are max_batch_size of them. Entries queued under the key None are sent
+    alone, without waiting.
+
+    Calls are made one at a time from a single thread, so nonces always reach
+    Kraken in order. Subclasses implement send(), which resolves the Future
+    that is the last item of every entry.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        window: float = 0.05,
+        max_batch_size: int = 15,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.window = window
+        """Seconds an entry waits for others to join its batch"""
+
+        self.max_batch_size = max_batch_size
+
+        self.order_count = 0
+        """Orders sent, batched or not"""
+
+        self.call_count = 0
+        """API calls made to send them"""
+
+        self._groups: Dict[Hashable, list] = {}
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "Coalescer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> "Coalescer":
+        with self._condition:
+            self._stopping = False
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=self.__class__.__name__, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Sends the entries still waiting, then stops the thread."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def enqueue(self, key: Hashable, *entry: Any) -> Future:
+        """Queues an entry and returns the Future passed to send() with it."""
+        future: Future = Future()
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("{0} is stopped".format(self.__class__.__name__))
+            group = self._groups.setdefault(key, [time.monotonic() + self.window, []])
+            group[1].append(entry + (future,))
+            if key is None or len(group[1]) >= self.max_batch_size:
+                group[0] = 0.0
+            self._condition.notify()
+        return future
+
+    def get_pending_count(self) -> int:
+        return sum(len(entries) for _, entries in self._groups.values())
+
+    def pop_due(self) -> List[Tuple[Hashable, list]]:
+        """Removes the groups that are due, split into batches. Called under the lock."""
+        now = time.monotonic()
+        due: List[Tuple[Hashable, list]] = []
+        for key, (deadline, entries) in list(self._groups.items()):
+            if deadline > now and not self._stopping:
+                continue
+            del self._groups[key]
+            entries = [
+                entry for entry in entries if entry[-1].set_running_or_notify_cancel()
+            ]
+            if key is None:
+                due.extend((None, [entry]) for entry in entries)
+                continue
+            for start in range(0, len(entries), self.max_batch_size):
+                due.append((key, entries[start : start + self.max_batch_size]))
+        return due
+
+    def send(self, key: Hashable, entries: list) -> None:
+        raise NotImplemented(
+            "{0}.send() was not implemented".format(self.__class__.__name__)
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                due = self.pop_due()
+                while len(due) == 0:
+                    if self._stopping and len(self._groups) == 0:
+                        return
+                    timeout = (
+                        min(group[0] for group in self._groups.values())
+                        - time.monotonic()
+                        if len(self._groups) > 0
+                        else None
+                    )
+                    self._condition.wait(timeout)
+                    due = self.pop_due()
+
+            for key, entries in due:
+                try:
+                    self.send(key, entries)
+                except Exception as e:
+                    for entry in entries:
+                        if not entry[-1].done():
+                            entry[-1].set_exception(e)
+
+    def submit_request(self, request: Request) -> dict:
+        self.call_count += 1
+        return request.submit(
+            use_mock=self.use_mock,
+            nonce=self.nonce_generator.next(),
+            api_key=self.api_key,
+            security_key=self.security_key,
+        )
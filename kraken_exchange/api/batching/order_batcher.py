@@ -0,0 +1,126 @@
+import random
+import time
+from typing import Dict, Hashable, List
+from ..abstract.nonce_generator import NonceGenerator
+from ..errors import ApiException, BatchOutcomeUnknownException
+from ..requests.order_add_batch_item_request import OrderAddBatchItemRequest
+from ..requests.order_add_batch_request import OrderAddBatchRequest
+from ..requests.order_add_request import OrderAddRequest
+from ..resilience.idempotent_order_submitter import IdempotentOrderSubmitter
+from .coalescer import Coalescer
+
+
+class OrderBatcher(Coalescer):
+    """Coalesces individual OrderAddRequests into AddOrderBatch calls.
+
+    Orders for the same pair (and deadline and validate flag) submitted within
+    window seconds of each other are sent together, up to max_batch_size at a
+    time. Each caller gets a Future resolving to an AddOrder shaped result, or
+    raising the ApiException of its own item, so one rejected order doesn't
+    fail the rest of the batch.
+
+    Orders left alone at the end of the window, and orders with fields that
+    AddOrderBatch doesn't accept, are sent with AddOrder.
+
+    Every order is given a userref when it has none. Results are matched to
+    orders by position. When Kraken returns fewer or more results than
+    orders, only those carrying the userref of exactly one order are matched,
+    and the other orders fail with BatchOutcomeUnknownException: they may
+    have been placed, so they must be looked up rather than sent again. The
+    exception carries the userref and when the batch was sent, so
+    IdempotentOrderSubmitter.reconcile(error.userref, error.sent_at) tells
+    whether an order was placed, and
+    IdempotentOrderSubmitter.submit(request, since=error.sent_at) places it
+    only if it wasn't.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        window: float = 0.05,
+        max_batch_size: int = OrderAddBatchRequest.MAX_ITEMS,
+    ) -> None:
+        if not 2 <= max_batch_size <= OrderAddBatchRequest.MAX_ITEMS:
+            raise ValueError(
+                "max_batch_size must be between 2 and {0}".format(
+                    OrderAddBatchRequest.MAX_ITEMS
+                )
+            )
+        super().__init__(
+            api_key, security_key, use_mock, nonce_generator, window, max_batch_size
+        )
+        self._random = random.SystemRandom()
+
+    def submit(self, request: OrderAddRequest):
+        if request.reference_id is None:
+            request.reference_id = str(
+                self._random.randint(*IdempotentOrderSubmitter.USERREF_RANGE)
+            )
+        body = request.get_properties_in("body")
+        try:
+            item = OrderAddBatchItemRequest.from_order_add_request(request)
+        except ValueError:
+            return self.enqueue(None, request, None)
+        key = (body.get("pair"), body.get("deadline"), body.get("validate"))
+        return self.enqueue(key, request, item)
+
+    @classmethod
+    def match_by_userref(cls, entries: list, orders: List[dict]) -> List[tuple]:
+        """Pairs of entry and result with the same userref, when it is unique to both."""
+        entries_by_userref: Dict[str, list] = {}
+        for entry in entries:
+            userref = entry[0].get_properties_in("body").get("userref")
+            if userref is not None:
+                entries_by_userref.setdefault(str(userref), []).append(entry)
+
+        orders_by_userref: Dict[str, list] = {}
+        for order in orders:
+            if order.get("userref") is not None:
+                orders_by_userref.setdefault(str(order["userref"]), []).append(order)
+
+        return [
+            (entries_by_userref[userref][0], found[0])
+            for userref, found in orders_by_userref.items()
+            if len(found) == 1 and len(entries_by_userref.get(userref, [])) == 1
+        ]
+
+    def send(self, key: Hashable, entries: list) -> None:
+        self.order_count += len(entries)
+        if key is None or len(entries) == 1:
+            request, _, future = entries[0]
+            future.set_result(self.submit_request(request))
+            return
+
+        pair, deadline, validate = key
+        batch = OrderAddBatchRequest([item for _, item, _ in entries])
+        batch.pair = pair
+        if deadline is not None:
+            batch.deadline = deadline
+        if validate is not None:
+            batch.validate = validate
+
+        sent_at = time.time()
+        orders = self.submit_request(batch).get("orders") or []
+        if len(orders) == len(entries):
+            matches = list(zip(entries, orders))
+        else:
+            matches = self.match_by_userref(entries, orders)
+            matched = [id(entry) for entry, _ in matches]
+            for entry in entries:
+                if id(entry) not in matched:
+                    entry[2].set_exception(
+                        BatchOutcomeUnknownException(entry[0].reference_id, sent_at)
+                    )
+
+        for (_, _, future), order in matches:
+            if order.get("error"):
+                future.set_exception(
+                    ApiException.get_exception_class(str(order["error"]))()
+                )
+            else:
+                future.set_result(
+                    {"descr": order.get("descr"), "txid": [order["txid"]]}
+                )
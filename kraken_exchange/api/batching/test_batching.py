@@ -0,0 +1,139 @@
+import pytest
+from ..abstract.api_client import ApiClient
+from ..errors import ApiException, BatchOutcomeUnknownException
+from ..resilience import RetryPolicy
+from ..requests import (
+    OrderAddBatchItemRequest,
+    OrderAddBatchRequest,
+    OrderAddRequest,
+    OrderCancelBatchRequest,
+    OrderCancelRequest,
+)
+from .cancel_batcher import CancelBatcher
+from .order_batcher import OrderBatcher
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def get_order(pair: str = "XBTUSD", price: str = "27500.0") -> OrderAddRequest:
+    request = OrderAddRequest()
+    request.pair = pair
+    request.type = "buy"
+    request.ordertype = "limit"
+    request.volume = "1.25"
+    request.price = price
+    return request
+
+
+def test_batch_body_is_json():
+    batch = OrderAddBatchRequest(
+        [OrderAddBatchItemRequest.from_order_add_request(get_order())] * 2
+    )
+    batch.pair = "XBTUSD"
+    body = ApiClient.to_json_value(batch.get_properties_in("body"))
+    item = {"type": "buy", "ordertype": "limit", "volume": "1.25", "price": "27500.0"}
+    assert body == {"orders": [item, item], "pair": "XBTUSD"}
+
+    result = batch.submit(
+        use_mock=True, nonce="1", api_key=API_KEY, security_key=SECURITY_KEY
+    )
+    assert len(result["orders"]) == 2
+
+
+def test_order_batcher_coalesces_by_pair():
+    with OrderBatcher(API_KEY, SECURITY_KEY, use_mock=True, window=0.2) as batcher:
+        futures = [batcher.submit(get_order()) for _ in range(31)]
+        futures.append(batcher.submit(get_order("ETHUSD")))
+        results = [future.result(5) for future in futures]
+
+    assert all(len(result["txid"]) == 1 for result in results)
+    assert len({result["txid"][0] for result in results[:30]}) == 30
+    # 15 + 15 batched, then one lone XBTUSD and one ETHUSD order.
+    assert batcher.order_count == 32
+    assert batcher.call_count == 4
+
+
+def test_order_batcher_maps_item_errors():
+    class RejectingBatcher(OrderBatcher):
+        def submit_request(self, request):
+            self.call_count += 1
+            return {
+                "orders": [
+                    {"txid": "OUF4EM-FRGI2-MQMWZD", "descr": {"order": "buy"}},
+                    {"error": "EGeneral:Invalid arguments"},
+                ]
+            }
+
+    with RejectingBatcher(API_KEY, SECURITY_KEY, window=0.2) as batcher:
+        accepted = batcher.submit(get_order())
+        rejected = batcher.submit(get_order(price="1"))
+
+    assert accepted.result(5)["txid"] == ["OUF4EM-FRGI2-MQMWZD"]
+    with pytest.raises(ApiException):
+        rejected.result(5)
+    assert batcher.call_count == 1
+
+
+def test_order_batcher_fails_unmatched_orders_as_unknown():
+    class ShortBatcher(OrderBatcher):
+        def submit_request(self, request):
+            self.call_count += 1
+            return {"orders": [{"txid": "OUF4EM-FRGI2-MQMWZD", "userref": 2}]}
+
+    orders = [get_order() for _ in range(3)]
+    orders[1].reference_id = "2"
+
+    with ShortBatcher(API_KEY, SECURITY_KEY, window=0.2) as batcher:
+        futures = [batcher.submit(order) for order in orders]
+
+    assert futures[1].result(5)["txid"] == ["OUF4EM-FRGI2-MQMWZD"]
+    for order, future in ((orders[0], futures[0]), (orders[2], futures[2])):
+        error = future.exception(5)
+        assert isinstance(error, BatchOutcomeUnknownException)
+        # The orders may have been placed, so they are not resubmitted blindly,
+        # but they were given userrefs to look them up by.
+        assert RetryPolicy.is_ambiguous(error) and not RetryPolicy.is_safe(error)
+        assert error.userref is not None and error.userref == order.reference_id
+        assert error.sent_at is not None
+
+
+def get_cancel(transaction_id: str) -> OrderCancelRequest:
+    request = OrderCancelRequest()
+    request.transaction_id = transaction_id
+    return request
+
+
+def test_cancel_batcher_merges_bursts():
+    sent = []
+
+    class RecordingBatcher(CancelBatcher):
+        def submit_request(self, request):
+            sent.append(request)
+            return super().submit_request(request)
+
+    with RecordingBatcher(API_KEY, SECURITY_KEY, use_mock=True, window=0.2) as batcher:
+        futures = [batcher.submit(get_cancel("O{0}".format(i))) for i in range(60)]
+        results = [future.result(5) for future in futures]
+
+    assert [type(request) for request in sent] == [
+        OrderCancelBatchRequest,
+        OrderCancelBatchRequest,
+    ]
+    assert len(sent[0].transaction_ids) == 50
+    assert ApiClient.to_json_value(sent[1].get_properties_in("body")) == {
+        "orders": ["O{0}".format(i) for i in range(50, 60)]
+    }
+    assert results[0] == {"count": 50} and results[-1] == {"count": 10}
+
+
+def test_cancel_batcher_falls_back_to_cancel_all():
+    batcher = CancelBatcher(
+        API_KEY, SECURITY_KEY, use_mock=True, window=1, cancel_all_threshold=20
+    )
+    futures = [batcher.submit(get_cancel("O{0}".format(i))) for i in range(30)]
+    with batcher:
+        results = [future.result(5) for future in futures]
+
+    assert batcher.call_count == 1
+    assert all(result == {"count": 4} for result in results)
@@ -0,0 +1,2 @@
+from .order_book_side import OrderBookSide
+from .order_book import OrderBook
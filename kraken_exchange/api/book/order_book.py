@@ -0,0 +1,166 @@
+import zlib
+from typing import Sequence, Tuple
+import numpy as np
+from .order_book_side import OrderBookSide
+
+
+class OrderBook:
+    """L2 order book of one pair, held as fixed-point integer arrays.
+
+    Prices and volumes are stored as integers scaled by the pair's decimals,
+    which keeps them exact and makes the Kraken checksum a matter of joining
+    the integers as strings.
+    """
+
+    CHECKSUM_LEVELS: int = 10
+
+    def __init__(
+        self,
+        pair: str,
+        price_decimals: int,
+        volume_decimals: int,
+        depth: int | None = None,
+    ) -> None:
+        self.pair = pair
+        self.price_decimals = price_decimals
+        self.volume_decimals = volume_decimals
+        self.depth = depth
+        """Levels kept per side. Kraken's checksum assumes the subscribed depth."""
+
+        self.asks = OrderBookSide(is_bid=False)
+        self.bids = OrderBookSide(is_bid=True)
+
+    @classmethod
+    def to_fixed(cls, value: str | int | float, decimals: int) -> int:
+        """Converts a decimal string to an integer scaled by 10 ** decimals."""
+        text = value if isinstance(value, str) else format(value, f".{decimals}f")
+        whole, _, fraction = text.partition(".")
+        fraction = (fraction + "0" * decimals)[:decimals]
+        sign = -1 if whole.startswith("-") else 1
+        return sign * int(whole.lstrip("-+") + fraction or "0")
+
+    @classmethod
+    def get_decimals(cls, value: str) -> int:
+        return len(value.partition(".")[2])
+
+    @classmethod
+    def from_depth_response(
+        cls,
+        response: dict,
+        price_decimals: int | None = None,
+        volume_decimals: int | None = None,
+        depth: int | None = None,
+    ) -> "OrderBook":
+        """Builds a book from an OrderBookShowRequest response (the "result" dict).
+
+        When the decimals aren't given, they are taken from the first level.
+        """
+        pair, levels = next(iter(response.items()))
+        first = (levels.get("asks") or levels.get("bids") or [["0", "0"]])[0]
+        book = cls(
+            pair,
+            price_decimals
+            if price_decimals is not None
+            else cls.get_decimals(str(first[0])),
+            volume_decimals
+            if volume_decimals is not None
+            else cls.get_decimals(str(first[1])),
+            depth,
+        )
+        book.apply_snapshot(levels.get("asks") or [], levels.get("bids") or [])
+        return book
+
+    def apply_snapshot(
+        self, asks: Sequence[Sequence], bids: Sequence[Sequence]
+    ) -> None:
+        """Replaces the book with [price, volume, ...] levels."""
+        self.asks.clear()
+        self.bids.clear()
+        self.apply_updates(asks, bids)
+
+    def apply_updates(
+        self, asks: Sequence[Sequence] = (), bids: Sequence[Sequence] = ()
+    ) -> None:
+        """Applies [price, volume, ...] levels. A volume of 0 removes the level."""
+        for side, levels in ((self.asks, asks), (self.bids, bids)):
+            for level in levels:
+                side.update(
+                    self.to_fixed(level[0], self.price_decimals),
+                    self.to_fixed(level[1], self.volume_decimals),
+                )
+            if self.depth is not None:
+                side.truncate(self.depth)
+
+    def checksum(self) -> int:
+        """CRC32 of the top 10 levels, as computed by Kraken's book feed."""
+        parts = []
+        for side in (self.asks, self.bids):
+            prices, volumes = side.top(self.CHECKSUM_LEVELS)
+            for price, volume in zip(prices.tolist(), volumes.tolist()):
+                parts.append(str(price))
+                parts.append(str(volume))
+        return zlib.crc32("".join(parts).encode()) & 0xFFFFFFFF
+
+    def get_levels(
+        self, is_bid: bool, count: int | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Float prices and volumes of the best count levels, best first."""
+        prices, volumes = (self.bids if is_bid else self.asks).top(count)
+        return (
+            prices / 10**self.price_decimals,
+            volumes / 10**self.volume_decimals,
+        )
+
+    def get_mid(self) -> float | None:
+        best_ask = self.asks.best()
+        best_bid = self.bids.best()
+        if best_ask is None or best_bid is None:
+            return None
+        return (best_ask[0] + best_bid[0]) / 2 / 10**self.price_decimals
+
+    def get_depth_weighted_mid(self, levels: int = 10) -> float | None:
+        """Mid of the volume weighted bid and ask prices over the top levels."""
+        ask_prices, ask_volumes = self.get_levels(False, levels)
+        bid_prices, bid_volumes = self.get_levels(True, levels)
+        ask_total = ask_volumes.sum()
+        bid_total = bid_volumes.sum()
+        if ask_total == 0 or bid_total == 0:
+            return None
+        return float(
+            (
+                ask_prices @ ask_volumes / ask_total
+                + bid_prices @ bid_volumes / bid_total
+            )
+            / 2
+        )
+
+    def get_imbalance(self, levels: int = 10) -> float | None:
+        """(bid volume - ask volume) / total volume over the top levels, in [-1, 1]"""
+        ask_total = self.get_levels(False, levels)[1].sum()
+        bid_total = self.get_levels(True, levels)[1].sum()
+        if ask_total + bid_total == 0:
+            return None
+        return float((bid_total - ask_total) / (bid_total + ask_total))
+
+    def get_cost_to_fill(self, volume: float, is_buy: bool) -> Tuple[float, float]:
+        """Quote cost of taking volume from the book, and the volume available.
+
+        Buying takes the asks and selling takes the bids. When the book is too
+        thin the available volume is less than the requested one, and the cost is
+        that of taking the whole side.
+        """
+        prices, volumes = self.get_levels(not is_buy)
+        cumulative = np.cumsum(volumes)
+        if len(cumulative) == 0:
+            return 0.0, 0.0
+
+        # Levels before index are taken whole, the level at index partially.
+        index = int(np.searchsorted(cumulative, volume))
+        if index >= len(cumulative):
+            return float(prices @ volumes), float(cumulative[-1])
+
+        taken_before = cumulative[index - 1] if index > 0 else 0.0
+        cost = prices[:index] @ volumes[:index] + prices[index] * (
+            volume - taken_before
+        )
+        return float(cost), float(volume)
@@ -0,0 +1,83 @@
+from typing import Tuple
+import numpy as np
+
+
+class OrderBookSide:
+    """Price levels of one side of an L2 book, in sorted int64 arrays.
+
+    Prices and volumes are fixed-point integers. Levels are kept from worst to
+    best price, so the best levels sit at the end of the arrays where inserts
+    and deletes shift the fewest elements. Levels are found by binary search.
+    """
+
+    __slots__ = ("is_bid", "_keys", "_volumes", "_size")
+
+    def __init__(self, is_bid: bool, capacity: int = 64) -> None:
+        self.is_bid = is_bid
+        # Keys sort worst to best: the price for bids, the negated price for asks.
+        self._keys = np.empty(max(capacity, 1), dtype=np.int64)
+        self._volumes = np.empty(max(capacity, 1), dtype=np.int64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _key(self, price: int) -> int:
+        return price if self.is_bid else -price
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def update(self, price: int, volume: int) -> None:
+        """Sets the volume at a price level, removing the level when volume is 0."""
+        keys = self._keys[: self._size]
+        key = self._key(price)
+        index = int(np.searchsorted(keys, key))
+        exists = index < self._size and keys[index] == key
+
+        if exists and volume == 0:
+            self._keys[index : self._size - 1] = self._keys[index + 1 : self._size]
+            self._volumes[index : self._size - 1] = self._volumes[
+                index + 1 : self._size
+            ]
+            self._size -= 1
+        elif exists:
+            self._volumes[index] = volume
+        elif volume != 0:
+            if self._size == len(self._keys):
+                self._keys = np.concatenate((self._keys, np.empty_like(self._keys)))
+                self._volumes = np.concatenate(
+                    (self._volumes, np.empty_like(self._volumes))
+                )
+            self._keys[index + 1 : self._size + 1] = self._keys[index : self._size]
+            self._volumes[index + 1 : self._size + 1] = self._volumes[
+                index : self._size
+            ]
+            self._keys[index] = key
+            self._volumes[index] = volume
+            self._size += 1
+
+    def truncate(self, depth: int) -> None:
+        """Drops all but the best depth levels."""
+        if self._size > depth:
+            drop = self._size - depth
+            self._keys[:depth] = self._keys[drop : self._size]
+            self._volumes[:depth] = self._volumes[drop : self._size]
+            self._size = depth
+
+    def top(self, count: int | None = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Prices and volumes of the best count levels, best first.
+
+        The volumes are a view, the prices are computed from the keys.
+        """
+        start = 0 if count is None else max(self._size - count, 0)
+        keys = self._keys[start : self._size][::-1]
+        volumes = self._volumes[start : self._size][::-1]
+        return (keys if self.is_bid else -keys), volumes
+
+    def best(self) -> Tuple[int, int] | None:
+        """Price and volume of the best level"""
+        if self._size == 0:
+            return None
+        key = int(self._keys[self._size - 1])
+        return (key if self.is_bid else -key), int(self._volumes[self._size - 1])
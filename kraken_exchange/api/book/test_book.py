@@ -0,0 +1,47 @@
+import zlib
+import pytest
+from ..requests import OrderBookShowRequest
+from .order_book import OrderBook
+
+
+def get_book(depth: int | None = None) -> OrderBook:
+    response = OrderBookShowRequest().get_factory_response()["result"]
+    return OrderBook.from_depth_response(response, depth=depth)
+
+
+def test_order_book_keeps_levels_sorted():
+    book = get_book()
+    book.apply_updates(
+        asks=[["30380.00000", "1.000"], ["30387.90000", "0.000"]],
+        bids=[["30296.70000", "3.000"], ["30300.00000", "0.500"]],
+    )
+
+    prices, volumes = book.get_levels(is_bid=False)
+    assert list(prices) == [30380.0, 30384.1, 30393.7]
+    prices, volumes = book.get_levels(is_bid=True, count=2)
+    assert list(prices) == [30300.0, 30297.0]
+    assert book.bids.best() == (3030000000, 500)
+    assert book.get_mid() == pytest.approx(30340.0)
+
+
+def test_order_book_truncates_to_depth_and_checksums():
+    book = get_book(depth=2)
+    assert len(book.asks) == 2
+
+    expected = "3038410000" + "2059" + "3038790000" + "1500"
+    expected += "3029700000" + "1115" + "3029670000" + "2002"
+    assert book.checksum() == zlib.crc32(expected.encode())
+
+
+def test_order_book_analytics():
+    book = get_book()
+
+    cost, filled = book.get_cost_to_fill(3, is_buy=True)
+    assert filled == 3
+    assert cost == pytest.approx(30384.1 * 2.059 + 30387.9 * 0.941)
+
+    cost, filled = book.get_cost_to_fill(100, is_buy=False)
+    assert filled == pytest.approx(8.118)
+
+    assert book.get_imbalance() == pytest.approx((8.118 - 13.43) / (8.118 + 13.43))
+    assert book.get_depth_weighted_mid(1) == pytest.approx((30384.1 + 30297.0) / 2)
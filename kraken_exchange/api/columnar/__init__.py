@@ -0,0 +1,6 @@
+from .trade_columns import TradeColumns
+from .ohlcv_bars import OhlcvBars
+from .ohlcv_aggregator import OhlcvAggregator
+from .ohlcv_pyramid import OhlcvPyramid
+from .spread_series import SpreadSeries
+from .spread_monitor import SpreadMonitor
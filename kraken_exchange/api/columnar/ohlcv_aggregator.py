@@ -0,0 +1,99 @@
+import numpy as np
+from .ohlcv_bars import OhlcvBars
+from .trade_columns import TradeColumns
+
+
+class OhlcvAggregator:
+    """Maintains OHLCV bars of a fixed interval as trades arrive.
+
+    Each update only aggregates the new data and merges it into the last stored
+    bar, so its cost depends on the size of the update, not of the history.
+    Data older than the last stored bar can't be merged and is counted in
+    late_count instead.
+    """
+
+    def __init__(self, interval: int, capacity: int = 1024) -> None:
+        """interval is the bar length in seconds."""
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self.interval = interval
+        self.late_count = 0
+        """Number of trades dropped because their bar had already been passed"""
+
+        self._size = 0
+        self._columns = OhlcvBars.empty()
+        self._grow(max(capacity, 1))
+
+    @property
+    def interval_us(self) -> int:
+        return self.interval * 1_000_000
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocates the columns with room for capacity bars."""
+        columns = []
+        for field in OhlcvBars.FIELDS:
+            old = getattr(self._columns, field)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            columns.append(new)
+        self._columns = OhlcvBars(*columns)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def bars(self) -> OhlcvBars:
+        """View of the stored bars. It is invalidated by the next update."""
+        return self._columns[: self._size]
+
+    def update_trades(self, trades: TradeColumns) -> OhlcvBars:
+        return self.update(OhlcvBars.from_trades(trades))
+
+    def update(self, bars: OhlcvBars) -> OhlcvBars:
+        """Merges finer grained bars, or single-trade bars, into the stored bars.
+
+        Returns the update resampled to this interval, which can be passed on to a
+        coarser aggregator.
+        """
+        delta = bars.sorted().resample(self.interval_us)
+        if len(delta) == 0:
+            return delta
+
+        columns = self._columns
+        size = self._size
+
+        if size > 0:
+            last_start = columns.start[size - 1]
+            late = delta.start < last_start
+            if late.any():
+                self.late_count += int(delta.count[late].sum())
+                delta = delta[~late]
+                if len(delta) == 0:
+                    return delta
+
+            if delta.start[0] == last_start:
+                last = size - 1
+                columns.high[last] = max(columns.high[last], delta.high[0])
+                columns.low[last] = min(columns.low[last], delta.low[0])
+                columns.close[last] = delta.close[0]
+                columns.volume[last] += delta.volume[0]
+                columns.notional[last] += delta.notional[0]
+                columns.count[last] += delta.count[0]
+                appended = delta[1:]
+            else:
+                appended = delta
+        else:
+            appended = delta
+
+        if size + len(appended) > len(columns.start):
+            self._grow(max(2 * len(columns.start), size + len(appended)))
+            columns = self._columns
+
+        for field in OhlcvBars.FIELDS:
+            getattr(columns, field)[size : size + len(appended)] = getattr(
+                appended, field
+            )
+        self._size = size + len(appended)
+
+        return delta
@@ -0,0 +1,117 @@
+import numpy as np
+from .trade_columns import TradeColumns
+
+
+class OhlcvBars:
+    """OHLCV bars held as one NumPy array per field.
+
+    The traded notional (sum of price * volume) is kept instead of the VWAP, as
+    notionals can simply be added when bars are merged. Bar starts are int64
+    microseconds since the epoch, matching TradeColumns.time.
+    """
+
+    __slots__ = (
+        "start",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "notional",
+        "count",
+    )
+
+    FIELDS = __slots__
+
+    def __init__(
+        self,
+        start: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        notional: np.ndarray,
+        count: np.ndarray,
+    ) -> None:
+        self.start = start
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.notional = notional
+        self.count = count
+
+    @classmethod
+    def empty(cls) -> "OhlcvBars":
+        return cls(
+            start=np.empty(0, dtype=np.int64),
+            open=np.empty(0, dtype=np.float64),
+            high=np.empty(0, dtype=np.float64),
+            low=np.empty(0, dtype=np.float64),
+            close=np.empty(0, dtype=np.float64),
+            volume=np.empty(0, dtype=np.float64),
+            notional=np.empty(0, dtype=np.float64),
+            count=np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_trades(cls, trades: TradeColumns) -> "OhlcvBars":
+        """Turns every trade into a single-trade bar starting at the trade time."""
+        price = trades.get_float_prices().astype(np.float64, copy=False)
+        return cls(
+            start=trades.time,
+            open=price,
+            high=price,
+            low=price,
+            close=price,
+            volume=trades.volume,
+            notional=price * trades.volume,
+            count=np.ones(len(trades), dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, index) -> "OhlcvBars":
+        """Slices or masks every field at once. Slices return views."""
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 if index != -1 else None)
+        return OhlcvBars(*(getattr(self, field)[index] for field in self.FIELDS))
+
+    @property
+    def vwap(self) -> np.ndarray:
+        """Volume weighted average price, NaN for bars without volume"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.notional / self.volume
+
+    def sorted(self) -> "OhlcvBars":
+        """Returns the bars ordered by start, or these bars if they already are."""
+        if len(self) < 2 or bool(np.all(self.start[1:] >= self.start[:-1])):
+            return self
+        return self[np.argsort(self.start, kind="stable")]
+
+    def resample(self, interval: int) -> "OhlcvBars":
+        """Aggregates the bars into bars of interval microseconds.
+
+        Bars must be ordered by start, see sorted().
+        """
+        if len(self) == 0:
+            return self
+
+        buckets = self.start - self.start % interval
+        boundaries = np.flatnonzero(buckets[1:] != buckets[:-1]) + 1
+        firsts = np.concatenate(([0], boundaries))
+        lasts = np.concatenate((boundaries, [len(self)])) - 1
+
+        return OhlcvBars(
+            start=buckets[firsts],
+            open=self.open[firsts],
+            high=np.maximum.reduceat(self.high, firsts),
+            low=np.minimum.reduceat(self.low, firsts),
+            close=self.close[lasts],
+            volume=np.add.reduceat(self.volume, firsts),
+            notional=np.add.reduceat(self.notional, firsts),
+            count=np.add.reduceat(self.count, firsts),
+        )
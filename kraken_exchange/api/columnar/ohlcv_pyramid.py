@@ -0,0 +1,44 @@
+from typing import Dict, Sequence
+from .ohlcv_aggregator import OhlcvAggregator
+from .ohlcv_bars import OhlcvBars
+from .trade_columns import TradeColumns
+
+
+class OhlcvPyramid:
+    """Keeps OHLCV bars at several intervals in sync, e.g. 1m, 5m, 1h and 1d.
+
+    New trades are aggregated into the finest interval only. The resulting
+    update is then rolled up level by level, so each coarser level only
+    aggregates the few bars that changed below it.
+    """
+
+    DEFAULT_INTERVALS = (60, 300, 3600, 86400)
+
+    def __init__(self, intervals: Sequence[int] = DEFAULT_INTERVALS) -> None:
+        """intervals are in seconds, and each must be a multiple of the previous."""
+        if len(intervals) == 0:
+            raise ValueError("At least one interval is required")
+
+        for finer, coarser in zip(intervals, intervals[1:]):
+            if coarser <= finer or coarser % finer != 0:
+                raise ValueError(
+                    "Interval {0} is not a multiple of interval {1}".format(
+                        coarser, finer
+                    )
+                )
+
+        self.levels: Dict[int, OhlcvAggregator] = {
+            interval: OhlcvAggregator(interval) for interval in intervals
+        }
+
+    def __getitem__(self, interval: int) -> OhlcvBars:
+        """The stored bars for the interval, in seconds."""
+        return self.levels[interval].bars
+
+    def update_trades(self, trades: TradeColumns) -> None:
+        self.update(OhlcvBars.from_trades(trades))
+
+    def update(self, bars: OhlcvBars) -> None:
+        delta = bars
+        for aggregator in self.levels.values():
+            delta = aggregator.update(delta)
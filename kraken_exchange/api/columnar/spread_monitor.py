@@ -0,0 +1,66 @@
+from typing import Dict
+import numpy as np
+from .spread_series import SpreadSeries
+
+
+class SpreadMonitor:
+    """Keeps a SpreadSeries per pair and reports the latest metrics for all of them.
+
+    Summaries only look at the trailing window of each series, so their cost
+    doesn't grow with the length of the history.
+    """
+
+    def __init__(self, window: float = 300, threshold: float = 2.0) -> None:
+        self.window = window
+        """Rolling window in seconds"""
+
+        self.threshold = threshold
+        """Spread, as a multiple of the rolling mean, that counts as widening"""
+
+        self.series: Dict[str, SpreadSeries] = {}
+
+    def __getitem__(self, pair: str) -> SpreadSeries:
+        if pair not in self.series:
+            self.series[pair] = SpreadSeries()
+        return self.series[pair]
+
+    def update(self, pair: str, response: dict) -> int:
+        """Appends a SpreadListRequest result, returning the number of new points."""
+        return self[pair].append_response(response)
+
+    def get_summary(self, pair: str) -> dict:
+        """Latest spread metrics over the monitor's window."""
+        series = self[pair]
+        if len(series) == 0:
+            return {}
+
+        start = series.get_window_start(self.window)
+        recent = series.spread[start:]
+        # The quote before the window is still in force when the window opens.
+        in_force = series[max(start - 1, 0) :]
+
+        p50, p90, p99 = np.percentile(recent, [50, 90, 99])
+        spread = recent[-1]
+        mean = recent.mean()
+        return {
+            "time": int(series.time[-1]),
+            "spread": float(spread),
+            "mean": float(mean),
+            "time_weighted": float(in_force.time_weighted_spread(self.window)[-1]),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p99": float(p99),
+            "widening": bool(spread > self.threshold * mean),
+        }
+
+    def get_widening_pairs(self) -> Dict[str, float]:
+        """Pairs whose latest spread is widening, with spread / rolling mean."""
+        result = {}
+        for pair, series in self.series.items():
+            if len(series) == 0:
+                continue
+            recent = series.spread[series.get_window_start(self.window) :]
+            mean = recent.mean()
+            if mean > 0 and recent[-1] > self.threshold * mean:
+                result[pair] = float(recent[-1] / mean)
+        return result
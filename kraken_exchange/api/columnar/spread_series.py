@@ -0,0 +1,199 @@
+from typing import Sequence
+import numpy as np
+
+
+class SpreadSeries:
+    """Append-only bid/ask history of one pair, with rolling spread metrics.
+
+    Rows from SpreadListRequest ([time, bid, ask]) are appended to
+    capacity-doubling arrays. Every rolling metric is computed with cumulative
+    sums and searchsorted, so the cost doesn't depend on the window size.
+
+    Windows are in seconds and end at, and include, each point. Times are int64
+    microseconds since the epoch, matching TradeColumns.time.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        capacity = max(capacity, 1)
+        self._time = np.empty(capacity, dtype=np.int64)
+        self._bid = np.empty(capacity, dtype=np.float64)
+        self._ask = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self.late_count = 0
+        """Number of rows dropped for being older than the last appended row"""
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: slice) -> "SpreadSeries":
+        """A series viewing a slice of this one. Appending to it copies the data."""
+        if not isinstance(index, slice):
+            raise TypeError("SpreadSeries can only be sliced")
+
+        view = SpreadSeries.__new__(SpreadSeries)
+        view._time = self.time[index]
+        view._bid = self.bid[index]
+        view._ask = self.ask[index]
+        view._size = len(view._time)
+        view.late_count = 0
+        return view
+
+    def get_window_start(self, window: float) -> int:
+        """Index of the first point in the window ending at the last point."""
+        if self._size == 0:
+            return 0
+        return int(
+            np.searchsorted(
+                self.time, self.time[-1] - int(window * 1_000_000), side="right"
+            )
+        )
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._time[: self._size]
+
+    @property
+    def bid(self) -> np.ndarray:
+        return self._bid[: self._size]
+
+    @property
+    def ask(self) -> np.ndarray:
+        return self._ask[: self._size]
+
+    @property
+    def spread(self) -> np.ndarray:
+        return self.ask - self.bid
+
+    @property
+    def relative_spread(self) -> np.ndarray:
+        """Spread in basis points of the mid price"""
+        return (self.ask - self.bid) / ((self.ask + self.bid) / 2) * 10_000
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("_time", "_bid", "_ask"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def append(self, time: np.ndarray, bid: np.ndarray, ask: np.ndarray) -> int:
+        """Appends time ordered points, returning the number appended."""
+        if len(time) == 0:
+            return 0
+
+        if self._size > 0:
+            keep = time >= self._time[self._size - 1]
+            if not keep.all():
+                self.late_count += int((~keep).sum())
+                time, bid, ask = time[keep], bid[keep], ask[keep]
+
+        order = np.argsort(time, kind="stable")
+        time, bid, ask = time[order], bid[order], ask[order]
+
+        end = self._size + len(time)
+        if end > len(self._time):
+            self._grow(max(2 * len(self._time), end))
+
+        self._time[self._size : end] = time
+        self._bid[self._size : end] = bid
+        self._ask[self._size : end] = ask
+        self._size = end
+        return len(time)
+
+    def append_rows(self, rows: Sequence[Sequence]) -> int:
+        if len(rows) == 0:
+            return 0
+
+        columns = list(zip(*rows))
+        time = np.array(columns[0], dtype=np.float64)
+        return self.append(
+            np.rint(time * 1_000_000).astype(np.int64),
+            np.array(columns[1], dtype=np.float64),
+            np.array(columns[2], dtype=np.float64),
+        )
+
+    def append_response(self, response: dict) -> int:
+        """Appends the rows of a SpreadListRequest response (the "result" dict)."""
+        for key, value in response.items():
+            if key != "last" and isinstance(value, list):
+                return self.append_rows(value)
+        return 0
+
+    def _values(self, relative: bool) -> np.ndarray:
+        return self.relative_spread if relative else self.spread
+
+    def _window_starts(self, window: float) -> np.ndarray:
+        """Index of the first point inside each point's window."""
+        return np.searchsorted(
+            self.time, self.time - int(window * 1_000_000), side="right"
+        )
+
+    def rolling_mean(self, window: float, relative: bool = False) -> np.ndarray:
+        """Mean of the spreads quoted in the window ending at each point."""
+        values = self._values(relative)
+        sums = np.concatenate(([0.0], np.cumsum(values)))
+        starts = self._window_starts(window)
+        ends = np.arange(1, len(values) + 1)
+        return (sums[ends] - sums[starts]) / (ends - starts)
+
+    def time_weighted_spread(self, window: float, relative: bool = False) -> np.ndarray:
+        """Spread averaged over the time each quote was in force.
+
+        Each quote holds until the next one. The window is clipped to the first
+        point, and points whose window has no duration report their own spread.
+        """
+        values = self._values(relative)
+        if len(values) == 0:
+            return values
+
+        time = self.time.astype(np.float64)
+        # integral[k] is the area under the spread from time[0] to time[k]
+        integral = np.concatenate(([0.0], np.cumsum(values[:-1] * np.diff(time))))
+
+        window_start = np.maximum(time - window * 1_000_000, time[0])
+        k = np.searchsorted(time, window_start, side="right") - 1
+        start_integral = integral[k] + values[k] * (window_start - time[k])
+
+        duration = time - window_start
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (integral - start_integral) / duration
+        return np.where(duration > 0, result, values)
+
+    def percentiles(
+        self,
+        q: Sequence[float],
+        window: float | None = None,
+        relative: bool = False,
+    ) -> np.ndarray:
+        """Percentiles of the spread over the trailing window, or the whole series."""
+        values = self._values(relative)
+        if window is not None:
+            values = values[self.get_window_start(window) :]
+        return np.percentile(values, q)
+
+    def rolling_percentile(
+        self, q: float, points: int, relative: bool = False, chunk: int = 65536
+    ) -> np.ndarray:
+        """Percentile over the last `points` quotes at each point.
+
+        Windows are taken as strided views and reduced a chunk at a time, so
+        memory stays bounded by chunk * points. The first points - 1 entries are NaN.
+        """
+        values = self._values(relative)
+        result = np.full(len(values), np.nan)
+        if len(values) < points:
+            return result
+
+        windows = np.lib.stride_tricks.sliding_window_view(values, points)
+        for start in range(0, len(windows), chunk):
+            result[points - 1 + start : points - 1 + start + chunk] = np.percentile(
+                windows[start : start + chunk], q, axis=1
+            )
+        return result
+
+    def widening_alerts(
+        self, window: float, threshold: float = 2.0, relative: bool = False
+    ) -> np.ndarray:
+        """Indexes of the points whose spread is threshold times the rolling mean."""
+        values = self._values(relative)
+        return np.flatnonzero(values > threshold * self.rolling_mean(window, relative))
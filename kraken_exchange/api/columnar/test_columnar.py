@@ -0,0 +1,109 @@
+import pytest
+import numpy as np
+from ..requests import TradeListRequest
+from .ohlcv_bars import OhlcvBars
+from .ohlcv_pyramid import OhlcvPyramid
+from .spread_monitor import SpreadMonitor
+from .spread_series import SpreadSeries
+from .trade_columns import TradeColumns
+
+
+def get_result() -> dict:
+    return TradeListRequest().get_factory_response()["result"]
+
+
+def test_trade_columns_decode_rows():
+    trades = TradeColumns.from_response(get_result())
+
+    assert len(trades) == 3
+    assert trades.price.dtype == np.float64
+    assert trades.time.dtype == np.int64
+    assert trades.side.dtype == np.int8
+    assert trades.time[0] == 1688669597827737
+    assert list(trades.side) == [1, -1, -1]
+    assert list(trades.type) == [0, 1, 0]
+    assert list(trades.id) == [61044952, 61044953, 61044956]
+
+
+def test_trade_columns_fixed_point_prices():
+    trades = TradeColumns.from_response(get_result(), price_scale=5)
+
+    assert trades.price.dtype == np.int64
+    assert trades.price[0] == 3024340000
+    assert trades.get_float_prices()[0] == 30243.4
+
+    joined = TradeColumns.concatenate([trades, trades[1:]])
+    assert list(joined.to_structured()["id"][-2:]) == [61044953, 61044956]
+
+
+def test_numpy_integers_index_one_row():
+    trades = TradeColumns.from_response(get_result())
+    bars = OhlcvBars.from_trades(trades)
+
+    for index in (np.int64(1), np.intp(-1)):
+        assert list(trades[index].id) == [trades.id[index]]
+        assert len(bars[index]) == 1
+    assert list(trades[np.argmax(trades.price)].price) == [trades.price.max()]
+
+
+def get_random_trades(count: int) -> TradeColumns:
+    random = np.random.default_rng(7)
+    return TradeColumns(
+        price=random.uniform(100, 200, count),
+        volume=random.uniform(0, 2, count),
+        time=np.sort(random.integers(0, 2 * 86400 * 1_000_000, count)),
+        side=random.choice(np.array([-1, 1], dtype=np.int8), count),
+        type=random.choice(np.array([0, 1], dtype=np.int8), count),
+        id=np.arange(count, dtype=np.int64),
+    )
+
+
+def test_ohlcv_pyramid_matches_full_recompute():
+    trades = get_random_trades(5000)
+    pyramid = OhlcvPyramid()
+    for start in range(0, len(trades), 333):
+        pyramid.update_trades(trades[start : start + 333])
+
+    for interval in OhlcvPyramid.DEFAULT_INTERVALS:
+        expected = OhlcvBars.from_trades(trades).resample(interval * 1_000_000)
+        bars = pyramid[interval]
+        for field in OhlcvBars.FIELDS:
+            assert np.allclose(getattr(bars, field), getattr(expected, field))
+
+    assert pyramid[86400].count.sum() == 5000
+    hourly = pyramid[3600]
+    assert np.all((hourly.vwap >= hourly.low) & (hourly.vwap <= hourly.high))
+
+
+def test_ohlcv_aggregator_counts_late_trades():
+    pyramid = OhlcvPyramid((60,))
+    trades = get_random_trades(100)
+    pyramid.update_trades(trades[50:])
+    pyramid.update_trades(trades[:50])
+
+    assert pyramid.levels[60].late_count > 0
+    assert pyramid[60].count.sum() + pyramid.levels[60].late_count == 100
+
+
+def test_spread_series_rolling_metrics():
+    series = SpreadSeries(capacity=2)
+    series.append_rows([[0, "100", "101"], [10, "100", "103"]])
+    series.append_rows([[20, "100", "101"], [30, "100", "109"], [5, "1", "2"]])
+
+    assert len(series) == 4
+    assert series.late_count == 1
+    assert list(series.rolling_mean(15)) == [1, 2, 2, 5]
+    # Over the last 20 seconds the spread was 3 for 10s, then 1 for 10s.
+    assert series.time_weighted_spread(20)[-1] == 2
+    assert list(series.widening_alerts(15, threshold=1.5)) == [3]
+
+    monitor = SpreadMonitor(window=15, threshold=1.5)
+    monitor["XBTUSD"].append_rows([[0, "100", "101"], [10, "100", "103"]])
+    monitor.update("XBTUSD", {"XXBTZUSD": [[20, "100", "101"], [30, "100", "109"]]})
+
+    summary = monitor.get_summary("XBTUSD")
+    assert summary["mean"] == 5
+    # 5 seconds at a spread of 3, then 10 seconds at 1.
+    assert summary["time_weighted"] == pytest.approx(25 / 15)
+    assert summary["widening"] is True
+    assert list(monitor.get_widening_pairs().keys()) == ["XBTUSD"]
@@ -0,0 +1,171 @@
+from typing import List, Sequence
+import numpy as np
+
+
+class TradeColumns:
+    """Trades decoded into one NumPy array per column.
+
+    Holds Trades rows ([price, volume, time, side, type, misc, id]) without any
+    per-row Python objects. Prices are float64, or int64 fixed-point when a
+    price_scale is given, in which case a price of 30243.4 with a scale of 5 is
+    stored as 3024340000. Times are int64 microseconds since the epoch.
+    """
+
+    SIDE_BUY: int = 1
+    SIDE_SELL: int = -1
+    TYPE_MARKET: int = 0
+    TYPE_LIMIT: int = 1
+
+    PRICE_COLUMN: int = 0
+    VOLUME_COLUMN: int = 1
+    TIME_COLUMN: int = 2
+    SIDE_COLUMN: int = 3
+    TYPE_COLUMN: int = 4
+    ID_COLUMN: int = 6
+
+    __slots__ = ("price", "volume", "time", "side", "type", "id", "price_scale")
+
+    def __init__(
+        self,
+        price: np.ndarray,
+        volume: np.ndarray,
+        time: np.ndarray,
+        side: np.ndarray,
+        type: np.ndarray,
+        id: np.ndarray,
+        price_scale: int | None = None,
+    ) -> None:
+        self.price = price
+        self.volume = volume
+        self.time = time
+        """Microseconds since the epoch"""
+
+        self.side = side
+        """SIDE_BUY or SIDE_SELL"""
+
+        self.type = type
+        """TYPE_MARKET or TYPE_LIMIT"""
+
+        self.id = id
+        self.price_scale = price_scale
+        """Number of decimals in fixed-point prices, or None for float64 prices"""
+
+    @classmethod
+    def empty(cls, price_scale: int | None = None) -> "TradeColumns":
+        return cls(
+            price=np.empty(
+                0, dtype=np.int64 if price_scale is not None else np.float64
+            ),
+            volume=np.empty(0, dtype=np.float64),
+            time=np.empty(0, dtype=np.int64),
+            side=np.empty(0, dtype=np.int8),
+            type=np.empty(0, dtype=np.int8),
+            id=np.empty(0, dtype=np.int64),
+            price_scale=price_scale,
+        )
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Sequence], price_scale: int | None = None
+    ) -> "TradeColumns":
+        """Decodes a list of Trades rows."""
+        if len(rows) == 0:
+            return cls.empty(price_scale)
+
+        # Transposing once is far cheaper than indexing every row per column.
+        columns = list(zip(*rows))
+
+        price = np.array(columns[cls.PRICE_COLUMN], dtype=np.float64)
+        if price_scale is not None:
+            price = np.rint(price * 10**price_scale).astype(np.int64)
+
+        time = np.array(columns[cls.TIME_COLUMN], dtype=np.float64)
+        sides = np.array(columns[cls.SIDE_COLUMN], dtype="U1")
+        types = np.array(columns[cls.TYPE_COLUMN], dtype="U1")
+
+        return cls(
+            price=price,
+            volume=np.array(columns[cls.VOLUME_COLUMN], dtype=np.float64),
+            time=np.rint(time * 1_000_000).astype(np.int64),
+            side=np.where(sides == "b", cls.SIDE_BUY, cls.SIDE_SELL).astype(np.int8),
+            type=np.where(types == "m", cls.TYPE_MARKET, cls.TYPE_LIMIT).astype(
+                np.int8
+            ),
+            id=np.array(columns[cls.ID_COLUMN], dtype=np.int64),
+            price_scale=price_scale,
+        )
+
+    @classmethod
+    def from_response(
+        cls, response: dict, price_scale: int | None = None
+    ) -> "TradeColumns":
+        """Decodes the rows of a TradeListRequest response (the "result" dict)."""
+        for key, value in response.items():
+            if key != "last" and isinstance(value, list):
+                return cls.from_rows(value, price_scale)
+        return cls.empty(price_scale)
+
+    @classmethod
+    def concatenate(cls, parts: List["TradeColumns"]) -> "TradeColumns":
+        """Joins decoded batches, which must share a price_scale."""
+        if len(parts) == 0:
+            return cls.empty()
+
+        price_scale = parts[0].price_scale
+        if any(part.price_scale != price_scale for part in parts):
+            raise ValueError("Cannot concatenate trades with different price scales")
+
+        return cls(
+            price=np.concatenate([part.price for part in parts]),
+            volume=np.concatenate([part.volume for part in parts]),
+            time=np.concatenate([part.time for part in parts]),
+            side=np.concatenate([part.side for part in parts]),
+            type=np.concatenate([part.type for part in parts]),
+            id=np.concatenate([part.id for part in parts]),
+            price_scale=price_scale,
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __getitem__(self, index) -> "TradeColumns":
+        """Slices or masks every column at once. Slices return views."""
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 if index != -1 else None)
+
+        return TradeColumns(
+            price=self.price[index],
+            volume=self.volume[index],
+            time=self.time[index],
+            side=self.side[index],
+            type=self.type[index],
+            id=self.id[index],
+            price_scale=self.price_scale,
+        )
+
+    def get_float_prices(self) -> np.ndarray:
+        """Prices as float64, whether or not they are stored fixed-point."""
+        if self.price_scale is None:
+            return self.price
+        return self.price / 10**self.price_scale
+
+    def to_structured(self) -> np.ndarray:
+        """Copies the columns into a single structured array."""
+        result = np.empty(
+            len(self),
+            dtype=[
+                ("price", self.price.dtype),
+                ("volume", np.float64),
+                ("time", np.int64),
+                ("side", np.int8),
+                ("type", np.int8),
+                ("id", np.int64),
+            ],
+        )
+        result["price"] = self.price
+        result["volume"] = self.volume
+        result["time"] = self.time
+        result["side"] = self.side
+        result["type"] = self.type
+        result["id"] = self.id
+        return result
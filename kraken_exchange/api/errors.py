@@ -36,6 +36,19 @@ class RequestFailedException(Exception):
         self.headers = headers
 
 
+class CircuitOpenException(Exception):
+    """Raised without calling Kraken while an endpoint group's circuit breaker is open."""
+
+    def __init__(self, group: str, retry_after: float):
+        super().__init__(
+            "Calls to {0} endpoints are suspended for {1:.1f}s after repeated failures".format(
+                group, retry_after
+            )
+        )
+        self.group = group
+        self.retry_after = retry_after
+
+
 class InvalidValue(Exception):
     pass
 
@@ -798,6 +811,38 @@ class ServiceErrorException(ApiException):
         )
 
 
+class OrderOutcomeUnknownException(ServiceErrorException):
+    """An order may have been placed, and looking it up failed.
+
+    Look it up by userref, e.g. with IdempotentOrderSubmitter.reconcile(),
+    before submitting it again.
+    """
+
+    ADDITIONAL_TEXT: str = "Order outcome unknown"
+    MESSAGE: str = "Looking up the order with userref {0} failed, so it may or may not have been placed."
+
+    def __init__(self, userref: str | None = None, sent_at: float | None = None):
+        ApiException.__init__(
+            self,
+            severity=self.Severities.error,
+            category=self.Categories.service,
+            error_message="Internal error",
+            additional_text=self.ADDITIONAL_TEXT,
+            exception_message=self.MESSAGE.format(userref)
+            + " Look it up by userref before submitting it again.",
+        )
+        self.userref = userref
+        self.sent_at = sent_at
+        """When the order was first sent, as a time.time() timestamp"""
+
+
+class BatchOutcomeUnknownException(OrderOutcomeUnknownException):
+    """AddOrderBatch returned no result for an order, which may have been placed."""
+
+    ADDITIONAL_TEXT: str = "Batch result missing"
+    MESSAGE: str = "AddOrderBatch returned no result for the order with userref {0}, so it may or may not have been placed."
+
+
 class TradeLockedException(ApiException):
     """
     This issue has to do with the security of your account which may have been
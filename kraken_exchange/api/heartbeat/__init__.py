@@ -0,0 +1,2 @@
+from .heartbeat_client import HeartbeatClient
+from .dead_mans_switch import DeadMansSwitch
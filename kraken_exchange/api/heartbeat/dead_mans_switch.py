@@ -0,0 +1,197 @@
+import collections
+import threading
+import time
+from typing import Callable, Deque
+from ..abstract.api_client import ApiClient
+from ..abstract.nonce_generator import NonceGenerator
+from ..requests.order_cancel_all_after_request import OrderCancelAllAfterRequest
+from .heartbeat_client import HeartbeatClient
+
+
+class DeadMansSwitch:
+    """Keeps Kraken's CancelAllOrdersAfter countdown from reaching zero.
+
+    A dedicated thread refreshes the countdown every interval seconds over the
+    HeartbeatClient's own connection. Refreshes are scheduled on absolute times,
+    so a late beat doesn't push the following ones back. They don't go through
+    the shared RateLimiter either, so a heartbeat never waits behind other
+    calls; leave one call per interval of headroom in the budget of the rest.
+
+    The lateness of every beat (jitter, e.g. from GIL stalls) is measured, as
+    well as the margin left on the countdown when each refresh is acknowledged.
+    When the margin falls below alarm_margin, alarm is set and on_alarm is
+    called with the margin, giving the caller time to act before Kraken cancels
+    every open order.
+
+    Nonces must keep increasing per API key, so either use a key dedicated to
+    the heartbeat or share the NonceGenerator of the other components.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        timeout: int = 60,
+        interval: float | None = None,
+        alarm_margin: float | None = None,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        client: ApiClient | None = None,
+        on_alarm: Callable[[float], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.timeout = timeout
+        """Countdown set on every refresh, in seconds"""
+
+        self.interval = interval if interval is not None else timeout / 4
+        """Seconds between refreshes"""
+
+        self.alarm_margin = alarm_margin if alarm_margin is not None else self.interval
+        """Seconds left on the countdown below which the alarm goes off"""
+
+        if self.interval >= self.timeout:
+            raise ValueError("interval must be shorter than timeout")
+
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.client = client if client is not None else HeartbeatClient()
+        self.on_alarm = on_alarm
+        self.clock = clock
+
+        self.alarm = threading.Event()
+        """Set while the margin is below alarm_margin"""
+
+        self.refresh_count = 0
+        self.failure_count = 0
+        self.last_error: Exception | None = None
+        self.margin: float | None = None
+        """Seconds left on the countdown when the last refresh was acknowledged"""
+
+        self.jitters: Deque[float] = collections.deque(maxlen=1000)
+        """How late each recent beat started, in seconds"""
+
+        self.latencies: Deque[float] = collections.deque(maxlen=1000)
+        """Round trip of each recent successful refresh, in seconds"""
+
+        self._last_sent: float | None = None
+        self._refresh_lock = threading.RLock()
+        """Held while a refresh is in flight, so the disarm can't overtake one"""
+
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_alarmed(self) -> bool:
+        return self.alarm.is_set()
+
+    def __enter__(self) -> "DeadMansSwitch":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> "DeadMansSwitch":
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=self.__class__.__name__, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, disarm: bool = True, timeout: float | None = 5.0) -> None:
+        """Stops refreshing. With disarm, the countdown is also switched off.
+
+        The disarm waits for a refresh still in flight, however long the join
+        took, so it always reaches Kraken last. A failed disarm is counted
+        and kept in last_error rather than raised.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if not disarm:
+            return
+        with self._refresh_lock:
+            if self._last_sent is None:
+                return
+            try:
+                self.refresh(0)
+            except Exception as e:
+                self.failure_count += 1
+                self.last_error = e
+
+    def refresh(self, timeout: int | None = None) -> dict:
+        """Sets the countdown to timeout seconds, or to self.timeout."""
+        request = OrderCancelAllAfterRequest()
+        request.timeout = self.timeout if timeout is None else timeout
+        with self._refresh_lock:
+            return request.submit(
+                use_mock=self.use_mock,
+                nonce=self.nonce_generator.next(),
+                api_key=self.api_key,
+                security_key=self.security_key,
+                client=self.client,
+            )
+
+    def get_stats(self) -> dict:
+        jitters = sorted(self.jitters)
+        return {
+            "refresh_count": self.refresh_count,
+            "failure_count": self.failure_count,
+            "margin": self.margin,
+            "alarmed": self.is_alarmed,
+            "max_jitter": jitters[-1] if jitters else None,
+            "mean_jitter": sum(jitters) / len(jitters) if jitters else None,
+            "p99_jitter": jitters[int(0.99 * (len(jitters) - 1))] if jitters else None,
+            "max_latency": max(self.latencies) if self.latencies else None,
+        }
+
+    def _beat(self, scheduled: float) -> None:
+        with self._refresh_lock:
+            # stop() may have disarmed the countdown while this beat waited.
+            if not self._stopping.is_set():
+                self._refresh(scheduled)
+
+    def _refresh(self, scheduled: float) -> None:
+        started = self.clock()
+        self.jitters.append(started - scheduled)
+        try:
+            self.refresh()
+            acknowledged = self.clock()
+            self.latencies.append(acknowledged - started)
+            self.refresh_count += 1
+            previous, self._last_sent = self._last_sent, started
+            if previous is None:
+                self.margin = float(self.timeout)
+            else:
+                self.margin = previous + self.timeout - acknowledged
+        except Exception as e:
+            self.failure_count += 1
+            self.last_error = e
+            if self._last_sent is not None:
+                self.margin = self._last_sent + self.timeout - self.clock()
+
+        self._check_alarm()
+
+    def _check_alarm(self) -> None:
+        if self.margin is None:
+            return
+        if self.margin < self.alarm_margin:
+            self.alarm.set()
+            if self.on_alarm is not None:
+                self.on_alarm(self.margin)
+        else:
+            self.alarm.clear()
+
+    def _run(self) -> None:
+        scheduled = self.clock()
+        while not self._stopping.wait(max(0.0, scheduled - self.clock())):
+            self._beat(scheduled)
+            scheduled += self.interval
+            # After a long stall, carry on from now instead of catching up.
+            if scheduled < self.clock():
+                scheduled = self.clock()
@@ -0,0 +1,19 @@
+import requests
+from ..abstract.api_client import ApiClient
+
+
+class HeartbeatClient(ApiClient):
+    """ApiClient with its own connection pool, used for heartbeats only.
+
+    Keeping the connection open and separate means refreshes neither queue
+    behind other calls nor pay for a new TLS handshake.
+    """
+
+    SESSION: requests.Session | None = requests.Session()
+
+    CIRCUIT_BREAKERS = None
+    """Heartbeats keep trying: failing fast would only let the countdown run out."""
+
+    TIMEOUT = (3.05, 10.0)
+    """A hung refresh gives up well within the default interval (a quarter of
+    the 60s countdown), so it can't hold up the next beat as well."""
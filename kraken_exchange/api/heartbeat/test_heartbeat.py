@@ -0,0 +1,102 @@
+import threading
+from .dead_mans_switch import DeadMansSwitch
+from .heartbeat_client import HeartbeatClient
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def test_dead_mans_switch_refreshes_on_schedule():
+    now = [0.0]
+    switch = DeadMansSwitch(
+        API_KEY,
+        SECURITY_KEY,
+        timeout=10,
+        interval=2,
+        use_mock=True,
+        clock=lambda: now[0],
+    )
+    sent = []
+    refreshed = threading.Event()
+
+    def refresh(timeout=None):
+        sent.append(timeout)
+        if len(sent) < 4:
+            # Each refresh takes until the next beat is due.
+            now[0] += switch.interval
+        else:
+            # The clock stops, so the thread waits until it is stopped.
+            refreshed.set()
+        return {}
+
+    switch.refresh = refresh
+    with switch:
+        assert refreshed.wait(5)
+
+    stats = switch.get_stats()
+    assert stats["refresh_count"] == 4
+    assert stats["max_jitter"] == 0
+    # Acknowledged at 6s, 10s after the third refresh was sent at 4s.
+    assert stats["margin"] == 8
+    assert not switch.is_alarmed
+    # Stopping switches the countdown off.
+    assert sent == [None] * 4 + [0]
+
+
+def test_dead_mans_switch_alarms_on_small_margin():
+    alarms = []
+    now = [0.0]
+    switch = DeadMansSwitch(
+        API_KEY,
+        SECURITY_KEY,
+        timeout=10,
+        interval=2,
+        use_mock=True,
+        on_alarm=alarms.append,
+        clock=lambda: now[0],
+    )
+    assert isinstance(switch.client, HeartbeatClient)
+
+    switch._beat(0.0)
+    assert switch.refresh_count == 1 and alarms == []
+
+    # A stall delays the next beat until only 1.5s are left on the countdown.
+    now[0] = 8.5
+    switch._beat(2.0)
+    assert switch.jitters[-1] == 6.5
+    assert switch.margin == 1.5
+    assert switch.is_alarmed and alarms == [1.5]
+
+    now[0] = 10.5
+    switch._beat(10.5)
+    assert not switch.is_alarmed
+
+
+def test_dead_mans_switch_disarms_after_the_refresh_in_flight():
+    switch = DeadMansSwitch(
+        API_KEY, SECURITY_KEY, timeout=10, use_mock=True, clock=lambda: 0.0
+    )
+    sent = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def refresh(timeout=None):
+        if timeout is None:
+            started.set()
+            release.wait(5)
+        elif timeout == 0:
+            sent.append(timeout)
+            raise ConnectionError("disarm failed")
+        sent.append(timeout)
+        return {}
+
+    switch.refresh = refresh
+    switch.start()
+    assert started.wait(5)
+    threading.Timer(0.05, release.set).start()
+    # The join gives up first, but the disarm still waits for the refresh.
+    switch.stop(timeout=0.001)
+
+    assert sent == [None, 0]
+    assert switch.failure_count == 1
+    assert isinstance(switch.last_error, ConnectionError)
@@ -0,0 +1,3 @@
+from .histogram import Histogram
+from .request_metrics import RequestMetrics
+from .prometheus_exporter import PrometheusExporter
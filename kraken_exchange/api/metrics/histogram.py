@@ -0,0 +1,82 @@
+from typing import List
+
+
+class Histogram:
+    """HDR-style histogram with a bounded relative error.
+
+    Values are counted in units of unit (e.g. 1e-6 for microseconds). Below
+    2**SUB_BUCKET_BITS units every value has its own bucket; above, each power
+    of two is split into 2**(SUB_BUCKET_BITS - 1) buckets, so percentiles are
+    within 1/64 of the true value and memory stays fixed however wide the
+    range.
+
+    A Histogram has a single writer: it isn't locked, and concurrent writers
+    should each keep their own and merge() them on read.
+    """
+
+    SUB_BUCKET_BITS: int = 7
+
+    def __init__(self, unit: float = 1.0, max_bits: int = 40) -> None:
+        self.unit = unit
+        self.max_bits = max_bits
+        """Values of 2**max_bits units and above go in the last bucket"""
+
+        self.counts: List[int] = [0] * self._get_index((1 << max_bits) - 1) + [0]
+        self.count = 0
+        self.total = 0.0
+        self.max: float | None = None
+
+    def _get_index(self, units: int) -> int:
+        sub_buckets = 1 << self.SUB_BUCKET_BITS
+        if units < sub_buckets:
+            return units
+        shift = units.bit_length() - self.SUB_BUCKET_BITS
+        half = sub_buckets >> 1
+        return sub_buckets + (shift - 1) * half + (units >> shift) - half
+
+    def _get_upper_bound(self, index: int) -> int:
+        """Highest value, in units, counted in the bucket"""
+        sub_buckets = 1 << self.SUB_BUCKET_BITS
+        if index < sub_buckets:
+            return index
+        half = sub_buckets >> 1
+        shift, offset = divmod(index - sub_buckets, half)
+        return ((half + offset + 1) << (shift + 1)) - 1
+
+    def record(self, value: float) -> None:
+        units = max(0, int(value / self.unit))
+        index = min(self._get_index(units), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Adds the counts of other, which must have the same unit and max_bits."""
+        if other.unit != self.unit or len(other.counts) != len(self.counts):
+            raise ValueError("Only histograms with the same layout can be merged")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        return self
+
+    def get_percentile(self, percentile: float) -> float | None:
+        """Value below which percentile % of the recorded values fall"""
+        if self.count == 0:
+            return None
+        target = max(1, self.count * percentile / 100)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                value = (self._get_upper_bound(index) + 1) * self.unit
+                return min(value, self.max) if self.max is not None else value
+        return self.max
+
+    def get_mean(self) -> float | None:
+        return self.total / self.count if self.count else None
@@ -0,0 +1,100 @@
+import os
+import tempfile
+from typing import List
+from .request_metrics import RequestMetrics
+
+
+class PrometheusExporter:
+    """Renders RequestMetrics in the Prometheus text format.
+
+    write() replaces the file atomically, so it can feed node_exporter's
+    textfile collector from a periodic job.
+    """
+
+    def __init__(self, metrics: RequestMetrics, prefix: str = "kraken") -> None:
+        self.metrics = metrics
+        self.prefix = prefix
+
+    @classmethod
+    def escape(cls, value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @classmethod
+    def format_value(cls, value: float | None) -> str:
+        return "NaN" if value is None else repr(float(value))
+
+    def _render_summary(
+        self, lines: List[str], name: str, description: str, histograms: dict
+    ) -> None:
+        """Renders a summary of histograms keyed by their label values, e.g. (path,)."""
+        name = "{0}_{1}".format(self.prefix, name)
+        lines.append("# HELP {0} {1}".format(name, description))
+        lines.append("# TYPE {0} summary".format(name))
+        for labels, histogram in histograms.items():
+            label = ",".join(
+                '{0}="{1}"'.format(key, self.escape(value)) for key, value in labels
+            )
+            for percentile in self.metrics.PERCENTILES:
+                lines.append(
+                    '{0}{{{1},quantile="{2:g}"}} {3}'.format(
+                        name,
+                        label,
+                        percentile / 100,
+                        self.format_value(histogram.get_percentile(percentile)),
+                    )
+                )
+            lines.append(
+                "{0}_sum{{{1}}} {2}".format(
+                    name, label, self.format_value(histogram.total)
+                )
+            )
+            lines.append("{0}_count{{{1}}} {2}".format(name, label, histogram.count))
+
+    def render(self) -> str:
+        paths = self.metrics.get_paths()
+        lines: List[str] = []
+        self._render_summary(
+            lines,
+            "request_latency_seconds",
+            "Round trip of requests to the Kraken API.",
+            {(("path", path),): self.metrics.get_latencies(path) for path in paths},
+        )
+        self._render_summary(
+            lines,
+            "response_size_bytes",
+            "Size of response bodies from the Kraken API.",
+            {(("path", path),): self.metrics.get_sizes(path) for path in paths},
+        )
+        self._render_summary(
+            lines,
+            "request_phase_seconds",
+            "Time spent in each phase of requests to the Kraken API.",
+            {
+                (("path", path), ("phase", phase)): histogram
+                for path in paths
+                for phase, histogram in self.metrics.get_phases(path).items()
+            },
+        )
+
+        name = "{0}_request_errors_total".format(self.prefix)
+        lines.append("# HELP {0} Failed requests to the Kraken API.".format(name))
+        lines.append("# TYPE {0} counter".format(name))
+        for path in paths:
+            for error, count in sorted(self.metrics.get_errors(path).items()):
+                lines.append(
+                    '{0}{{path="{1}",error="{2}"}} {3}'.format(
+                        name, self.escape(path), self.escape(error), count
+                    )
+                )
+        return "\n".join(lines) + "\n"
+
+    def write(self, file_path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(file_path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                file.write(self.render())
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
@@ -0,0 +1,121 @@
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+from .histogram import Histogram
+
+
+class RequestMetrics:
+    """Latency, response size, errors and phase timings of every request, per path.
+
+    Every path has one set of histograms, shared by all threads, so memory
+    doesn't grow with the number of threads that ever sent a request.
+    Recording a request holds the lock for a few increments only, and reads
+    copy the histograms under the same lock, so they are consistent snapshots.
+    """
+
+    PERCENTILES: Tuple[float, ...] = (50, 99, 99.9)
+
+    def __init__(self, latency_unit: float = 1e-6) -> None:
+        self.latency_unit = latency_unit
+        """Resolution of the latency histograms, in seconds"""
+
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, path: str) -> tuple:
+        """The histograms of path, created when missing. The lock must be held."""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = (
+                Histogram(unit=self.latency_unit),
+                Histogram(unit=1),
+                Counter(),
+                {},
+            )
+        return entry
+
+    def record(
+        self,
+        path: str,
+        latency: float,
+        size: int | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        with self._lock:
+            latencies, sizes, errors, _ = self._get_entry(path)
+            latencies.record(latency)
+            if size is not None:
+                sizes.record(size)
+            if error is not None:
+                errors[error.__class__.__name__] += 1
+
+    def record_phases(self, path: str, durations: Dict[str, float]) -> None:
+        """Records the seconds a request spent in each phase (see RequestTiming)."""
+        with self._lock:
+            phases = self._get_entry(path)[3]
+            for phase, duration in durations.items():
+                histogram = phases.get(phase)
+                if histogram is None:
+                    histogram = phases[phase] = Histogram(unit=self.latency_unit)
+                histogram.record(duration)
+
+    def get_paths(self) -> List[str]:
+        with self._lock:
+            return sorted(self._entries)
+
+    def get_latencies(self, path: str) -> Histogram:
+        """A copy of the latency histogram of path, in seconds"""
+        result = Histogram(unit=self.latency_unit)
+        with self._lock:
+            if path in self._entries:
+                result.merge(self._entries[path][0])
+        return result
+
+    def get_sizes(self, path: str) -> Histogram:
+        """A copy of the response size histogram of path, in bytes"""
+        result = Histogram(unit=1)
+        with self._lock:
+            if path in self._entries:
+                result.merge(self._entries[path][1])
+        return result
+
+    def get_errors(self, path: str) -> Dict[str, int]:
+        """Number of failed requests to path, per error class name"""
+        with self._lock:
+            if path not in self._entries:
+                return {}
+            return dict(self._entries[path][2])
+
+    def get_phases(self, path: str) -> Dict[str, Histogram]:
+        """Histogram of the seconds spent in each phase of requests to path"""
+        result: Dict[str, Histogram] = {}
+        with self._lock:
+            if path in self._entries:
+                for phase, histogram in self._entries[path][3].items():
+                    result[phase] = Histogram(unit=self.latency_unit).merge(histogram)
+        return result
+
+    def get_summary(self) -> Dict[str, dict]:
+        """Count, latency percentiles, errors and phase timings per path."""
+        summary = {}
+        for path in self.get_paths():
+            latencies = self.get_latencies(path)
+            sizes = self.get_sizes(path)
+            summary[path] = {
+                "count": latencies.count,
+                "mean": latencies.get_mean(),
+                "max": latencies.max,
+                "p50": latencies.get_percentile(50),
+                "p99": latencies.get_percentile(99),
+                "p999": latencies.get_percentile(99.9),
+                "mean_size": sizes.get_mean(),
+                "errors": self.get_errors(path),
+                "phases": {
+                    phase: {
+                        "mean": histogram.get_mean(),
+                        "p99": histogram.get_percentile(99),
+                    }
+                    for phase, histogram in self.get_phases(path).items()
+                },
+            }
+        return summary
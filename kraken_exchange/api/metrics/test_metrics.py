@@ -0,0 +1,204 @@
+import pytest
+import threading
+import time
+from ..abstract.api_client import ApiClient
+from ..abstract.hook_dispatcher import HookDispatcher
+from ..abstract.hook_registry import HookRegistry
+from ..abstract.request_timing import RequestTiming
+from ..requests import OrderListRequest, TickerShowRequest
+from .histogram import Histogram
+from .prometheus_exporter import PrometheusExporter
+from .request_metrics import RequestMetrics
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def test_histogram_percentiles():
+    histogram = Histogram(unit=1e-6)
+    for i in range(1, 10001):
+        histogram.record(i / 1000)
+
+    assert histogram.count == 10000
+    assert histogram.max == 10.0
+    for percentile, expected in ((50, 5.0), (99, 9.9), (99.9, 9.99)):
+        value = histogram.get_percentile(percentile)
+        assert abs(value - expected) / expected < 1 / 64
+    assert Histogram().get_percentile(50) is None
+
+
+def test_request_metrics_record_from_threads():
+    metrics = RequestMetrics()
+
+    def record():
+        for _ in range(1000):
+            metrics.record("/0/public/Time", 0.01, 100)
+        metrics.record("/0/public/Time", 1.0, error=TimeoutError())
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    threads += [
+        threading.Thread(target=metrics.record, args=("/0/public/Time", 0.01))
+        for _ in range(200)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = metrics.get_summary()["/0/public/Time"]
+    assert summary["count"] == 4204
+    assert summary["errors"] == {"TimeoutError": 4}
+    assert summary["max"] == 1.0
+    assert abs(summary["p50"] - 0.01) < 0.001
+    assert summary["mean_size"] == 100
+
+
+def test_api_client_records_requests(tmp_path):
+    class MeasuredClient(ApiClient):
+        METRICS = RequestMetrics()
+
+    for request in (TickerShowRequest(), OrderListRequest(), OrderListRequest()):
+        request.submit(
+            use_mock=True,
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            client=MeasuredClient(),
+        )
+
+    assert MeasuredClient.METRICS.get_paths() == [
+        "/0/private/ClosedOrders",
+        "/0/public/Ticker",
+    ]
+    assert MeasuredClient.METRICS.get_latencies("/0/private/ClosedOrders").count == 2
+
+    file_path = tmp_path / "kraken.prom"
+    PrometheusExporter(MeasuredClient.METRICS).write(str(file_path))
+    text = file_path.read_text()
+    assert "# TYPE kraken_request_latency_seconds summary" in text
+    assert (
+        'kraken_request_latency_seconds_count{path="/0/private/ClosedOrders"} 2' in text
+    )
+    assert (
+        'kraken_response_size_bytes{path="/0/public/Ticker",quantile="0.999"}' in text
+    )
+
+
+def test_phase_timings(monkeypatch):
+    timings: list = []
+
+    class TimedClient(ApiClient):
+        METRICS = RequestMetrics()
+
+    client = TimedClient()
+    client.hooks.add_timing_hook(timings.append, synchronous=True)
+    OrderListRequest().submit(
+        use_mock=True,
+        nonce="1",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=client,
+    )
+
+    assert len(timings) == 1
+    timing = timings[0]
+    assert timing.path == "/0/private/ClosedOrders"
+    assert list(timing.get_breakdown()) == list(RequestTiming.PHASES)
+    assert abs(sum(timing.durations.values()) - timing.total) < 1e-9
+
+    # Every phase is marked once, where it happens.
+    marks: list = []
+    mark = RequestTiming.mark
+    monkeypatch.setattr(
+        RequestTiming,
+        "mark",
+        lambda self, phase: marks.append(phase) or mark(self, phase),
+    )
+    request = OrderListRequest()
+    request.submit(
+        use_mock=True,
+        nonce="2",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=client,
+    )
+    assert marks == [phase for phase in RequestTiming.PHASES if phase != "wait"]
+
+    # Streamed bodies are read, and their items decoded, chunk by chunk.
+    marks.clear()
+    TimedClient.STREAM_CHUNK_SIZE = 256
+    request.submit(
+        use_mock=True,
+        nonce="3",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=client,
+        on_item=lambda txid, order: None,
+    )
+    assert marks.count("read") == marks.count("decode") + 1 > 3
+    assert marks[-3:] == ["post_hooks", "decode", "construct"]
+
+    phases = TimedClient.METRICS.get_phases("/0/private/ClosedOrders")
+    assert phases["construct"].count == 3
+    assert "construct" in TimedClient.METRICS.get_summary()[timing.path]["phases"]
+    text = PrometheusExporter(TimedClient.METRICS).render()
+    assert (
+        'kraken_request_phase_seconds_count{path="/0/private/ClosedOrders",phase="sign"} 3'
+        in text
+    )
+
+
+def test_post_request_hooks_run_off_the_request_path():
+    release = threading.Event()
+    seen: list = []
+
+    def slow_hook(response, path, *args):
+        release.wait(5)
+        seen.append(path)
+
+    client = ApiClient(hooks=HookRegistry(HookDispatcher(max_queue_size=1)))
+    client.hooks.add_post_request_hook(slow_hook)
+    assert len(ApiClient().hooks.post_request_hooks) == 0
+
+    def submit():
+        return TickerShowRequest().submit(
+            use_mock=True,
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            client=client,
+        )
+
+    dispatcher = client.hooks.dispatcher
+    submit()
+    while dispatcher.get_pending_count() > 0:
+        time.sleep(0.001)
+    # The hook is still blocked: one more call fits in the queue, the next is dropped.
+    submit()
+    submit()
+    assert dispatcher.dropped_count == 1
+    assert seen == []
+
+    release.set()
+    dispatcher.flush()
+    assert seen == ["/0/public/Ticker"] * 2
+    assert dispatcher.get_stats()["completed"] == 2
+
+
+def test_api_client_submit_still_works_on_the_class():
+    with pytest.deprecated_call():
+        response = ApiClient.submit(
+            request=TickerShowRequest(),
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            use_mock=True,
+        )
+
+    assert response == ApiClient().submit(
+        request=TickerShowRequest(),
+        nonce="1",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        use_mock=True,
+    )
@@ -0,0 +1,3 @@
+from .checkpoint_store import CheckpointStore
+from .closed_order_iterator import ClosedOrderIterator
+from .withdrawal_iterator import WithdrawalIterator
@@ -0,0 +1,51 @@
+import json
+import os
+import threading
+from typing import Any
+
+
+class CheckpointStore:
+    """Persists named checkpoints, such as cursors, in a single JSON file.
+
+    Every set() rewrites the file through a temporary file and os.replace(), so a
+    crash leaves either the old or the new checkpoints on disk, never a torn file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._values: dict | None = None
+
+    def _load(self) -> dict:
+        """Reads the file on first use. The lock must be held."""
+        if self._values is None:
+            try:
+                with open(self.path, "r") as file:
+                    self._values = json.load(file)
+            except FileNotFoundError:
+                self._values = {}
+        return self._values
+
+    def _save(self) -> None:
+        """Atomically replaces the file with the current values. The lock must be held."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(self._values, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._load()[key] = value
+            self._save()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._load():
+                del self._load()[key]
+                self._save()
@@ -0,0 +1,92 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, Tuple
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+from ..requests.order_list_request import OrderListRequest
+
+
+class ClosedOrderIterator:
+    """Walks every page of ClosedOrders, fetching page N+1 while page N is consumed.
+
+    At most two pages are held at a time, so memory use doesn't grow with the
+    number of orders on the account. Iteration stops once the offset reaches the
+    count returned by Kraken, or when a page comes back empty.
+    """
+
+    COST: int = 2
+    """ClosedOrders is a history call and costs 2 on Kraken's counter."""
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        request: OrderListRequest | None = None,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.request: OrderListRequest = (
+            request if request is not None else OrderListRequest()
+        )
+        """Template for every page. Its filters are copied, and ofs is replaced."""
+
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+
+    def __iter__(self) -> Iterator[Tuple[str, dict]]:
+        return self.iter_orders()
+
+    def _page_request(self, offset: int, end: str | None) -> OrderListRequest:
+        page = OrderListRequest()
+        for property in OrderListRequest.get_all_fields().keys():
+            setattr(page, property, getattr(self.request, property))
+        page.ofs = offset
+        if end is not None:
+            page.end = end
+        return page
+
+    def _fetch_page(self, offset: int, end: str | None) -> dict:
+        self.rate_limiter.acquire(self.COST)
+        response = self._page_request(offset, end).submit(
+            use_mock=self.use_mock,
+            nonce=self.nonce_generator.next(),
+            api_key=self.api_key,
+            security_key=self.security_key,
+        )
+        return response if isinstance(response, dict) else response.__dict__
+
+    def iter_pages(self) -> Iterator[dict]:
+        """Yields the "closed" dict of each page, keyed by transaction id."""
+        offset = int(self.request.ofs) if self.request.ofs is not None else 0
+        end = self.request.end
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending: Future | None = executor.submit(self._fetch_page, offset, end)
+            while pending is not None:
+                page = pending.result()
+                closed: dict = page.get("closed") or {}
+                count = int(page.get("count") or 0)
+
+                # Pin the end of the range to the newest order seen, so orders
+                # closing mid-iteration don't shift the offsets of later pages.
+                if end is None and len(closed) > 0:
+                    end = next(iter(closed.keys()))
+
+                offset += len(closed)
+                pending = None
+                if len(closed) > 0 and offset < count:
+                    pending = executor.submit(self._fetch_page, offset, end)
+
+                yield closed
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_orders(self) -> Iterator[Tuple[str, dict]]:
+        """Yields (txid, order) tuples for every closed order."""
+        for closed in self.iter_pages():
+            yield from closed.items()
@@ -0,0 +1,76 @@
+from ..abstract.rate_limiter import RateLimiter
+from ..requests import OrderListRequest
+from .checkpoint_store import CheckpointStore
+from .closed_order_iterator import ClosedOrderIterator
+from .withdrawal_iterator import WithdrawalIterator
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def test_closed_order_iterator_stops_at_count():
+    iterator = ClosedOrderIterator(API_KEY, SECURITY_KEY, use_mock=True)
+    orders = list(iterator)
+
+    assert [txid for txid, _ in orders] == [
+        "O37652-RJWRT-IMO74O",
+        "O6YDQ5-LOMWU-37YKEE",
+    ]
+
+
+def test_closed_order_iterator_copies_filters_and_pins_end():
+    template = OrderListRequest()
+    template.userref = 36493663
+    iterator = ClosedOrderIterator(API_KEY, SECURITY_KEY, request=template)
+
+    page = iterator._page_request(50, "O37652-RJWRT-IMO74O")
+    body = page.get_properties_in("body")
+
+    assert body["userref"] == 36493663
+    assert body["ofs"] == 50
+    assert body["end"] == "O37652-RJWRT-IMO74O"
+
+
+def test_rate_limiter_waits_for_decay():
+    now = [0.0]
+
+    def sleep(seconds: float):
+        now[0] += seconds
+
+    limiter = RateLimiter(
+        max_counter=4, decay_per_second=1, clock=lambda: now[0], sleep=sleep
+    )
+
+    assert limiter.acquire(4) == 0
+    assert limiter.try_acquire(1) is False
+    assert limiter.acquire(2) == 2
+    assert now[0] == 2
+
+
+def test_withdrawal_iterator_resumes_from_checkpoint(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    pages = {
+        True: ([{"refid": "A"}], "page-2"),
+        "page-2": ([{"refid": "B"}], "page-3"),
+        "page-3": ([{"refid": "C"}], None),
+    }
+
+    iterator = WithdrawalIterator(API_KEY, SECURITY_KEY, checkpoint_store=store)
+    iterator._fetch_page = lambda cursor: pages[cursor]  # type: ignore
+
+    stream = iterator.iter_withdrawals()
+    assert next(stream)["refid"] == "A"
+    assert next(stream)["refid"] == "B"
+    assert store.get("withdrawals") == "page-2"
+
+    resumed = WithdrawalIterator(API_KEY, SECURITY_KEY, checkpoint_store=store)
+    resumed._fetch_page = lambda cursor: pages[cursor]  # type: ignore
+
+    assert [w["refid"] for w in resumed] == ["B", "C"]
+    assert CheckpointStore(store.path).get("withdrawals") == "page-3"
+
+
+def test_withdrawal_iterator_reads_mock_pages():
+    iterator = WithdrawalIterator(API_KEY, SECURITY_KEY, use_mock=True)
+
+    assert len(list(iterator)) == 2
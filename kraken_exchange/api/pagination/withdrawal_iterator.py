@@ -0,0 +1,100 @@
+from typing import Iterator, Tuple
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+from ..requests.withdrawal_list_request import WithdrawalListRequest
+from .checkpoint_store import CheckpointStore
+
+
+class WithdrawalIterator:
+    """Follows the WithdrawStatus cursor chain, yielding withdrawals one at a time.
+
+    Only the page being consumed is held in memory. When a checkpoint store is
+    given, the cursor is saved once a page has been fully consumed, and the next
+    iterator created with the same store and key resumes from there.
+    """
+
+    COST: int = 1
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        request: WithdrawalListRequest | None = None,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+        checkpoint_key: str = "withdrawals",
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.request: WithdrawalListRequest = (
+            request if request is not None else WithdrawalListRequest()
+        )
+        """Template for every page. Its filters are copied, and cursor is replaced."""
+
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_key = checkpoint_key
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.iter_withdrawals()
+
+    def _page_request(self, cursor: bool | str) -> WithdrawalListRequest:
+        page = WithdrawalListRequest()
+        for property in WithdrawalListRequest.get_all_fields().keys():
+            setattr(page, property, getattr(self.request, property))
+        page.cursor = cursor
+        return page
+
+    def _fetch_page(self, cursor: bool | str) -> Tuple[list, str | None]:
+        """Returns the withdrawals on the page and the cursor of the next page."""
+        self.rate_limiter.acquire(self.COST)
+        response = self._page_request(cursor).submit(
+            use_mock=self.use_mock,
+            nonce=self.nonce_generator.next(),
+            api_key=self.api_key,
+            security_key=self.security_key,
+        )
+
+        if isinstance(response, dict) and "result" in response:
+            response = response["result"]
+
+        # Without pagination Kraken answers with a bare list.
+        if isinstance(response, list):
+            return response, None
+
+        return response.get("withdrawals") or [], response.get("next_cursor")
+
+    def get_start_cursor(self) -> bool | str:
+        """The saved cursor, or True to request the first page."""
+        if self.checkpoint_store is not None:
+            saved = self.checkpoint_store.get(self.checkpoint_key)
+            if saved:
+                return saved
+        return True
+
+    def iter_pages(self) -> Iterator[list]:
+        """Yields the list of withdrawals on each page."""
+        cursor: bool | str | None = self.get_start_cursor()
+        while cursor:
+            withdrawals, next_cursor = self._fetch_page(cursor)
+            yield withdrawals
+
+            # The page has been consumed. Without a next page, keep the cursor of
+            # this one, so a resumed job re-reads only the newest page.
+            if self.checkpoint_store is not None:
+                saved = next_cursor if next_cursor else cursor
+                if isinstance(saved, str):
+                    self.checkpoint_store.set(self.checkpoint_key, saved)
+
+            cursor = next_cursor
+
+    def iter_withdrawals(self) -> Iterator[dict]:
+        """Yields each withdrawal across every page."""
+        for withdrawals in self.iter_pages():
+            yield from withdrawals
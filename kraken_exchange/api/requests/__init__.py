@@ -13,3 +13,10 @@ from .withdrawal_create_request import WithdrawalCreateRequest
 from .withdrawal_list_request import WithdrawalListRequest
 from .ticker_show_request import TickerShowRequest
 from .asset_pair_list_request import AssetPairListRequest
+from .order_book_show_request import OrderBookShowRequest
+from .web_socket_token_create_request import WebSocketTokenCreateRequest
+from .order_cancel_batch_request import OrderCancelBatchRequest
+from .order_cancel_all_request import OrderCancelAllRequest
+from .order_cancel_all_after_request import OrderCancelAllAfterRequest
+from .open_order_list_request import OpenOrderListRequest
+from .trade_history_list_request import TradeHistoryListRequest
@@ -18,6 +18,8 @@ class AssetPairListRequest(Request):
     Info to retrieve (optional)
     """
 
+    STREAM_PATH = ("result",)
+
     @classmethod
     def is_child(cls) -> bool:
         return False
@@ -0,0 +1,67 @@
+import datetime
+from decimal import Decimal
+from typing import Union
+from ..abstract.request import Request
+
+
+class OpenOrderListRequest(Request):
+    include_trades = Request.Fields.BoolField(
+        required=True, location="body", default=False, alias="trades"
+    )
+    """Whether or not to include trades related to position in output"""
+
+    userref: Union[
+        Decimal, int, str, datetime.datetime, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(
+        required=False, location="body", default=None, alias="userref"
+    )
+    """Restrict results to given user reference id"""
+
+    STREAM_PATH = ("result", "open")
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/OpenOrders"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {
+            "error": [],
+            "result": {
+                "open": {
+                    "OQCLML-BW3P3-BUCMWZ": {
+                        "refid": "None",
+                        "userref": 1,
+                        "status": "open",
+                        "opentm": 1688666559.8974,
+                        "starttm": 0,
+                        "expiretm": 0,
+                        "descr": {
+                            "pair": "XBTUSD",
+                            "type": "buy",
+                            "ordertype": "limit",
+                            "price": "27500.0",
+                            "price2": "0",
+                            "leverage": "none",
+                            "order": "buy 1.25000000 XBTUSD @ limit 27500.0",
+                            "close": "",
+                        },
+                        "vol": "1.25000000",
+                        "vol_exec": "0.00000000",
+                        "cost": "0.00000",
+                        "fee": "0.00000",
+                        "price": "0.00000",
+                        "stopprice": "0.00000",
+                        "limitprice": "0.00000",
+                        "misc": "",
+                        "oflags": "fciq",
+                    }
+                }
+            },
+        }
+        return super().get_factory_response(result)
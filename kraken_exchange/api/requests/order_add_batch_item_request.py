@@ -1,5 +1,6 @@
 from typing import Union
 from ..abstract.request import Request
+from .order_add_request import OrderAddRequest
 from .order_batch_item_close_request import OrderBatchItemCloseRequest
 
 
@@ -55,6 +56,27 @@ class OrderAddBatchItemRequest(Request):
     )
     close = Request.Fields.ChildModelField(OrderBatchItemCloseRequest, location="body")
 
+    BATCH_FIELDS = ("pair", "deadline", "validate")
+    """Fields of an OrderAddRequest that are set once for the whole batch"""
+
     @classmethod
     def is_child(cls) -> bool:
         return True
+
+    @classmethod
+    def from_order_add_request(
+        cls, request: OrderAddRequest
+    ) -> "OrderAddBatchItemRequest":
+        """Copies an order, leaving out the fields set on the batch.
+
+        Raises ValueError for fields that AddOrderBatch doesn't accept.
+        """
+        item = cls()
+        for key, value in request.get_properties_in("body").items():
+            key = "displayvol" if key == "display_volume" else key
+            if key in cls.BATCH_FIELDS or key == "nonce":
+                continue
+            if not hasattr(cls, key) or cls.get_field(key) is None:
+                raise ValueError("{0} can't be sent in an order batch".format(key))
+            setattr(item, key, value)
+        return item
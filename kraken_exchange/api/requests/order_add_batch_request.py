@@ -1,12 +1,41 @@
-from typing import List, overload
+from typing import List, Union
 from ..abstract.request import Request
 from .order_add_batch_item_request import OrderAddBatchItemRequest
 
 
 class OrderAddBatchRequest(Request):
+    """Places 2 to 15 orders for the same pair in a single call.
+
+    The body is nested, so it is sent as JSON. The result holds one entry per
+    item, in the same order, with either a txid or an error.
+    """
+
+    JSON_BODY = True
+    MAX_ITEMS: int = 15
+
+    items = Request.Fields.ListField(
+        OrderAddBatchItemRequest, required=True, location="body", alias="orders"
+    )
+    """The orders to place"""
+
+    pair: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
+        required=True, location="body"
+    )
+    """Asset pair id or altname, shared by every order"""
+
+    deadline: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
+        required=False, location="body"
+    )
+    """RFC3339 timestamp after which the matching engine should reject the batch"""
+
+    validate: Union[bool, Request.Fields.BoolField, None] = Request.Fields.BoolField(
+        required=False, location="body"
+    )
+    """Validate inputs only. Do not submit orders."""
+
     def __init__(self, items: List[OrderAddBatchItemRequest] | None = None):
         super().__init__()
-        self.items: List[OrderAddBatchItemRequest] = items if items else list()
+        self.items = items if items else list()
 
     @classmethod
     def is_child(cls) -> bool:
@@ -18,3 +47,23 @@ class OrderAddBatchRequest(Request):
 
     def get_path(self) -> str:
         return "/0/private/AddOrderBatch"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        orders = []
+        for item in self.items or [OrderAddBatchItemRequest()]:
+            orders.append(
+                {
+                    "descr": {
+                        "order": "{0} {1} {2} @ {3} {4}".format(
+                            item.type,
+                            item.volume,
+                            self.pair,
+                            item.ordertype,
+                            item.price,
+                        )
+                    },
+                    "txid": self._gen_tx_id().upper(),
+                }
+            )
+        result = {"error": [], "result": {"orders": orders}}
+        return super().get_factory_response(result)
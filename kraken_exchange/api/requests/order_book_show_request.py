@@ -0,0 +1,50 @@
+from decimal import Decimal
+from typing import Union
+from ..abstract.request import Request
+
+
+class OrderBookShowRequest(Request):
+    AUTHENTICATE = False
+
+    pair: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
+        required=True, location="query"
+    )
+    """Asset pair to get the order book for"""
+
+    count: Union[
+        Decimal, int, str, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(required=False, min=1, max=500, location="query")
+    """
+    Default: 100
+    Maximum number of asks/bids
+    """
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "GET"
+
+    def get_path(self) -> str:
+        return "/0/public/Depth"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {
+            "error": [],
+            "result": {
+                "XXBTZUSD": {
+                    "asks": [
+                        ["30384.10000", "2.059", 1688671659],
+                        ["30387.90000", "1.500", 1688671380],
+                        ["30393.70000", "9.871", 1688671261],
+                    ],
+                    "bids": [
+                        ["30297.00000", "1.115", 1688671636],
+                        ["30296.70000", "2.002", 1688671674],
+                        ["30289.80000", "5.001", 1688671673],
+                    ],
+                }
+            },
+        }
+        return super().get_factory_response(result)
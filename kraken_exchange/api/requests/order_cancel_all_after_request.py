@@ -0,0 +1,36 @@
+from decimal import Decimal
+from typing import Union
+from ..abstract.request import Request
+
+
+class OrderCancelAllAfterRequest(Request):
+    """Starts, refreshes or stops Kraken's dead man's switch.
+
+    Every call resets a countdown of timeout seconds, after which all open
+    orders are cancelled. A timeout of 0 disables the countdown.
+    """
+
+    timeout: Union[
+        Decimal, int, str, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(required=True, min=0, max=86400, location="body")
+    """Duration in seconds to set or extend the timer by"""
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/CancelAllOrdersAfter"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {
+            "error": [],
+            "result": {
+                "currentTime": "2023-03-24T17:41:56Z",
+                "triggerTime": "2023-03-24T17:42:56Z",
+            },
+        }
+        return super().get_factory_response(result)
@@ -0,0 +1,19 @@
+from ..abstract.request import Request
+
+
+class OrderCancelAllRequest(Request):
+    """Cancels every open order on the account."""
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/CancelAll"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {"error": [], "result": {"count": 4}}
+        return super().get_factory_response(result)
@@ -0,0 +1,35 @@
+from typing import List
+from ..abstract.request import Request
+
+
+class OrderCancelBatchRequest(Request):
+    """Cancels up to 50 open orders, by txid or userref, in a single call.
+
+    Kraken only returns the number of orders cancelled, not which ones.
+    """
+
+    JSON_BODY = True
+    MAX_ITEMS: int = 50
+
+    transaction_ids = Request.Fields.ListField(
+        str, required=True, location="body", alias="orders"
+    )
+    """Txids or userrefs of the orders to cancel"""
+
+    def __init__(self, transaction_ids: List[str] | None = None):
+        super().__init__()
+        self.transaction_ids = transaction_ids if transaction_ids else list()
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/CancelOrderBatch"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {"error": [], "result": {"count": len(self.transaction_ids or [])}}
+        return super().get_factory_response(result)
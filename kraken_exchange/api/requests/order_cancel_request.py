@@ -18,3 +18,7 @@ class OrderCancelRequest(Request):
 
     def get_path(self) -> str:
         return "/0/private/CancelOrder"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {"error": [], "result": {"count": 1, "pending": False}}
+        return super().get_factory_response(result)
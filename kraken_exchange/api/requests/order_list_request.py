@@ -64,6 +64,8 @@ class OrderListRequest(Request):
         required=True, location="body"
     )
 
+    STREAM_PATH = ("result", "closed")
+
     @classmethod
     def is_child(cls) -> bool:
         return False
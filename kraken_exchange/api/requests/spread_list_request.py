@@ -5,12 +5,14 @@ from datetime import datetime
 
 
 class SpreadListRequest(Request):
+    AUTHENTICATE = False
+
     pair: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
-        required=True, location="path"
+        required=True, location="query"
     )
     since: Union[
         Decimal, int, str, datetime, Request.Fields.DecimalField, None
-    ] = Request.Fields.DecimalField(required=False, location="path")
+    ] = Request.Fields.DecimalField(required=False, location="query")
 
     @classmethod
     def is_child(cls) -> bool:
@@ -20,21 +22,18 @@ class SpreadListRequest(Request):
         return "GET"
 
     def get_path(self) -> str:
-        return "/0/public/Trades"
+        return "/0/public/Spread"
 
     def get_factory_response(self, response: dict | None = None) -> dict:
         result = {
             "error": [],
             "result": {
-                "error": [],
-                "result": {
-                    "XXBTZUSD": [
-                        [1688671834, "30292.10000", "30297.50000"],
-                        [1688671834, "30292.10000", "30296.70000"],
-                        [1688671834, "30292.70000", "30296.70000"],
-                    ],
-                    "last": 1688672106,
-                },
+                "XXBTZUSD": [
+                    [1688671834, "30292.10000", "30297.50000"],
+                    [1688671834, "30292.10000", "30296.70000"],
+                    [1688671834, "30292.70000", "30296.70000"],
+                ],
+                "last": 1688672106,
             },
         }
         return super().get_factory_response(result)
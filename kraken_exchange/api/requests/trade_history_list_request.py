@@ -0,0 +1,86 @@
+import datetime
+from decimal import Decimal
+from typing import Union
+from ..abstract.request import Request
+
+
+class TradeHistoryListRequest(Request):
+    """Lists the account's own trades, 50 at a time, most recent first."""
+
+    type: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
+        required=False,
+        location="body",
+        default=None,
+        values=[
+            "all",
+            "any position",
+            "closed position",
+            "closing position",
+            "no position",
+        ],
+    )
+    """Type of trade. Default: "all" """
+
+    include_trades = Request.Fields.BoolField(
+        required=False, location="body", default=False, alias="trades"
+    )
+    """Whether or not to include trades related to position in output"""
+
+    start: Union[
+        Decimal, int, str, datetime.datetime, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(
+        required=False, location="body", default=None, alias="start"
+    )
+    """Starting unix timestamp or trade tx ID of results (exclusive)"""
+
+    end: Union[
+        Decimal, int, str, datetime.datetime, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(
+        required=False, location="body", default=None, alias="end"
+    )
+    """Ending unix timestamp or trade tx ID of results (inclusive)"""
+
+    ofs: Union[
+        Decimal, int, str, datetime.datetime, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(
+        required=False, location="body", default=None, alias="ofs"
+    )
+    """Result offset for pagination"""
+
+    STREAM_PATH = ("result", "trades")
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/TradesHistory"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {
+            "error": [],
+            "result": {
+                "trades": {
+                    "THVRQM-33VKH-UCI7BS": {
+                        "ordertxid": "OQCLML-BW3P3-BUCMWZ",
+                        "postxid": "TKH2SE-M7IF5-CFI7LT",
+                        "pair": "XXBTZUSD",
+                        "time": 1688667796.8802,
+                        "type": "buy",
+                        "ordertype": "limit",
+                        "price": "30010.00000",
+                        "cost": "600.20000",
+                        "fee": "0.00000",
+                        "vol": "0.02000000",
+                        "margin": "0.00000",
+                        "misc": "",
+                        "maker": True,
+                    }
+                },
+                "count": 1,
+            },
+        }
+        return super().get_factory_response(result)
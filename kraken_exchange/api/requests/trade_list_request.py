@@ -5,15 +5,19 @@ from datetime import datetime
 
 
 class TradeListRequest(Request):
+    AUTHENTICATE = False
+
     pair: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
-        required=True, location="path"
+        required=True, location="query"
     )
     since: Union[
         Decimal, int, str, datetime, Request.Fields.DecimalField, None
-    ] = Request.Fields.DecimalField(required=False, location="path")
+    ] = Request.Fields.DecimalField(required=False, location="query")
     count: Union[
         Decimal, int, str, datetime, Request.Fields.DecimalField, None
-    ] = Request.Fields.DecimalField(required=False, min=1, max=1000, location="path")
+    ] = Request.Fields.DecimalField(required=False, min=1, max=1000, location="query")
+
+    STREAM_PATH = ("result", "*")
 
     @classmethod
     def is_child(cls) -> bool:
@@ -24,7 +28,7 @@ class TradeListRequest(Request):
         return "GET"
 
     def get_path(self) -> str:
-        return "/0/private/TradesHistory"
+        return "/0/public/Trades"
 
     def get_factory_response(self, response: dict | None = None) -> dict:
         result = {
@@ -0,0 +1,29 @@
+from ..abstract.request import Request
+
+
+class WebSocketTokenCreateRequest(Request):
+    """Token for the authenticated WebSocket API.
+
+    The token must be used to connect within 15 minutes, and then remains valid
+    for as long as the connection is open.
+    """
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return False
+
+    def get_method(self) -> str:
+        return "POST"
+
+    def get_path(self) -> str:
+        return "/0/private/GetWebSocketsToken"
+
+    def get_factory_response(self, response: dict | None = None) -> dict:
+        result = {
+            "error": [],
+            "result": {
+                "token": "1Dwc4lzSwNWOAwkMdqhssNNFhs1ed606d1WcF3XfEMw",
+                "expires": 900,
+            },
+        }
+        return super().get_factory_response(result)
@@ -9,39 +9,39 @@ class WithdrawalListRequest(Request):
     ] = Request.Fields.DecimalField(required=True, location="header")
     """Nonce used in construction of API-Sign header"""
 
-    asset: Union[
-        Decimal, str, None, Request.Fields.DecimalField
-    ] = Request.Fields.DecimalField(required=False, location="query")
+    asset: Union[str, None, Request.Fields.CharField] = Request.Fields.CharField(
+        required=False, location="body"
+    )
     """Filter for specific asset being withdrawn"""
 
     aclass: Union[str, None, Request.Fields.CharField] = Request.Fields.CharField(
-        required=False, default="currency", location="query"
+        required=False, default="currency", location="body"
     )
     """Filter for specific asset class being withdrawn"""
 
     method: Union[str, None, Request.Fields.CharField] = Request.Fields.CharField(
-        required=False, location="query"
+        required=False, location="body"
     )
     """Filter for specific name of withdrawal method"""
 
     start: Union[str, None, Request.Fields.CharField] = Request.Fields.CharField(
-        required=False, location="query"
+        required=False, location="body"
     )
     """Start timestamp, withdrawals created strictly before will not be included in the response"""
 
     end: Union[str, Request.Fields.CharField, None] = Request.Fields.CharField(
-        required=False, location="query"
+        required=False, location="body"
     )
     """End timestamp, withdrawals created strictly after will be not be included in the response"""
 
-    cursor: Union[bool, Request.Fields.BoolField, None] = Request.Fields.BoolField(
-        required=False, location="query"
-    )
+    cursor: Union[
+        bool, str, Request.Fields.ResponseField, None
+    ] = Request.Fields.ResponseField(required=False, location="body")
     """true/false to enable/disable paginated response (boolean) or cursor for next page of results (string), default false"""
 
-    limit: Union[bool, Request.Fields.BoolField, None] = Request.Fields.BoolField(
-        required=False, default=500, location="query"
-    )
+    limit: Union[
+        Decimal, int, str, Request.Fields.DecimalField, None
+    ] = Request.Fields.DecimalField(required=False, min=1, default=500, location="body")
     """Number of results to include per page"""
 
     @classmethod
@@ -52,39 +52,46 @@ class WithdrawalListRequest(Request):
         return "POST"
 
     def get_path(self) -> str:
-        return "/private/Withdraw"
+        return "/0/private/WithdrawStatus"
 
     def get_factory_response(self, response: dict | None = None) -> dict:
-        result = {
-            "error": [],
-            "result": [
-                {
-                    "method": "Bitcoin",
-                    "aclass": "currency",
-                    "asset": "XXBT",
-                    "refid": "FTQcuak-V6Za8qrWnhzTx67yYHz8Tg",
-                    "txid": "29323ce235cee8dae22503caba7....8ad3a506879a03b1e87992923d80428",
-                    "info": "bc1qm32pq....3ewt0j37s2g",
-                    "amount": "0.72485000",
-                    "fee": "0.00020000",
-                    "time": 1688014586,
-                    "status": "Pending",
-                    "key": "btc-wallet-1",
-                },
-                {
-                    "method": "Bitcoin",
-                    "aclass": "currency",
-                    "asset": "XXBT",
-                    "refid": "FTQcuak-V6Za8qrPnhsTx47yYLz8Tg",
-                    "txid": "29323ce212ceb2daf81255cbea8a5...ad7a626471e05e1f82929501e82934",
-                    "info": "bc1qa35ls....3egf0872h3w",
-                    "amount": "0.72485000",
-                    "fee": "0.00020000",
-                    "time": 1688015423,
-                    "status": "Failure",
-                    "status-prop": "canceled",
-                    "key": "btc-wallet-2",
-                },
-            ],
-        }
+        withdrawals = [
+            {
+                "method": "Bitcoin",
+                "aclass": "currency",
+                "asset": "XXBT",
+                "refid": "FTQcuak-V6Za8qrWnhzTx67yYHz8Tg",
+                "txid": "29323ce235cee8dae22503caba7....8ad3a506879a03b1e87992923d80428",
+                "info": "bc1qm32pq....3ewt0j37s2g",
+                "amount": "0.72485000",
+                "fee": "0.00020000",
+                "time": 1688014586,
+                "status": "Pending",
+                "key": "btc-wallet-1",
+            },
+            {
+                "method": "Bitcoin",
+                "aclass": "currency",
+                "asset": "XXBT",
+                "refid": "FTQcuak-V6Za8qrPnhsTx47yYLz8Tg",
+                "txid": "29323ce212ceb2daf81255cbea8a5...ad7a626471e05e1f82929501e82934",
+                "info": "bc1qa35ls....3egf0872h3w",
+                "amount": "0.72485000",
+                "fee": "0.00020000",
+                "time": 1688015423,
+                "status": "Failure",
+                "status-prop": "canceled",
+                "key": "btc-wallet-2",
+            },
+        ]
+
+        # Paginated responses wrap the list and add the cursor for the next page.
+        if self.cursor:
+            result = {
+                "error": [],
+                "result": {"withdrawals": withdrawals, "next_cursor": None},
+            }
+        else:
+            result = {"error": [], "result": withdrawals}
+
         return super().get_factory_response(result)
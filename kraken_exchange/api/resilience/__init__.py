@@ -0,0 +1,4 @@
+from .retry_budget import RetryBudget
+from .retry_policy import RetryPolicy
+from .retry_engine import RetryEngine
+from .idempotent_order_submitter import IdempotentOrderSubmitter
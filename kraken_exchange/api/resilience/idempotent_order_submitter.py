@@ -0,0 +1,183 @@
+import datetime
+import random
+import time
+from typing import Callable, Dict, Tuple
+from ..abstract.api_client import ApiClient
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+from ..abstract.request import Request
+from ..errors import OrderOutcomeUnknownException
+from ..requests.open_order_list_request import OpenOrderListRequest
+from ..requests.order_add_request import OrderAddRequest
+from ..requests.order_list_request import OrderListRequest
+from .retry_policy import RetryPolicy
+
+
+class IdempotentOrderSubmitter:
+    """Places orders at most once, even when AddOrder fails ambiguously.
+
+    Every order gets a userref (reference_id), generated when missing, and a
+    deadline after which Kraken's matching engine rejects it. When AddOrder
+    fails in a way that leaves its outcome unknown, such as a read timeout,
+    the submitter waits for the deadline to pass, so the order can't be placed
+    anymore, then looks it up by userref: in OpenOrders first, where a new
+    order almost always is, and in ClosedOrders since the first attempt
+    otherwise. A found order is returned as if AddOrder had succeeded, and only
+    a missing one is submitted again.
+
+    Failures where Kraken didn't act on the order are resubmitted right away,
+    and any other error is raised. The userref must be unique among recent
+    orders for the lookup to be reliable.
+
+    Lookups that fail are retried as the policy allows. When they keep
+    failing, OrderOutcomeUnknownException is raised with the userref, and
+    submitting the same request again looks the order up first. Orders whose
+    outcome became unknown elsewhere, such as in an OrderBatcher, are
+    resubmitted with since set to when they were sent.
+    """
+
+    USERREF_RANGE: Tuple[int, int] = (1, 2**31 - 1)
+    """userref is a signed 32 bit integer"""
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+        client: ApiClient | None = None,
+        policy: RetryPolicy | None = None,
+        deadline: float = 2.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.client = client
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.deadline = deadline
+        """Seconds Kraken has to accept each attempt, between 0.5 and 60"""
+
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random.SystemRandom()
+
+        self.reconciled_count = 0
+        """Ambiguous failures where the order turned out to be placed"""
+
+        self.resubmitted_count = 0
+
+        self._unknown: Dict[str, float] = {}
+        """When each order of unknown outcome was first sent, by userref"""
+
+    def _submit(self, request: Request) -> dict:
+        self.rate_limiter.acquire(ApiClient.get_cost(request))
+        return request.submit(
+            use_mock=self.use_mock,
+            nonce=self.nonce_generator.next(),
+            api_key=self.api_key,
+            security_key=self.security_key,
+            client=self.client,
+        )
+
+    @classmethod
+    def format_deadline(cls, timestamp: float) -> str:
+        return (
+            datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z")
+        )
+
+    def find_order(self, userref: str, since: float) -> dict | None:
+        """Looks an order up by userref, returning an AddOrder shaped result."""
+        for request in (OpenOrderListRequest(), OrderListRequest()):
+            request.userref = userref
+            if isinstance(request, OrderListRequest):
+                request.start = int(since) - 1
+            response = self._submit(request)
+            orders = response.get("open" if "open" in response else "closed") or {}
+            found = {
+                txid: order
+                for txid, order in orders.items()
+                if str(order.get("userref")) == str(userref)
+            }
+            if len(found) > 0:
+                return {
+                    "descr": next(iter(found.values())).get("descr"),
+                    "txid": list(found.keys()),
+                }
+        return None
+
+    def reconcile(self, userref: str, since: float) -> dict | None:
+        """Looks up an order of unknown outcome, first sent at since.
+
+        Returns the order as find_order() does, or None when it wasn't placed.
+        Failed lookups are retried as the policy allows, after which
+        OrderOutcomeUnknownException is raised.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                found = self.find_order(userref, since)
+                break
+            except Exception as e:
+                if (
+                    not self.policy.is_retryable(e, OpenOrderListRequest())
+                    or attempt >= self.policy.max_attempts
+                    or not self.policy.budget.try_withdraw()
+                ):
+                    self._unknown[userref] = since
+                    raise OrderOutcomeUnknownException(userref, since) from e
+            self._sleep(self.policy.get_delay(attempt))
+
+        self._unknown.pop(userref, None)
+        if found is not None:
+            self.reconciled_count += 1
+        return found
+
+    def submit(self, request: OrderAddRequest, since: float | None = None) -> dict:
+        """Places the order at most once.
+
+        With since, or when an earlier submit() of the same userref ended with
+        an unknown outcome, the order is looked up before it is sent again.
+        """
+        if request.reference_id is None:
+            request.reference_id = str(self._random.randint(*self.USERREF_RANGE))
+        userref = str(request.reference_id)
+        if since is None:
+            since = self._unknown.get(userref)
+        if since is not None:
+            found = self.reconcile(userref, since)
+            if found is not None:
+                return found
+
+        first_attempt = since if since is not None else self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            expires = self._clock() + self.deadline
+            request.deadline = self.format_deadline(expires)
+            try:
+                return self._submit(request)
+            except Exception as e:
+                if self.policy.is_ambiguous(e) and not self.policy.is_safe(e):
+                    # Past the deadline the order is either placed or never will be.
+                    self._unknown[userref] = first_attempt
+                    self._sleep(max(0.0, expires - self._clock()))
+                    found = self.reconcile(userref, first_attempt)
+                    if found is not None:
+                        return found
+                elif not self.policy.is_safe(e):
+                    raise
+                if attempt >= self.policy.max_attempts:
+                    raise
+
+            self.resubmitted_count += 1
+            self._sleep(self.policy.get_delay(attempt))
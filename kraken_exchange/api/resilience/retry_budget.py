@@ -0,0 +1,33 @@
+import threading
+
+
+class RetryBudget:
+    """Caps retries to a fraction of requests, so an outage isn't made worse.
+
+    Every request adds ratio to the budget, up to max_tokens, and every retry
+    takes 1 from it. While Kraken is healthy the budget fills up; during an
+    outage retries stop once it runs out, instead of multiplying the load.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10) -> None:
+        self.ratio = ratio
+        self.max_tokens = float(max_tokens)
+        self._tokens = float(max_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Called once per request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Takes one retry from the budget, if there is one left."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
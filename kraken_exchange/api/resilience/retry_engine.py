@@ -0,0 +1,75 @@
+import time
+from typing import Callable, Union
+from ..abstract.api_client import ApiClient
+from ..abstract.api_model import ApiModel
+from ..abstract.api_model_base import ApiModelBase
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+from ..abstract.request import Request
+from .retry_policy import RetryPolicy
+
+
+class RetryEngine:
+    """Submits requests, retrying the failures its RetryPolicy allows.
+
+    Every attempt waits for the RateLimiter and uses a new nonce, so it is
+    signed again; retrying with the nonce of a failed attempt would only earn
+    an invalid nonce error. When the retries or the budget run out, the last
+    error is raised.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        policy: RetryPolicy | None = None,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+        client: ApiClient | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.client = client
+        self._sleep = sleep
+
+        self.attempt_count = 0
+        self.retry_count = 0
+        self.exhausted_count = 0
+        """Requests that failed with a retryable error but had no retries left"""
+
+    def submit(self, request: Request) -> Union[dict, ApiModel, ApiModelBase]:
+        self.policy.budget.deposit()
+        cost = ApiClient.get_cost(request)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.attempt_count += 1
+            self.rate_limiter.acquire(cost)
+            try:
+                return request.submit(
+                    use_mock=self.use_mock,
+                    nonce=self.nonce_generator.next(),
+                    api_key=self.api_key,
+                    security_key=self.security_key,
+                    client=self.client,
+                )
+            except Exception as e:
+                if not self.policy.is_retryable(e, request):
+                    raise
+                if (
+                    attempt >= self.policy.max_attempts
+                    or not self.policy.budget.try_withdraw()
+                ):
+                    self.exhausted_count += 1
+                    raise
+
+            self.retry_count += 1
+            self._sleep(self.policy.get_delay(attempt))
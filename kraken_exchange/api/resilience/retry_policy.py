@@ -0,0 +1,105 @@
+import random
+import requests
+from ..abstract.request import Request
+from ..errors import (
+    DomainRateLimitExceededException,
+    FundingBusyException,
+    InvalidNonceException,
+    RateLimitExceededException,
+    RequestFailedException,
+    ServiceErrorException,
+    ServiceUnavailableException,
+)
+from ..requests.order_add_batch_request import OrderAddBatchRequest
+from ..requests.order_add_request import OrderAddRequest
+from ..requests.order_edit_request import OrderEditRequest
+from ..requests.withdrawal_create_request import WithdrawalCreateRequest
+from .retry_budget import RetryBudget
+
+
+class RetryPolicy:
+    """Decides which failures are retried, and how long to wait before each retry.
+
+    Errors in SAFE_ERRORS mean Kraken didn't act on the request, so they are
+    retried for every request. Errors in AMBIGUOUS_ERRORS (timeouts, dropped
+    connections, internal errors) may come after the request took effect, so
+    they are only retried for idempotent requests: placing an order twice is
+    worse than reporting the failure. Anything else is fatal.
+
+    Delays grow exponentially from base_delay up to max_delay, with full jitter
+    so that clients failing together don't retry together.
+    """
+
+    SAFE_ERRORS = (
+        ServiceUnavailableException,
+        FundingBusyException,
+        InvalidNonceException,
+        RateLimitExceededException,
+        DomainRateLimitExceededException,
+        requests.ConnectTimeout,
+    )
+
+    AMBIGUOUS_ERRORS = (
+        ServiceErrorException,
+        requests.ConnectionError,
+        requests.Timeout,
+    )
+
+    SAFE_STATUS_CODES = (429,)
+    AMBIGUOUS_STATUS_CODES = (500, 502, 503, 504)
+
+    NON_IDEMPOTENT_REQUESTS = (
+        OrderAddRequest,
+        OrderAddBatchRequest,
+        OrderEditRequest,
+        WithdrawalCreateRequest,
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.25,
+        max_delay: float = 8.0,
+        budget: RetryBudget | None = None,
+        random_generator: random.Random | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        """Attempts per request, including the first one"""
+
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+        self.random = (
+            random_generator if random_generator is not None else random.Random()
+        )
+
+    @classmethod
+    def is_idempotent(cls, request: Request) -> bool:
+        return not isinstance(request, cls.NON_IDEMPOTENT_REQUESTS)
+
+    @classmethod
+    def is_safe(cls, error: Exception) -> bool:
+        """Whether the error means Kraken didn't act on the request"""
+        if isinstance(error, RequestFailedException):
+            return error.response.status_code in cls.SAFE_STATUS_CODES
+        return isinstance(error, cls.SAFE_ERRORS)
+
+    @classmethod
+    def is_ambiguous(cls, error: Exception) -> bool:
+        """Whether the request may have taken effect despite the error"""
+        if isinstance(error, RequestFailedException):
+            return error.response.status_code in cls.AMBIGUOUS_STATUS_CODES
+        return isinstance(error, cls.AMBIGUOUS_ERRORS)
+
+    def is_retryable(self, error: Exception, request: Request) -> bool:
+        if self.is_safe(error):
+            return True
+        return self.is_ambiguous(error) and self.is_idempotent(request)
+
+    def get_delay(self, attempt: int) -> float:
+        """Seconds to wait after the given failed attempt (starting at 1)"""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return self.random.uniform(0, ceiling)
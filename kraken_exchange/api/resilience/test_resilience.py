@@ -0,0 +1,214 @@
+import pytest
+import requests
+from ..abstract.api_client import ApiClient
+from ..abstract.circuit_breaker import CircuitBreaker
+from ..abstract.request import Request
+from ..errors import (
+    CircuitOpenException,
+    InvalidKeyException,
+    OrderOutcomeUnknownException,
+    ServiceUnavailableException,
+)
+from ..requests import OpenOrderListRequest, OrderAddRequest, OrderListRequest
+from .idempotent_order_submitter import IdempotentOrderSubmitter
+from .retry_budget import RetryBudget
+from .retry_engine import RetryEngine
+from .retry_policy import RetryPolicy
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def get_failing_client(errors: list, nonces: list, failing=Request) -> ApiClient:
+    """A client raising the given errors, in order, for the failing requests."""
+
+    class FailingClient(ApiClient):
+        def submit(self, request, nonce, **kwargs):
+            nonces.append(nonce)
+            if len(errors) > 0 and isinstance(request, failing):
+                raise errors.pop(0)
+            return super().submit(request=request, nonce=nonce, **kwargs)
+
+    return FailingClient()
+
+
+def get_engine(errors: list, nonces: list, **kwargs) -> RetryEngine:
+    return RetryEngine(
+        API_KEY,
+        SECURITY_KEY,
+        use_mock=True,
+        client=get_failing_client(errors, nonces),
+        sleep=lambda seconds: None,
+        **kwargs,
+    )
+
+
+def test_retries_use_fresh_nonces():
+    nonces: list = []
+    engine = get_engine([ServiceUnavailableException(), requests.ReadTimeout()], nonces)
+    assert "closed" in engine.submit(OrderListRequest())
+    assert engine.retry_count == 2
+    assert len(set(nonces)) == 3
+
+
+def test_fatal_and_ambiguous_errors():
+    nonces: list = []
+    engine = get_engine([InvalidKeyException()], nonces)
+    with pytest.raises(InvalidKeyException):
+        engine.submit(OrderListRequest())
+
+    # A timed out AddOrder may have been placed, so it isn't retried.
+    engine = get_engine([requests.ReadTimeout()], nonces)
+    with pytest.raises(requests.ReadTimeout):
+        engine.submit(OrderAddRequest())
+    assert engine.retry_count == 0
+
+    # Kraken being unavailable means it wasn't.
+    engine = get_engine([ServiceUnavailableException()], nonces)
+    assert engine.submit(OrderAddRequest())["txid"]
+
+
+def test_retry_budget_and_attempts_are_capped():
+    nonces: list = []
+    policy = RetryPolicy(max_attempts=3, budget=RetryBudget(max_tokens=10))
+    engine = get_engine([ServiceUnavailableException()] * 5, nonces, policy=policy)
+    with pytest.raises(ServiceUnavailableException):
+        engine.submit(OrderListRequest())
+    assert engine.attempt_count == 3 and engine.exhausted_count == 1
+
+    policy = RetryPolicy(budget=RetryBudget(max_tokens=1))
+    engine = get_engine([ServiceUnavailableException()] * 5, nonces, policy=policy)
+    with pytest.raises(ServiceUnavailableException):
+        engine.submit(OrderListRequest())
+    assert engine.retry_count == 1
+
+    delays = [policy.get_delay(attempt) for attempt in range(1, 10)]
+    assert all(0 <= delay <= policy.max_delay for delay in delays)
+
+
+def get_submitter(
+    errors: list, nonces: list, failing=OrderAddRequest
+) -> IdempotentOrderSubmitter:
+    return IdempotentOrderSubmitter(
+        API_KEY,
+        SECURITY_KEY,
+        use_mock=True,
+        client=get_failing_client(errors, nonces, failing),
+        sleep=lambda seconds: None,
+    )
+
+
+def test_ambiguous_add_order_is_reconciled_by_userref():
+    nonces: list = []
+    # The mocked OpenOrders response holds an order with userref 1.
+    submitter = get_submitter([requests.ReadTimeout()], nonces)
+    request = OrderAddRequest()
+    request.reference_id = "1"
+    assert submitter.submit(request)["txid"] == ["OQCLML-BW3P3-BUCMWZ"]
+    assert submitter.reconciled_count == 1
+    assert submitter.resubmitted_count == 0
+    assert request.deadline.endswith("Z")
+
+    # An order found nowhere is submitted again.
+    submitter = get_submitter([requests.ReadTimeout()], nonces)
+    request = OrderAddRequest()
+    assert submitter.submit(request)["txid"] == ["OU22CG-KLAF2-FWUDD7"]
+    assert int(request.reference_id) > 0
+    assert submitter.reconciled_count == 0
+    assert submitter.resubmitted_count == 1
+
+
+def test_failed_lookups_leave_the_outcome_unknown():
+    nonces: list = []
+    failing = (OrderAddRequest, OpenOrderListRequest)
+    # A lookup failing once is retried.
+    errors = [requests.ReadTimeout(), ServiceUnavailableException()]
+    submitter = get_submitter(errors, nonces, failing)
+    request = OrderAddRequest()
+    request.reference_id = "1"
+    assert submitter.submit(request)["txid"] == ["OQCLML-BW3P3-BUCMWZ"]
+
+    errors = [requests.ReadTimeout()] + [ServiceUnavailableException()] * 4
+    submitter = get_submitter(errors, nonces, failing)
+    request = OrderAddRequest()
+    request.reference_id = "1"
+    with pytest.raises(OrderOutcomeUnknownException) as raised:
+        submitter.submit(request)
+    assert raised.value.userref == "1" and raised.value.sent_at is not None
+
+    # Submitting it again looks the order up instead of sending AddOrder.
+    nonces.clear()
+    assert submitter.submit(request)["txid"] == ["OQCLML-BW3P3-BUCMWZ"]
+    assert len(nonces) == 1 and submitter.reconciled_count == 1
+
+
+def test_circuit_breaker_states():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        reset_timeout=10,
+        latency_threshold=1.0,
+        clock=lambda: now[0],
+    )
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    # A slow success counts as a failure.
+    breaker.record_success(5.0)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.get_retry_after() == 10
+
+    now[0] = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.trip_count == 2
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_api_client_fails_fast_while_open():
+    calls: list = []
+
+    class FailingSession:
+        def post(self, url, **kwargs):
+            calls.append(kwargs["timeout"])
+            raise requests.ConnectionError("connection refused")
+
+    class BreakingClient(ApiClient):
+        SESSION = FailingSession()
+        CIRCUIT_BREAKERS: dict = {}
+
+        @classmethod
+        def create_circuit_breaker(cls, group):
+            return CircuitBreaker(failure_threshold=2)
+
+    def submit(request):
+        return request.submit(
+            use_mock=False,
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            client=BreakingClient(),
+        )
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            submit(OrderAddRequest())
+    with pytest.raises(CircuitOpenException) as error:
+        submit(OrderAddRequest())
+    assert error.value.group == "trading"
+    assert calls == [ApiClient.TIMEOUT] * 2
+
+    # Other endpoint groups are unaffected.
+    with pytest.raises(requests.ConnectionError):
+        submit(OrderListRequest())
+    assert ApiClient.get_endpoint_group("/0/private/WithdrawStatus") == "funding"
+    assert ApiClient.get_endpoint_group("/0/public/Ticker") == "public"
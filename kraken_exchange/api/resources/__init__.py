@@ -0,0 +1,11 @@
+from .compact_record import CompactRecord
+from .order import Order
+from .trade import Trade
+from .ticker import Ticker
+from .record_table import RecordTable
+from .order_table import OrderTable
+from .trade_table import TradeTable
+from .order_description import OrderDescription
+from .order_info import OrderInfo
+from .closed_order_list import ClosedOrderList
+from .open_order_list import OpenOrderList
@@ -0,0 +1,28 @@
+from decimal import Decimal
+from typing import Union
+from ..abstract.model_map import ModelMap
+from ..abstract.response import Response
+from .order_info import OrderInfo
+
+
+class ClosedOrderList(Response):
+    """A ClosedOrders result, with each order built on first access.
+
+    Set as the RESPONSE_CLASS of OrderListRequest to get it instead of a dict.
+    """
+
+    LAZY = True
+
+    closed: Union[ModelMap, Response.Fields.MapField, None] = Response.Fields.MapField(
+        OrderInfo
+    )
+    """Orders by txid"""
+
+    count: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    """Number of orders matching the criteria"""
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
@@ -0,0 +1,78 @@
+import sys
+from decimal import Decimal
+from typing import Any, Tuple
+
+
+class CompactRecord:
+    """A response record held in __slots__ instead of a dict.
+
+    Prices, volumes and costs are fixed-point ints with SCALE decimals, so
+    "30010.00000" is stored as 3001000000000. Strings that repeat across
+    records (statuses, types, pairs) are interned, so every record shares one
+    copy. Subclasses list their fields in COLUMNS, as (name, kind) pairs, in
+    the order of __slots__.
+    """
+
+    FIXED: str = "fixed"
+    FLOAT: str = "float"
+    INT: str = "int"
+    CATEGORY: str = "category"
+    TEXT: str = "text"
+
+    SCALE: int = 8
+    """Decimals of fixed-point values; Kraken sends at most 8"""
+
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()
+
+    __slots__ = ()
+
+    def __init__(self, *values: Any) -> None:
+        for (name, _), value in zip(self.COLUMNS, values):
+            setattr(self, name, value)
+
+    @classmethod
+    def to_fixed(cls, value: Any) -> int:
+        """Converts a decimal string (or number) to a fixed-point int, truncating."""
+        if value is None or value == "":
+            return 0
+        text = str(value)
+        if "e" in text or "E" in text:
+            return int(Decimal(text).scaleb(cls.SCALE))
+        negative = text.startswith("-")
+        whole, _, fraction = text.lstrip("+-").partition(".")
+        fixed = int((whole or "0") + (fraction + "0" * cls.SCALE)[: cls.SCALE])
+        return -fixed if negative else fixed
+
+    @classmethod
+    def to_decimal(cls, fixed: int) -> Decimal:
+        return Decimal(fixed).scaleb(-cls.SCALE)
+
+    @classmethod
+    def intern(cls, value: Any) -> str:
+        return sys.intern(str(value)) if value is not None else ""
+
+    def get_decimal(self, name: str) -> Decimal:
+        """A fixed-point field as a Decimal"""
+        return self.to_decimal(getattr(self, name))
+
+    def get_values(self) -> tuple:
+        return tuple(getattr(self, name) for name, _ in self.COLUMNS)
+
+    def to_dict(self) -> dict:
+        """The fields by name, with fixed-point fields as Decimals"""
+        return {
+            name: self.to_decimal(value) if kind == self.FIXED else value
+            for (name, kind), value in zip(self.COLUMNS, self.get_values())
+        }
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.get_values() == self.get_values()
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(
+            self.__class__.__name__,
+            ", ".join(
+                "{0}={1!r}".format(name, value)
+                for (name, _), value in zip(self.COLUMNS, self.get_values())
+            ),
+        )
@@ -0,0 +1,23 @@
+from typing import Union
+from ..abstract.model_map import ModelMap
+from ..abstract.response import Response
+from .order_info import OrderInfo
+
+
+class OpenOrderList(Response):
+    """An OpenOrders result, with each order built on first access.
+
+    Set as the RESPONSE_CLASS of OpenOrderListRequest to get it instead of a
+    dict.
+    """
+
+    LAZY = True
+
+    open: Union[ModelMap, Response.Fields.MapField, None] = Response.Fields.MapField(
+        OrderInfo
+    )
+    """Orders by txid"""
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
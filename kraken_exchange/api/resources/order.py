@@ -0,0 +1,59 @@
+from typing import Tuple
+from .compact_record import CompactRecord
+
+
+class Order(CompactRecord):
+    """An order from ClosedOrders, OpenOrders or QueryOrders, with descr flattened."""
+
+    COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ("txid", CompactRecord.TEXT),
+        ("userref", CompactRecord.INT),
+        ("status", CompactRecord.CATEGORY),
+        ("reason", CompactRecord.CATEGORY),
+        ("open_time", CompactRecord.FLOAT),
+        ("close_time", CompactRecord.FLOAT),
+        ("pair", CompactRecord.CATEGORY),
+        ("type", CompactRecord.CATEGORY),
+        ("order_type", CompactRecord.CATEGORY),
+        ("price", CompactRecord.FIXED),
+        ("price2", CompactRecord.FIXED),
+        ("leverage", CompactRecord.CATEGORY),
+        ("volume", CompactRecord.FIXED),
+        ("executed_volume", CompactRecord.FIXED),
+        ("cost", CompactRecord.FIXED),
+        ("fee", CompactRecord.FIXED),
+        ("average_price", CompactRecord.FIXED),
+        ("stop_price", CompactRecord.FIXED),
+        ("limit_price", CompactRecord.FIXED),
+        ("misc", CompactRecord.CATEGORY),
+        ("oflags", CompactRecord.CATEGORY),
+    )
+
+    __slots__ = tuple(name for name, _ in COLUMNS)
+
+    @classmethod
+    def from_dict(cls, txid: str, values: dict) -> "Order":
+        descr = values.get("descr") or {}
+        return cls(
+            txid,
+            int(values.get("userref") or 0),
+            cls.intern(values.get("status")),
+            cls.intern(values.get("reason")),
+            float(values.get("opentm") or 0),
+            float(values.get("closetm") or 0),
+            cls.intern(descr.get("pair")),
+            cls.intern(descr.get("type")),
+            cls.intern(descr.get("ordertype")),
+            cls.to_fixed(descr.get("price")),
+            cls.to_fixed(descr.get("price2")),
+            cls.intern(descr.get("leverage")),
+            cls.to_fixed(values.get("vol")),
+            cls.to_fixed(values.get("vol_exec")),
+            cls.to_fixed(values.get("cost")),
+            cls.to_fixed(values.get("fee")),
+            cls.to_fixed(values.get("price")),
+            cls.to_fixed(values.get("stopprice")),
+            cls.to_fixed(values.get("limitprice")),
+            cls.intern(values.get("misc")),
+            cls.intern(values.get("oflags")),
+        )
@@ -0,0 +1,31 @@
+from decimal import Decimal
+from typing import Union
+from ..abstract.response import Response
+
+
+class OrderDescription(Response):
+    """The descr of an order in ClosedOrders or OpenOrders, decoded lazily."""
+
+    LAZY = True
+
+    pair: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    type: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    order_type: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField(
+        alias="ordertype"
+    )
+    price: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    price2: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    leverage: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    order: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    """Order description, e.g. "buy 0.00100000 XBTGBP @ limit 23667.0\""""
+
+    close: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    """Conditional close order description, if any"""
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
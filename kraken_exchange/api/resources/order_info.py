@@ -0,0 +1,64 @@
+from decimal import Decimal
+from typing import Union
+from ..abstract.response import Response
+from .order_description import OrderDescription
+
+
+class OrderInfo(Response):
+    """An order in ClosedOrders or OpenOrders, decoded lazily.
+
+    Fields are converted from the response on first access, so reading the
+    status of every order doesn't convert any of their prices.
+    """
+
+    LAZY = True
+
+    refid: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    userref: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    status: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    reason: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    open_time: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="opentm")
+    close_time: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="closetm")
+    start_time: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="starttm")
+    expire_time: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="expiretm")
+    description: Union[
+        OrderDescription, Response.Fields.ChildModelField, None
+    ] = Response.Fields.ChildModelField(OrderDescription, alias="descr")
+    volume: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="vol")
+    executed_volume: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="vol_exec")
+    cost: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    fee: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField()
+    average_price: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="price")
+    stop_price: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="stopprice")
+    limit_price: Union[
+        Decimal, Response.Fields.DecimalField, None
+    ] = Response.Fields.DecimalField(alias="limitprice")
+    misc: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    oflags: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+    trigger: Union[str, Response.Fields.CharField, None] = Response.Fields.CharField()
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
@@ -0,0 +1,10 @@
+from typing import Tuple
+from .order import Order
+from .record_table import RecordTable
+
+
+class OrderTable(RecordTable):
+    """Orders from ClosedOrders or OpenOrders responses, column by column."""
+
+    RECORD_CLASS: type = Order
+    RESULT_KEYS: Tuple[str, ...] = ("closed", "open")
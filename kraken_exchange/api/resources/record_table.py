@@ -0,0 +1,102 @@
+from array import array
+from typing import Any, Dict, Iterator, List, Tuple
+from .compact_record import CompactRecord
+
+
+class RecordTable:
+    """Records of one type held column by column in typed arrays.
+
+    Fixed-point and int columns are int64 arrays, float columns float64
+    arrays, and category columns 2 byte codes into one shared list of
+    interned strings, so a record costs a few dozen bytes plus its txids
+    instead of a dict of dicts. Records are rebuilt when they are read. A
+    column turns into a plain list when a value doesn't fit its array, such
+    as a volume of more than 92 billion units.
+
+    Subclasses set RECORD_CLASS, and RESULT_KEYS, the keys of the response
+    holding the records by txid.
+    """
+
+    RECORD_CLASS: type = CompactRecord
+    RESULT_KEYS: Tuple[str, ...] = ()
+
+    TYPECODES: Dict[str, str] = {
+        CompactRecord.FIXED: "q",
+        CompactRecord.INT: "q",
+        CompactRecord.FLOAT: "d",
+        CompactRecord.CATEGORY: "H",
+    }
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array | list] = {
+            name: array(self.TYPECODES[kind]) if kind in self.TYPECODES else []
+            for name, kind in self.RECORD_CLASS.COLUMNS
+        }
+        self.categories: List[str] = []
+        """Distinct strings of every category column, by code"""
+
+        self._codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_response(cls, response: dict) -> "RecordTable":
+        """Decodes a response (the "result" dict)."""
+        table = cls()
+        table.extend(response)
+        return table
+
+    def _get_code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    @classmethod
+    def fits(cls, column: array | list, value: Any) -> bool:
+        """Whether the value can be appended to the column as it is."""
+        if not isinstance(column, array):
+            return True
+        try:
+            array(column.typecode, [value])
+            return True
+        except (OverflowError, TypeError):
+            return False
+
+    def append(self, record: CompactRecord) -> None:
+        values = []
+        for (name, kind), value in zip(self.RECORD_CLASS.COLUMNS, record.get_values()):
+            if kind == CompactRecord.CATEGORY:
+                value = self._get_code(value)
+            if not self.fits(self.columns[name], value):
+                self.columns[name] = list(self.columns[name])
+            values.append(value)
+
+        # Every value fits by now, so the columns keep the same length.
+        for (name, _), value in zip(self.RECORD_CLASS.COLUMNS, values):
+            self.columns[name].append(value)
+
+    def extend(self, response: dict) -> None:
+        """Appends the records of a response, e.g. one page of ClosedOrders."""
+        for key in self.RESULT_KEYS:
+            for txid, values in (response.get(key) or {}).items():
+                self.append(self.RECORD_CLASS.from_dict(txid, values))
+
+    def get_column(self, name: str) -> array | list:
+        """A column as stored: fixed-point ints, category codes, etc."""
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(self.columns[self.RECORD_CLASS.COLUMNS[0][0]])
+
+    def __getitem__(self, index: int) -> CompactRecord:
+        values = []
+        for name, kind in self.RECORD_CLASS.COLUMNS:
+            value = self.columns[name][index]
+            if kind == CompactRecord.CATEGORY:
+                value = self.categories[value]
+            values.append(value)
+        return self.RECORD_CLASS(*values)
+
+    def __iter__(self) -> Iterator[CompactRecord]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,179 @@
+import json
+import sys
+import tracemalloc
+from decimal import Decimal
+from ..abstract.response import Response
+from ..requests import (
+    OpenOrderListRequest,
+    OrderListRequest,
+    TickerShowRequest,
+    TradeHistoryListRequest,
+)
+from .closed_order_list import ClosedOrderList
+from .open_order_list import OpenOrderList
+from .order import Order
+from .order_table import OrderTable
+from .ticker import Ticker
+from .trade_table import TradeTable
+
+
+class CountingDecimalField(Response.Fields.DecimalField):
+    conversions = 0
+
+    def check_value(self, value):
+        CountingDecimalField.conversions += 1
+        return super().check_value(value)
+
+
+class LazyDescription(Response):
+    LAZY = True
+    pair = Response.Fields.CharField()
+    price = CountingDecimalField()
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
+
+
+class LazyOrder(Response):
+    LAZY = True
+    volume = CountingDecimalField(alias="vol")
+    cost = CountingDecimalField()
+    description = Response.Fields.ChildModelField(LazyDescription, alias="descr")
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
+
+
+class LazyClosedOrders(Response):
+    LAZY = True
+    closed = Response.Fields.MapField(LazyOrder)
+    count = Response.Fields.DecimalField()
+
+    @classmethod
+    def is_child(cls) -> bool:
+        return True
+
+
+def get_closed_orders(count: int) -> dict:
+    return {
+        "closed": {
+            "O{0}".format(i): {
+                "vol": "1.5",
+                "cost": str(i),
+                "descr": {"pair": "XBTUSD", "price": "30000"},
+            }
+            for i in range(count)
+        },
+        "count": count,
+    }
+
+
+def test_lazy_models_convert_fields_on_first_access():
+    CountingDecimalField.conversions = 0
+    closed_orders = LazyClosedOrders(values=get_closed_orders(5000))
+    assert CountingDecimalField.conversions == 0
+
+    assert len(closed_orders.closed) == 5000
+    order = closed_orders.closed["O42"]
+    assert order is closed_orders.closed["O42"]
+    assert order.volume == Decimal("1.5")
+    assert order.volume == Decimal("1.5")
+    assert CountingDecimalField.conversions == 1
+
+    assert order.description.pair == "XBTUSD"
+    assert CountingDecimalField.conversions == 1
+
+    order.volume = Decimal("2")
+    assert order.volume == Decimal("2")
+    assert order.__dict__["cost"] == "42"
+    assert CountingDecimalField.conversions == 3
+
+
+def test_order_lists_decode_lazily():
+    class LazyOrderListRequest(OrderListRequest):
+        RESPONSE_CLASS = ClosedOrderList
+
+    closed_orders = LazyOrderListRequest().submit(
+        use_mock=True, nonce="1", api_key="key", security_key="c2VjcmV0"
+    )
+    assert isinstance(closed_orders, ClosedOrderList)
+    assert closed_orders.count == 2
+    order = closed_orders.closed["O37652-RJWRT-IMO74O"]
+    assert "volume" not in order._values
+    assert order.volume == Decimal("0.001")
+    assert order.description.order_type == "stop-loss-limit"
+
+    response = OpenOrderListRequest().get_factory_response()["result"]
+    open_orders = OpenOrderList(values=response)
+    assert set(open_orders.open) == set(response["open"])
+    txid, order = next(iter(response["open"].items()))
+    assert open_orders.open[txid].status == order["status"]
+    assert open_orders.__dict__["open"][txid]["description"]["pair"] == (
+        order["descr"]["pair"]
+    )
+
+
+def test_compact_records():
+    closed = OrderListRequest().get_factory_response()["result"]
+    order = Order.from_dict(*next(iter(closed["closed"].items())))
+    assert order.price == 2366700000000
+    assert order.get_decimal("volume") == Decimal("0.001")
+    assert order.status is sys.intern("canceled")
+    assert not hasattr(order, "__dict__")
+
+    tickers = Ticker.from_response(TickerShowRequest().get_factory_response()["result"])
+    assert tickers["XXBTZUSD"].get_decimal("ask") == Decimal("30300.1")
+    assert tickers["XXBTZUSD"].trades_24h == 38907
+
+    trades = TradeTable.from_response(
+        TradeHistoryListRequest().get_factory_response()["result"]
+    )
+    assert trades[0].to_dict()["price"] == Decimal("30010")
+    assert Order.to_fixed("-1.5") == -150000000
+    assert Order.to_fixed("1E-8") == 1
+
+
+def test_order_table_is_compact():
+    order = next(
+        iter(OpenOrderListRequest().get_factory_response()["result"]["open"].values())
+    )
+    text = json.dumps(
+        {
+            "open": {
+                "O{0:06d}-ABCDE-FGHIJK".format(i): dict(order, cost=str(i))
+                for i in range(5000)
+            }
+        }
+    )
+
+    tracemalloc.start()
+    try:
+        decoded = json.loads(text)
+        decoded_size = tracemalloc.get_traced_memory()[0]
+        table = OrderTable.from_response(decoded)
+        table_size = tracemalloc.get_traced_memory()[0] - decoded_size
+    finally:
+        tracemalloc.stop()
+
+    assert len(table) == 5000
+    assert table_size * 4 < decoded_size
+    assert table.categories.count("open") == 1
+    assert table[1234] == Order.from_dict(
+        "O001234-ABCDE-FGHIJK", decoded["open"]["O001234-ABCDE-FGHIJK"]
+    )
+    assert [record.cost for record in table][-1] == 4999 * 10**Order.SCALE
+
+
+def test_order_table_keeps_values_out_of_array_range():
+    orders = OrderListRequest().get_factory_response()["result"]["closed"]
+    txid, order = next(iter(orders.items()))
+    table = OrderTable.from_response(
+        {"closed": {txid: order, "X": dict(order, vol="200000000000")}}
+    )
+
+    assert len({len(column) for column in table.columns.values()}) == 1
+    assert isinstance(table.get_column("volume"), list)
+    assert table[1].get_decimal("volume") == Decimal("200000000000")
+    assert table[0] == Order.from_dict(txid, order)
@@ -0,0 +1,66 @@
+from typing import Dict, Tuple
+from .compact_record import CompactRecord
+
+
+class Ticker(CompactRecord):
+    """A pair's entry in a Ticker response."""
+
+    COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ("pair", CompactRecord.CATEGORY),
+        ("ask", CompactRecord.FIXED),
+        ("ask_volume", CompactRecord.FIXED),
+        ("bid", CompactRecord.FIXED),
+        ("bid_volume", CompactRecord.FIXED),
+        ("last", CompactRecord.FIXED),
+        ("last_volume", CompactRecord.FIXED),
+        ("volume_today", CompactRecord.FIXED),
+        ("volume_24h", CompactRecord.FIXED),
+        ("vwap_today", CompactRecord.FIXED),
+        ("vwap_24h", CompactRecord.FIXED),
+        ("trades_today", CompactRecord.INT),
+        ("trades_24h", CompactRecord.INT),
+        ("low_today", CompactRecord.FIXED),
+        ("low_24h", CompactRecord.FIXED),
+        ("high_today", CompactRecord.FIXED),
+        ("high_24h", CompactRecord.FIXED),
+        ("open", CompactRecord.FIXED),
+    )
+
+    __slots__ = tuple(name for name, _ in COLUMNS)
+
+    @classmethod
+    def from_dict(cls, pair: str, values: dict) -> "Ticker":
+        fixed = cls.to_fixed
+        ask = values.get("a") or [None, None, None]
+        bid = values.get("b") or [None, None, None]
+        last = values.get("c") or [None, None]
+        volume = values.get("v") or [None, None]
+        vwap = values.get("p") or [None, None]
+        trades = values.get("t") or [0, 0]
+        low = values.get("l") or [None, None]
+        high = values.get("h") or [None, None]
+        return cls(
+            cls.intern(pair),
+            fixed(ask[0]),
+            fixed(ask[2]),
+            fixed(bid[0]),
+            fixed(bid[2]),
+            fixed(last[0]),
+            fixed(last[1]),
+            fixed(volume[0]),
+            fixed(volume[1]),
+            fixed(vwap[0]),
+            fixed(vwap[1]),
+            int(trades[0]),
+            int(trades[1]),
+            fixed(low[0]),
+            fixed(low[1]),
+            fixed(high[0]),
+            fixed(high[1]),
+            fixed(values.get("o")),
+        )
+
+    @classmethod
+    def from_response(cls, response: dict) -> Dict[str, "Ticker"]:
+        """Decodes a TickerShowRequest response (the "result" dict) by pair."""
+        return {pair: cls.from_dict(pair, values) for pair, values in response.items()}
@@ -0,0 +1,44 @@
+from typing import Tuple
+from .compact_record import CompactRecord
+
+
+class Trade(CompactRecord):
+    """One of the account's trades, from TradesHistory or QueryTrades."""
+
+    COLUMNS: Tuple[Tuple[str, str], ...] = (
+        ("txid", CompactRecord.TEXT),
+        ("order_txid", CompactRecord.TEXT),
+        ("position_txid", CompactRecord.TEXT),
+        ("pair", CompactRecord.CATEGORY),
+        ("time", CompactRecord.FLOAT),
+        ("type", CompactRecord.CATEGORY),
+        ("order_type", CompactRecord.CATEGORY),
+        ("price", CompactRecord.FIXED),
+        ("cost", CompactRecord.FIXED),
+        ("fee", CompactRecord.FIXED),
+        ("volume", CompactRecord.FIXED),
+        ("margin", CompactRecord.FIXED),
+        ("misc", CompactRecord.CATEGORY),
+        ("maker", CompactRecord.INT),
+    )
+
+    __slots__ = tuple(name for name, _ in COLUMNS)
+
+    @classmethod
+    def from_dict(cls, txid: str, values: dict) -> "Trade":
+        return cls(
+            txid,
+            values.get("ordertxid") or "",
+            values.get("postxid") or "",
+            cls.intern(values.get("pair")),
+            float(values.get("time") or 0),
+            cls.intern(values.get("type")),
+            cls.intern(values.get("ordertype")),
+            cls.to_fixed(values.get("price")),
+            cls.to_fixed(values.get("cost")),
+            cls.to_fixed(values.get("fee")),
+            cls.to_fixed(values.get("vol")),
+            cls.to_fixed(values.get("margin")),
+            cls.intern(values.get("misc")),
+            int(bool(values.get("maker"))),
+        )
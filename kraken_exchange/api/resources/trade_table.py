@@ -0,0 +1,10 @@
+from typing import Tuple
+from .record_table import RecordTable
+from .trade import Trade
+
+
+class TradeTable(RecordTable):
+    """Trades from TradesHistory responses, column by column."""
+
+    RECORD_CLASS: type = Trade
+    RESULT_KEYS: Tuple[str, ...] = ("trades",)
@@ -0,0 +1,4 @@
+from .request_priority import RequestPriority
+from .request_scheduler import RequestScheduler
+from .pooled_key import PooledKey
+from .key_pool import KeyPool
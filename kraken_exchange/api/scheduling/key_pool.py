@@ -0,0 +1,79 @@
+import threading
+from typing import List, Union
+from ..abstract.api_client import ApiClient
+from ..abstract.api_model import ApiModel
+from ..abstract.api_model_base import ApiModelBase
+from ..abstract.request import Request
+from ..requests.deposit_method_list_request import DepositMethodListRequest
+from ..requests.open_order_list_request import OpenOrderListRequest
+from .pooled_key import PooledKey
+from .request_priority import RequestPriority
+
+
+class KeyPool:
+    """Spreads read-only private requests over several API keys.
+
+    Every key has its own counter, so reads such as ClosedOrders pages and
+    withdrawal status go to the key with the most headroom, multiplying the
+    read throughput. Any other private request, trading in particular, always
+    uses trading_key, so its nonces and order permissions stay on one key.
+
+    The keys must belong to the same account for reads to return the same
+    data, and should be created with query permissions only.
+    """
+
+    READ_REQUESTS = RequestPriority.HISTORY_REQUESTS + (
+        OpenOrderListRequest,
+        DepositMethodListRequest,
+    )
+
+    def __init__(
+        self,
+        keys: List[PooledKey],
+        trading_key: PooledKey | None = None,
+        use_mock: bool = False,
+        client: ApiClient | None = None,
+    ) -> None:
+        if len(keys) == 0 and trading_key is None:
+            raise ValueError("KeyPool needs at least one key")
+
+        self.trading_key = trading_key if trading_key is not None else keys[0]
+        """Key used for every request that isn't a read"""
+
+        self.keys = keys
+        """Keys reads are spread over"""
+
+        self.use_mock = use_mock
+        self.client = client
+        self._lock = threading.Lock()
+
+    @classmethod
+    def is_read(cls, request: Request) -> bool:
+        return isinstance(request, cls.READ_REQUESTS)
+
+    def select_key(self, request: Request) -> PooledKey:
+        """The key a request should be sent with"""
+        if not self.is_read(request) or len(self.keys) == 0:
+            return self.trading_key
+        return max(self.keys, key=lambda key: key.get_headroom())
+
+    def submit(self, request: Request) -> Union[dict, ApiModel, ApiModelBase]:
+        """Sends a request with the selected key, waiting for its counter first."""
+        # Selecting and acquiring together keeps two threads from both picking
+        # the key that only has room for one of them.
+        with self._lock:
+            key = self.select_key(request)
+            key.request_count += 1
+            cost = ApiClient.get_cost(request)
+            if key.rate_limiter.try_acquire(cost):
+                cost = 0
+        if cost > 0:
+            key.rate_limiter.acquire(cost)
+
+        return request.submit(
+            use_mock=self.use_mock,
+            nonce=key.nonce_generator.next(),
+            api_key=key.api_key,
+            security_key=key.security_key,
+            client=self.client,
+        )
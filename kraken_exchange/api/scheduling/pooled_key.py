@@ -0,0 +1,25 @@
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+
+
+class PooledKey:
+    """An API key with its own nonce source and rate counter."""
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.request_count = 0
+
+    def get_headroom(self) -> float:
+        """How much the counter can still grow before Kraken refuses calls"""
+        return self.rate_limiter.max_counter - self.rate_limiter.counter
@@ -0,0 +1,58 @@
+from typing import Dict
+from ..abstract.request import Request
+from ..requests.order_add_batch_request import OrderAddBatchRequest
+from ..requests.order_add_request import OrderAddRequest
+from ..requests.order_cancel_all_after_request import OrderCancelAllAfterRequest
+from ..requests.order_cancel_all_request import OrderCancelAllRequest
+from ..requests.order_cancel_batch_request import OrderCancelBatchRequest
+from ..requests.order_cancel_request import OrderCancelRequest
+from ..requests.order_edit_request import OrderEditRequest
+from ..requests.order_list_request import OrderListRequest
+from ..requests.trade_history_list_request import TradeHistoryListRequest
+from ..requests.withdrawal_list_request import WithdrawalListRequest
+
+
+class RequestPriority:
+    """Priority classes of requests, most urgent first.
+
+    RESERVES is the part of the counter a class leaves free for the more
+    urgent ones, so a backfill can't use up the headroom an account read
+    needs. What each request costs comes from ApiClient.get_cost.
+    """
+
+    CANCEL: int = 0
+    TRADE: int = 1
+    ACCOUNT: int = 2
+    HISTORY: int = 3
+
+    NAMES: Dict[int, str] = {
+        CANCEL: "cancel",
+        TRADE: "trade",
+        ACCOUNT: "account",
+        HISTORY: "history",
+    }
+
+    RESERVES: Dict[int, int] = {CANCEL: 0, TRADE: 0, ACCOUNT: 1, HISTORY: 3}
+
+    CANCEL_REQUESTS = (
+        OrderCancelRequest,
+        OrderCancelBatchRequest,
+        OrderCancelAllRequest,
+        OrderCancelAllAfterRequest,
+    )
+    TRADE_REQUESTS = (OrderAddRequest, OrderAddBatchRequest, OrderEditRequest)
+    HISTORY_REQUESTS = (
+        OrderListRequest,
+        TradeHistoryListRequest,
+        WithdrawalListRequest,
+    )
+
+    @classmethod
+    def classify(cls, request: Request) -> int:
+        if isinstance(request, cls.CANCEL_REQUESTS):
+            return cls.CANCEL
+        elif isinstance(request, cls.TRADE_REQUESTS):
+            return cls.TRADE
+        elif isinstance(request, cls.HISTORY_REQUESTS):
+            return cls.HISTORY
+        return cls.ACCOUNT
@@ -0,0 +1,192 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+from ..abstract.api_client import ApiClient
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.rate_limiter import RateLimiter
+from ..abstract.request import Request
+from .request_priority import RequestPriority
+
+
+class RequestScheduler:
+    """Sends requests in priority order under one shared RateLimiter.
+
+    Requests wait in a priority queue rather than in the executor, and are only
+    admitted when a worker is free and their cost fits under the counter, less
+    the reserve of their class. Whenever that is re-evaluated, the most urgent
+    request goes first, so a cancel submitted behind a dozen history pages is
+    the next request sent.
+
+    With more than one worker, requests of the same key can reach Kraken out of
+    nonce order. Only raise workers when the key has a nonce window set.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        rate_limiter: RateLimiter | None = None,
+        workers: int = 1,
+        client: ApiClient | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.security_key = security_key
+        self.use_mock = use_mock
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.workers = workers
+        self.client = client
+
+        self.metrics: Dict[int, dict] = {
+            priority: {
+                "depth": 0,
+                "submitted": 0,
+                "completed": 0,
+                "failed": 0,
+                "total_wait": 0.0,
+                "max_wait": 0.0,
+            }
+            for priority in RequestPriority.NAMES
+        }
+        """Counters per priority class. depth is the number of queued requests."""
+
+        self._queue: List[tuple] = []
+        self._sequence = itertools.count()
+        self._idle_workers = workers
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "RequestScheduler":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> "RequestScheduler":
+        with self._condition:
+            self._stopping = False
+        if self._thread is None or not self._thread.is_alive():
+            self._executor = ThreadPoolExecutor(self.workers)
+            self._thread = threading.Thread(
+                target=self._run, name=self.__class__.__name__, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Sends the requests still queued, then stops."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def submit(self, request: Request, priority: int | None = None) -> Future:
+        """Queues a request, returning a Future for the result of request.submit()."""
+        priority = (
+            priority if priority is not None else RequestPriority.classify(request)
+        )
+        future: Future = Future()
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("{0} is stopped".format(self.__class__.__name__))
+            heapq.heappush(
+                self._queue,
+                (priority, next(self._sequence), time.monotonic(), request, future),
+            )
+            self.metrics[priority]["depth"] += 1
+            self.metrics[priority]["submitted"] += 1
+            self._condition.notify()
+        return future
+
+    def get_metrics(self) -> Dict[str, dict]:
+        """Metrics per priority class name, with the mean wait in the queue."""
+        with self._condition:
+            result = {}
+            for priority, metrics in self.metrics.items():
+                sent = metrics["completed"] + metrics["failed"]
+                result[RequestPriority.NAMES[priority]] = dict(
+                    metrics, mean_wait=metrics["total_wait"] / sent if sent else 0.0
+                )
+            return result
+
+    def _admit(self) -> tuple | None:
+        """Pops the most urgent request if it can be sent now. The lock must be held."""
+        while len(self._queue) > 0 and self._queue[0][4].cancelled():
+            self.metrics[heapq.heappop(self._queue)[0]]["depth"] -= 1
+
+        if len(self._queue) == 0 or self._idle_workers == 0:
+            return None
+
+        priority, _, _, request, _ = self._queue[0]
+        cost = ApiClient.get_cost(request)
+        reserve = RequestPriority.RESERVES[priority]
+        if not self.rate_limiter.try_acquire(cost, reserve):
+            return None
+
+        entry = heapq.heappop(self._queue)
+        self.metrics[priority]["depth"] -= 1
+        self._idle_workers -= 1
+        return entry
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                entry = self._admit()
+                while entry is None:
+                    if self._stopping and len(self._queue) == 0:
+                        return
+                    timeout = None
+                    if len(self._queue) > 0 and self._idle_workers > 0:
+                        priority, _, _, request, _ = self._queue[0]
+                        timeout = max(
+                            0.001,
+                            self.rate_limiter.get_wait(
+                                ApiClient.get_cost(request),
+                                RequestPriority.RESERVES[priority],
+                            ),
+                        )
+                    self._condition.wait(timeout)
+                    entry = self._admit()
+
+            if self._executor is not None:
+                self._executor.submit(self._send, entry)
+
+    def _send(self, entry: tuple) -> None:
+        priority, _, queued_at, request, future = entry
+        wait = time.monotonic() - queued_at
+        failed = False
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(
+                        request.submit(
+                            use_mock=self.use_mock,
+                            nonce=self.nonce_generator.next(),
+                            api_key=self.api_key,
+                            security_key=self.security_key,
+                            client=self.client,
+                        )
+                    )
+                except Exception as e:
+                    failed = True
+                    future.set_exception(e)
+        finally:
+            with self._condition:
+                metrics = self.metrics[priority]
+                metrics["failed" if failed else "completed"] += 1
+                metrics["total_wait"] += wait
+                metrics["max_wait"] = max(metrics["max_wait"], wait)
+                self._idle_workers += 1
+                self._condition.notify()
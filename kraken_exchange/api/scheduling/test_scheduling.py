@@ -0,0 +1,131 @@
+import time
+from ..abstract.api_client import ApiClient
+from ..abstract.rate_limiter import RateLimiter
+from ..requests import (
+    OpenOrderListRequest,
+    OrderAddRequest,
+    OrderCancelRequest,
+    OrderListRequest,
+    TickerShowRequest,
+    WebSocketTokenCreateRequest,
+)
+from .key_pool import KeyPool
+from .pooled_key import PooledKey
+from .request_scheduler import RequestScheduler
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def get_recording_client(sent: list) -> ApiClient:
+    class RecordingClient(ApiClient):
+        def submit(self, request, **kwargs):
+            sent.append(request.__class__)
+            return super().submit(request=request, **kwargs)
+
+    return RecordingClient()
+
+
+def test_requests_are_sent_by_priority():
+    sent: list = []
+    scheduler = RequestScheduler(
+        API_KEY, SECURITY_KEY, use_mock=True, client=get_recording_client(sent)
+    )
+    requests = [
+        OrderListRequest(),
+        WebSocketTokenCreateRequest(),
+        OrderAddRequest(),
+        OrderListRequest(),
+        OrderCancelRequest(),
+    ]
+    futures = [scheduler.submit(request) for request in requests]
+    assert scheduler.get_metrics()["history"]["depth"] == 2
+
+    with scheduler:
+        [future.result(5) for future in futures]
+
+    assert sent == [
+        OrderCancelRequest,
+        OrderAddRequest,
+        WebSocketTokenCreateRequest,
+        OrderListRequest,
+        OrderListRequest,
+    ]
+    metrics = scheduler.get_metrics()
+    assert metrics["history"]["completed"] == 2
+    assert metrics["history"]["depth"] == 0
+    assert metrics["cancel"]["max_wait"] >= 0
+
+
+def test_reserve_lets_account_reads_overtake_history():
+    sent: list = []
+    # History can only use the counter up to 5 - 3, so one page at a time.
+    limiter = RateLimiter(max_counter=5, decay_per_second=5)
+    with RequestScheduler(
+        API_KEY,
+        SECURITY_KEY,
+        use_mock=True,
+        rate_limiter=limiter,
+        client=get_recording_client(sent),
+    ) as scheduler:
+        pages = [scheduler.submit(OrderListRequest()) for _ in range(2)]
+        deadline = time.monotonic() + 5
+        while len(sent) == 0 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        token = scheduler.submit(WebSocketTokenCreateRequest())
+        token.result(5)
+        [page.result(5) for page in pages]
+
+    assert sent == [OrderListRequest, WebSocketTokenCreateRequest, OrderListRequest]
+    assert ApiClient.get_cost(OrderCancelRequest()) == 0
+
+
+def test_key_pool_spreads_reads_and_pins_trading():
+    trading = PooledKey("trading", SECURITY_KEY)
+    readers = [PooledKey("reader{0}".format(i), SECURITY_KEY) for i in range(3)]
+    pool = KeyPool(readers, trading_key=trading, use_mock=True)
+
+    for _ in range(6):
+        pool.submit(OrderListRequest())
+    pool.submit(OrderAddRequest())
+
+    assert [key.request_count for key in readers] == [2, 2, 2]
+    assert all(key.rate_limiter.counter > 3 for key in readers)
+    assert trading.request_count == 1
+    assert pool.select_key(OrderCancelRequest()) is trading
+
+
+def test_api_client_counter_model():
+    class CountingClient(ApiClient):
+        COUNTERS: dict = {}
+
+        @classmethod
+        def create_counter(cls, api_key):
+            return RateLimiter(max_counter=10, decay_per_second=1, clock=lambda: 0.0)
+
+    burst = [OrderListRequest(), OpenOrderListRequest(), OrderAddRequest()]
+    assert ApiClient.get_burst_cost(burst + [TickerShowRequest()]) == 3
+
+    states: list = []
+    client = CountingClient()
+    client.hooks.add_post_request_hook(
+        lambda response, *args: states.append(response.counter_state),
+        synchronous=True,
+    )
+    for request in burst * 2:
+        result = request.submit(
+            use_mock=True,
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            client=client,
+        )
+
+    assert [state["counter"] for state in states] == [2, 3, 3, 5, 6, 6]
+    assert states[0]["cost"] == 2 and states[-1]["headroom"] == 4
+    assert result.counter_state == states[-1]
+    assert CountingClient.get_time_until(API_KEY, 4) == 0
+    assert CountingClient.get_time_until(API_KEY, 7) == 3
+    # Without a counter nothing is known, and responses are plain dicts.
+    assert ApiClient.get_time_until(API_KEY, 4) is None
+    assert type(OrderListRequest().submit(True, "1", API_KEY, SECURITY_KEY)) is dict
@@ -0,0 +1 @@
+from .json_item_stream import JsonItemStream
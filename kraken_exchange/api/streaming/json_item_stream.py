@@ -0,0 +1,193 @@
+import codecs
+import re
+import simplejson as json
+from typing import Any, Iterable, Iterator, List, Tuple
+
+
+class JsonItemStream:
+    """Splits a JSON document into the items of one container as it arrives.
+
+    path names the container by its keys from the root, e.g.
+    ("result", "closed") for the orders of ClosedOrders; "*" matches any key.
+    Every member of a matching object, or element of a matching array, is
+    parsed on its own as soon as it is complete and returned by feed() as a
+    (key, value) pair, with the index as key for arrays. When the path has
+    wildcards, the key is a tuple of the keys they matched followed by the
+    item's key, e.g. ("XXBTZUSD", 0), so items of different containers can be
+    told apart. Only the item being read is buffered, so memory is bounded by
+    the largest item.
+
+    Everything outside the matching containers, such as "error" or "count",
+    is kept, with those containers left empty, and returned by close().
+    """
+
+    _STRUCTURE = re.compile(r'[{}\[\]",:]')
+    _STRING_END = re.compile(r'["\\]')
+
+    def __init__(self, path: Tuple[str, ...]) -> None:
+        self.path = path
+        self.size = 0
+        """Bytes (or characters, for str chunks) fed so far"""
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._stack: List[list] = []
+        """Frames of [opening char, key or index, expecting a key, is the target]"""
+
+        self._target_depth: int | None = None
+        """Length of the stack while the top frame is the matching container"""
+
+        self._item_key: Any = None
+        self._item: List[str] = []
+        self._rest: List[str] = []
+        self._string: List[str] | None = None
+        self._escape = False
+
+    def _write(self, text: str) -> None:
+        if self._target_depth is not None:
+            self._item.append(text)
+        else:
+            self._rest.append(text)
+
+    def _matches(self, keys: tuple) -> bool:
+        return len(keys) == len(self.path) and all(
+            expected == "*" or expected == key for expected, key in zip(self.path, keys)
+        )
+
+    def _emit(self, items: List[tuple]) -> None:
+        text = "".join(self._item).strip()
+        self._item = []
+        if len(text) == 0:
+            return
+        frame = self._stack[-1]
+        if frame[0] == "[":
+            key = frame[1]
+            frame[1] += 1
+        else:
+            key = self._item_key
+        if "*" in self.path:
+            key = tuple(
+                self._stack[depth][1]
+                for depth, expected in enumerate(self.path)
+                if expected == "*"
+            ) + (key,)
+        items.append((key, json.loads(text, use_decimal=True)))
+
+    def _end_string(self) -> None:
+        raw = '"' + "".join(self._string or []) + '"'
+        self._string = None
+        frame = self._stack[-1] if len(self._stack) > 0 else None
+        at_target = self._target_depth == len(self._stack)
+        if frame is not None and frame[0] == "{" and frame[2]:
+            if at_target:
+                self._item_key = json.loads(raw)
+                return
+            if self._target_depth is None:
+                frame[1] = json.loads(raw)
+        self._write(raw)
+
+    def _scan_string(self, data: str, index: int) -> int:
+        """Reads string content from index, returning where scanning resumes."""
+        parts = self._string if self._string is not None else []
+        while index < len(data):
+            if self._escape:
+                parts.append(data[index])
+                self._escape = False
+                index += 1
+                continue
+            match = self._STRING_END.search(data, index)
+            if match is None:
+                parts.append(data[index:])
+                return len(data)
+            parts.append(data[index : match.start()])
+            if data[match.start()] == "\\":
+                parts.append("\\")
+                self._escape = True
+                index = match.start() + 1
+                continue
+            self._end_string()
+            return match.start() + 1
+        return index
+
+    def _open(self, char: str) -> None:
+        if self._target_depth is None and self._matches(
+            tuple(frame[1] for frame in self._stack)
+        ):
+            self._rest.append(char)
+            self._stack.append([char, 0 if char == "[" else None, char == "{", True])
+            self._target_depth = len(self._stack)
+            self._item = []
+            return
+        self._write(char)
+        self._stack.append([char, 0 if char == "[" else None, char == "{", False])
+
+    def _close(self, char: str, items: List[tuple]) -> None:
+        if len(self._stack) == 0:
+            raise ValueError("Unexpected {0!r} in JSON stream".format(char))
+        if self._stack[-1][3]:
+            self._emit(items)
+            self._stack.pop()
+            self._target_depth = None
+            self._rest.append(char)
+            return
+        self._write(char)
+        self._stack.pop()
+
+    def feed(self, data: bytes | str) -> List[Tuple[Any, Any]]:
+        """Reads the next chunk, returning the items it completed."""
+        self.size += len(data)
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+
+        items: List[tuple] = []
+        index = 0
+        while index < len(data):
+            if self._string is not None:
+                index = self._scan_string(data, index)
+                continue
+
+            match = self._STRUCTURE.search(data, index)
+            end = match.start() if match is not None else len(data)
+            if end > index:
+                self._write(data[index:end])
+            if match is None:
+                break
+            char = data[end]
+            index = end + 1
+
+            at_target = self._target_depth == len(self._stack)
+            if char == '"':
+                self._string = []
+            elif char in "{[":
+                self._open(char)
+            elif char in "}]":
+                self._close(char, items)
+            elif char == ":":
+                self._stack[-1][2] = False
+                if at_target:
+                    self._item = []
+                else:
+                    self._write(char)
+            elif char == ",":
+                frame = self._stack[-1]
+                if at_target:
+                    self._emit(items)
+                    frame[2] = frame[0] == "{"
+                    continue
+                self._write(char)
+                if self._target_depth is None:
+                    if frame[0] == "[":
+                        frame[1] += 1
+                    else:
+                        frame[2] = True
+        return items
+
+    def close(self) -> Any:
+        """Checks that the document is complete and returns everything but the items."""
+        if len(self._stack) > 0 or self._string is not None:
+            raise ValueError("JSON stream ended before the document was complete")
+        return json.loads("".join(self._rest), use_decimal=True)
+
+    def iter_items(self, chunks: Iterable[bytes | str]) -> Iterator[Tuple[Any, Any]]:
+        """Yields the items of a stream of chunks, e.g. Response.iter_content()."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
@@ -0,0 +1,150 @@
+import io
+import pytest
+import requests
+import simplejson as json
+from decimal import Decimal
+from ..abstract.api_client import ApiClient
+from ..errors import ApiException
+from ..requests import OrderListRequest, TradeListRequest
+from ..resources import Order, OrderTable
+from .json_item_stream import JsonItemStream
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def get_items(text: str, path: tuple, chunk_size: int) -> tuple:
+    stream = JsonItemStream(path)
+    data = text.encode()
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    items = list(stream.iter_items(chunks))
+    return items, stream.close()
+
+
+def test_items_are_parsed_across_chunk_boundaries():
+    orders = {
+        'O"1': {"descr": {"order": "buy } ] , \\ é"}, "vol": "1.5", "trades": []},
+        "O2": None,
+        "O3": 3.25,
+    }
+    text = json.dumps({"error": [], "result": {"closed": orders, "count": 3}})
+    for chunk_size in (1, 2, 5, 64, 4096):
+        items, rest = get_items(text, ("result", "closed"), chunk_size)
+        assert dict(items) == json.loads(text, use_decimal=True)["result"]["closed"]
+        assert rest == {"error": [], "result": {"closed": {}, "count": 3}}
+
+    rows = {
+        "XXBTZUSD": [["30000.1", "0.5", 1688667796.8802]],
+        "XETHZUSD": [["1900.5", "2"], ["1900.6", "1"]],
+        "last": "1688",
+    }
+    items, rest = get_items(json.dumps({"result": rows}), ("result", "*"), 3)
+    assert items == [
+        (("XXBTZUSD", 0), ["30000.1", "0.5", Decimal("1688667796.8802")]),
+        (("XETHZUSD", 0), ["1900.5", "2"]),
+        (("XETHZUSD", 1), ["1900.6", "1"]),
+    ]
+    assert rest == {"result": {"XXBTZUSD": [], "XETHZUSD": [], "last": "1688"}}
+
+    with pytest.raises(ValueError):
+        get_items('{"result": {"closed": {"O1": [', ("result", "closed"), 4)
+
+
+def test_client_streams_items():
+    class StreamingClient(ApiClient):
+        STREAM_CHUNK_SIZE = 16
+
+    table = OrderTable()
+    response = OrderListRequest().submit(
+        use_mock=True,
+        nonce="1",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=StreamingClient(),
+        on_item=lambda txid, order: table.append(Order.from_dict(txid, order)),
+    )
+    assert response == {"closed": {}, "count": 2}
+    assert len(table) == 2 and table[0].txid == "O37652-RJWRT-IMO74O"
+
+    rows: list = []
+    TradeListRequest().submit(
+        use_mock=True,
+        nonce="1",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=StreamingClient(),
+        on_item=lambda key, row: rows.append(key),
+    )
+    assert len(rows) > 0 and rows[0] == ("XXBTZUSD", 0)
+
+
+def test_client_raises_streamed_errors():
+    class ErrorRequest(OrderListRequest):
+        def get_factory_response(self, response=None):
+            return {"error": ["EGeneral:Invalid arguments"], "result": {"closed": {}}}
+
+    with pytest.raises(ApiException):
+        ErrorRequest().submit(
+            use_mock=True,
+            nonce="1",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            on_item=lambda key, value: None,
+        )
+
+
+def test_client_closes_streams_and_runs_hooks_after_them():
+    class Raw(io.BytesIO):
+        released = False
+
+        def release_conn(self) -> None:
+            self.released = True
+
+    class Session:
+        def __init__(self) -> None:
+            self.responses: list = []
+
+        def post(self, url, **kwargs):
+            response = requests.models.Response()
+            response.status_code = 200
+            response.raw = Raw(
+                json.dumps(OrderListRequest().get_factory_response()).encode()
+            )
+            self.responses.append(response)
+            return response
+
+    class SessionClient(ApiClient):
+        SESSION = Session()
+        CIRCUIT_BREAKERS = None
+
+    seen: list = []
+    client = SessionClient()
+    client.hooks.add_post_request_hook(
+        lambda response, *args: seen.append(("hook", response.raw.released)),
+        synchronous=True,
+    )
+    OrderListRequest().submit(
+        use_mock=False,
+        nonce="1",
+        api_key=API_KEY,
+        security_key=SECURITY_KEY,
+        client=client,
+        on_item=lambda txid, order: seen.append(("item", txid)),
+    )
+    # Hooks only get the response once its body is read and released.
+    assert [kind for kind, _ in seen] == ["item", "item", "hook"]
+    assert seen[-1] == ("hook", True)
+
+    def fail(txid, order):
+        raise KeyError(txid)
+
+    with pytest.raises(KeyError):
+        OrderListRequest().submit(
+            use_mock=False,
+            nonce="2",
+            api_key=API_KEY,
+            security_key=SECURITY_KEY,
+            client=client,
+            on_item=fail,
+        )
+    assert SessionClient.SESSION.responses[-1].raw.released
@@ -0,0 +1,5 @@
+from .row_store import RowStore
+from .json_lines_store import JsonLinesStore
+from .incremental_sync import IncrementalSync
+from .trade_sync import TradeSync
+from .spread_sync import SpreadSync
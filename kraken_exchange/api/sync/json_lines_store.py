@@ -0,0 +1,45 @@
+import os
+import threading
+from typing import Iterator, List
+import simplejson as json
+
+
+class JsonLinesStore:
+    """Append-only local storage keeping one JSON lines file per pair.
+
+    Each row is written as a JSON array on its own line. Decimals are written
+    as numbers and read back as Decimals, so no precision is lost.
+    """
+
+    def __init__(self, directory: str, suffix: str = "") -> None:
+        self.directory = directory
+        self.suffix = suffix
+        """Appended to the pair in the file name, e.g. "_trades"."""
+
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get_file_path(self, pair: str) -> str:
+        return os.path.join(self.directory, f"{pair}{self.suffix}.jsonl")
+
+    def append(self, pair: str, rows: List[list]) -> None:
+        """Appends rows and flushes them to disk."""
+        if len(rows) == 0:
+            return
+
+        lines = "".join(json.dumps(row) + "\n" for row in rows)
+        with self._lock:
+            with open(self.get_file_path(pair), "a") as file:
+                file.write(lines)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def read(self, pair: str) -> Iterator[list]:
+        """Yields the stored rows for the pair, oldest first."""
+        try:
+            with open(self.get_file_path(pair), "r") as file:
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line, use_decimal=True)
+        except FileNotFoundError:
+            return
@@ -0,0 +1,11 @@
+from typing import Any, List, Protocol
+
+
+class RowStore(Protocol):
+    """Local storage that IncrementalSync appends new rows to.
+
+    Implemented by JsonLinesStore, TradeArchive and SpreadArchive.
+    """
+
+    def append(self, pair: str, rows: List[list]) -> Any:
+        pass
@@ -0,0 +1,60 @@
+from typing import List
+from ..requests.spread_list_request import SpreadListRequest
+from .incremental_sync import IncrementalSync
+
+
+class SpreadSync(IncrementalSync):
+    """Incrementally syncs recent spreads.
+
+    Spread rows have no id, and several rows can share a timestamp. Overlap is
+    removed by dropping rows older than the newest stored timestamp, and rows at
+    that timestamp that were already stored.
+    """
+
+    CHECKPOINT_PREFIX = "spreads:"
+
+    TIME_COLUMN: int = 0
+    """Rows are [time, bid, ask]"""
+
+    @classmethod
+    def _row_key(cls, row: list) -> list:
+        return [str(value) for value in row]
+
+    def create_request(self, pair: str, since: str | None) -> SpreadListRequest:
+        request = SpreadListRequest()
+        request.pair = pair
+        if since is not None:
+            request.since = since
+        return request
+
+    def filter_new_rows(self, rows: List[list], checkpoint: dict) -> List[list]:
+        last_time = checkpoint.get("last_time")
+        if last_time is None:
+            return rows
+
+        boundary = checkpoint.get("boundary") or []
+        new_rows = []
+        for row in rows:
+            time = int(row[self.TIME_COLUMN])
+            if time > last_time or (
+                time == last_time and self._row_key(row) not in boundary
+            ):
+                new_rows.append(row)
+        return new_rows
+
+    def update_checkpoint(self, rows: List[list], checkpoint: dict) -> dict:
+        if len(rows) == 0:
+            return checkpoint
+
+        last_time = max(int(row[self.TIME_COLUMN]) for row in rows)
+        boundary = [
+            self._row_key(row)
+            for row in rows
+            if int(row[self.TIME_COLUMN]) == last_time
+        ]
+        if last_time == checkpoint.get("last_time"):
+            boundary = (checkpoint.get("boundary") or []) + boundary
+
+        checkpoint["last_time"] = last_time
+        checkpoint["boundary"] = boundary
+        return checkpoint
@@ -0,0 +1,40 @@
+from ..pagination.checkpoint_store import CheckpointStore
+from .json_lines_store import JsonLinesStore
+from .spread_sync import SpreadSync
+from .trade_sync import TradeSync
+
+
+def test_trade_sync_skips_overlapping_rows(tmp_path):
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store = JsonLinesStore(str(tmp_path / "trades"))
+    sync = TradeSync(checkpoints, store, use_mock=True)
+
+    assert sync.poll("XBTUSD") == (3, 3)
+    # The mock answers with the same rows again, all of which are already stored.
+    assert sync.poll("XBTUSD") == (3, 0)
+
+    checkpoint = checkpoints.get("trades:XBTUSD")
+    assert checkpoint["since"] == "1688671969993150842"
+    assert checkpoint["last_id"] == 61044956
+    assert [row[6] for row in store.read("XBTUSD")] == [
+        61044952,
+        61044953,
+        61044956,
+    ]
+
+
+def test_spread_sync_skips_rows_at_the_boundary(tmp_path):
+    checkpoints = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store = JsonLinesStore(str(tmp_path / "spreads"))
+    sync = SpreadSync(checkpoints, store, use_mock=True)
+
+    assert sync.sync_all(["XBTUSD"]) == {"XBTUSD": 3}
+    assert sync.sync("XBTUSD") == 0
+
+    rows = [
+        [1688671834, "30292.10000", "30297.50000"],
+        [1688671834, "30293.00000", "30297.50000"],
+        [1688671835, "30293.00000", "30297.50000"],
+    ]
+    checkpoint = checkpoints.get("spreads:XBTUSD")
+    assert sync.filter_new_rows(rows, checkpoint) == rows[1:]
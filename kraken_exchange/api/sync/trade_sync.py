@@ -0,0 +1,36 @@
+from typing import List
+from ..requests.trade_list_request import TradeListRequest
+from .incremental_sync import IncrementalSync
+
+
+class TradeSync(IncrementalSync):
+    """Incrementally syncs public trades.
+
+    Trade ids increase monotonically, so overlap is removed by only keeping rows
+    with an id above the highest one already stored.
+    """
+
+    PAGE_SIZE = 1000
+    CHECKPOINT_PREFIX = "trades:"
+
+    ID_COLUMN: int = 6
+    """Rows are [price, volume, time, side, type, misc, id]"""
+
+    def create_request(self, pair: str, since: str | None) -> TradeListRequest:
+        request = TradeListRequest()
+        request.pair = pair
+        if since is not None:
+            request.since = since
+        return request
+
+    def filter_new_rows(self, rows: List[list], checkpoint: dict) -> List[list]:
+        last_id = checkpoint.get("last_id")
+        if last_id is None:
+            return rows
+        return [row for row in rows if int(row[self.ID_COLUMN]) > last_id]
+
+    def update_checkpoint(self, rows: List[list], checkpoint: dict) -> dict:
+        if len(rows) > 0:
+            last_id = max(int(row[self.ID_COLUMN]) for row in rows)
+            checkpoint["last_id"] = max(last_id, checkpoint.get("last_id") or 0)
+        return checkpoint
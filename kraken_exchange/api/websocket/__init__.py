@@ -0,0 +1,6 @@
+from .pair_metadata import PairMetadata
+from .web_socket_session import WebSocketSession
+from .market_data_client import MarketDataClient, MarketDataEvent
+from .feed_server import FeedServer
+from .trading_session import TradingSession
+from .trading_server import TradingServer
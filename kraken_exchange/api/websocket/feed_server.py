@@ -0,0 +1,199 @@
+import random
+import threading
+from typing import Any, Dict, List
+import simplejson as json
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.server import Server, ServerConnection, serve
+
+
+class FeedServer:
+    """Local stand-in for Kraken's WebSocket v2 feed, for tests and replays.
+
+    Clients are acknowledged like Kraken does. After a subscription, the
+    recorded messages of that channel are replayed, keeping only the data for
+    the subscribed symbols. publish() sends live messages to every subscriber.
+    """
+
+    def __init__(
+        self,
+        messages: List[dict] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.messages: List[dict] = messages if messages is not None else []
+        """Recorded messages, replayed on subscription"""
+
+        self.host = host
+        self.port = port
+        self.received: List[dict] = []
+        """Every message received from clients, in order"""
+
+        self._server: Server | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[ServerConnection, Dict[str, set]] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "FeedServer":
+        """Loads messages recorded by MarketDataClient(record_path=...)."""
+        with open(path, "r") as file:
+            messages = [json.loads(line, use_decimal=True) for line in file if line]
+        return cls([message for message in messages if "channel" in message], **kwargs)
+
+    @classmethod
+    def synthetic_messages(
+        cls, symbols: List[str], count: int = 10, seed: int = 1
+    ) -> List[dict]:
+        """Generates ticker and trade updates around a random walk."""
+        generator = random.Random(seed)
+        messages = []
+        for symbol in symbols:
+            price = 100.0
+            for index in range(count):
+                price = round(price + generator.uniform(-1, 1), 1)
+                timestamp = "2023-07-06T19:{0:02d}:{1:02d}.000000Z".format(
+                    index // 60, index % 60
+                )
+                messages.append(
+                    {
+                        "channel": "ticker",
+                        "type": "snapshot" if index == 0 else "update",
+                        "data": [
+                            {
+                                "symbol": symbol,
+                                "bid": round(price - 0.1, 1),
+                                "ask": round(price + 0.1, 1),
+                                "last": price,
+                                "timestamp": timestamp,
+                            }
+                        ],
+                    }
+                )
+                messages.append(
+                    {
+                        "channel": "trade",
+                        "type": "update",
+                        "data": [
+                            {
+                                "symbol": symbol,
+                                "side": generator.choice(["buy", "sell"]),
+                                "price": price,
+                                "qty": round(generator.uniform(0, 2), 8),
+                                "ord_type": generator.choice(["market", "limit"]),
+                                "trade_id": index,
+                                "timestamp": timestamp,
+                            }
+                        ],
+                    }
+                )
+        return messages
+
+    @property
+    def url(self) -> str:
+        return "ws://{0}:{1}".format(self.host, self.port)
+
+    def start(self) -> "FeedServer":
+        self._server = serve(self._handle, self.host, self.port)
+        self.port = self._server.socket.getsockname()[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="FeedServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join(5)
+
+    def drop_connections(self) -> None:
+        """Closes every client connection, e.g. to exercise reconnection."""
+        with self._lock:
+            connections = list(self._subscriptions.keys())
+        for connection in connections:
+            connection.close()
+
+    def send(self, connection: ServerConnection, message: Any) -> None:
+        try:
+            connection.send(json.dumps(message))
+        except ConnectionClosed:
+            pass
+
+    def publish(self, message: dict) -> None:
+        """Sends a message to every connection subscribed to its channel and symbols."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.items())
+        for connection, channels in subscriptions:
+            filtered = self._filter(message, channels)
+            if filtered is not None:
+                self.send(connection, filtered)
+
+    @classmethod
+    def _filter(cls, message: dict, channels: Dict[str, set]) -> dict | None:
+        symbols = channels.get(message.get("channel", ""), set())
+        data = [
+            item for item in message.get("data", []) if item.get("symbol") in symbols
+        ]
+        if len(data) == 0:
+            return None
+        return dict(message, data=data)
+
+    def handle_request(self, connection: ServerConnection, message: dict) -> None:
+        """Answers a client request. Subclasses can handle more methods."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        channel = params.get("channel")
+        symbols = params.get("symbol") or []
+
+        if method not in ("subscribe", "unsubscribe"):
+            self.send(
+                connection,
+                {
+                    "method": method,
+                    "req_id": message.get("req_id"),
+                    "success": False,
+                    "error": "Method not found",
+                },
+            )
+            return
+
+        with self._lock:
+            channels = self._subscriptions.setdefault(connection, {})
+            if method == "subscribe":
+                channels.setdefault(channel, set()).update(symbols)
+            else:
+                channels.setdefault(channel, set()).difference_update(symbols)
+
+        for symbol in symbols:
+            self.send(
+                connection,
+                {
+                    "method": method,
+                    "req_id": message.get("req_id"),
+                    "success": True,
+                    "result": {"channel": channel, "symbol": symbol},
+                },
+            )
+
+        if method == "subscribe":
+            for recorded in self.messages:
+                if recorded.get("channel") == channel:
+                    filtered = self._filter(recorded, {channel: set(symbols)})
+                    if filtered is not None:
+                        self.send(connection, filtered)
+
+    def _handle(self, connection: ServerConnection) -> None:
+        with self._lock:
+            self._subscriptions[connection] = {}
+        try:
+            for raw in connection:
+                message = json.loads(raw, use_decimal=True)
+                with self._lock:
+                    self.received.append(message)
+                self.handle_request(connection, message)
+        except ConnectionClosed:
+            pass
+        finally:
+            with self._lock:
+                self._subscriptions.pop(connection, None)
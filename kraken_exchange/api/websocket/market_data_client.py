@@ -0,0 +1,293 @@
+import datetime
+import queue
+import threading
+from typing import IO, Any, Dict, Iterable, Iterator, List
+import simplejson as json
+from ..book.order_book import OrderBook
+from ..columnar.spread_series import SpreadSeries
+from ..columnar.trade_columns import TradeColumns
+from .pair_metadata import PairMetadata
+from .web_socket_session import WebSocketSession
+
+
+class MarketDataEvent:
+    """A decoded market data update, as queued for consumers.
+
+    data depends on the channel: a dict for ticker, a [time, bid, ask] row for
+    spread, TradeColumns for trade, and the top levels of the book for book.
+    """
+
+    __slots__ = ("channel", "symbol", "type", "data")
+
+    def __init__(self, channel: str, symbol: str | None, type: str, data: Any) -> None:
+        self.channel = channel
+        self.symbol = symbol
+        self.type = type
+        self.data = data
+
+
+class MarketDataClient(WebSocketSession):
+    """WebSocket v2 client for the ticker, spread, trade and book channels.
+
+    Updates are decoded into the same structures used for REST responses
+    (TradeColumns, SpreadSeries rows and OrderBook) on the session thread and
+    put on a bounded queue. When consumers fall behind, the oldest events are
+    dropped and counted in dropped_count, so the socket is never held up.
+
+    Subscriptions made in quick succession are sent together, in batches of
+    MAX_SYMBOLS_PER_REQUEST symbols, and are all resent after a reconnection.
+    The v2 API has no spread channel, so spreads are taken from the best bid
+    and ask of the ticker channel.
+
+    A message that can't be handled is reported as an error event with the
+    exception as data, and the following messages are handled as usual.
+    """
+
+    CHANNELS = ("ticker", "spread", "trade", "book")
+    MAX_SYMBOLS_PER_REQUEST: int = 50
+
+    def __init__(
+        self,
+        pair_metadata: PairMetadata | None = None,
+        book_depth: int = 10,
+        queue_size: int = 10000,
+        record_path: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.pair_metadata = (
+            pair_metadata if pair_metadata is not None else PairMetadata()
+        )
+        self.book_depth = book_depth
+        self.record_path = record_path
+        """When set, every received message is appended to this JSON lines file"""
+
+        self._record_file: IO[str] | None = None
+
+        self.events: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.dropped_count = 0
+        self.checksum_failures = 0
+
+        self.books: Dict[str, OrderBook] = {}
+        self.spreads: Dict[str, SpreadSeries] = {}
+
+        self._subscriptions: Dict[str, set] = {
+            channel: set() for channel in self.CHANNELS
+        }
+        self._pending: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self._req_id = 0
+
+    @classmethod
+    def _wire_channel(cls, channel: str) -> str:
+        return "ticker" if channel == "spread" else channel
+
+    def subscribe(self, channel: str, symbols: Iterable[str]) -> None:
+        """Subscribes to a channel for WebSocket symbols or REST pair names."""
+        if channel not in self.CHANNELS:
+            raise ValueError(
+                "channel must be one of {0}".format(", ".join(self.CHANNELS))
+            )
+
+        symbols = {self._to_symbol(symbol) for symbol in symbols}
+        wire_channel = self._wire_channel(channel)
+        with self._lock:
+            self._subscriptions[channel] |= symbols
+            self._pending.setdefault(wire_channel, set()).update(symbols)
+
+    def unsubscribe(self, channel: str, symbols: Iterable[str]) -> None:
+        symbols = {self._to_symbol(symbol) for symbol in symbols}
+        wire_channel = self._wire_channel(channel)
+        with self._lock:
+            self._subscriptions[channel] -= symbols
+            if wire_channel in self._pending:
+                self._pending[wire_channel] -= symbols
+
+            # Ticker and spread share the ticker subscription on the wire.
+            still_needed = set()
+            for other, subscribed in self._subscriptions.items():
+                if self._wire_channel(other) == wire_channel:
+                    still_needed |= subscribed
+
+        self._send_batched("unsubscribe", wire_channel, sorted(symbols - still_needed))
+
+    def _to_symbol(self, symbol: str) -> str:
+        try:
+            return self.pair_metadata.get_symbol(symbol)
+        except KeyError:
+            return symbol
+
+    def _send_batched(self, method: str, wire_channel: str, symbols: List[str]) -> None:
+        for batch in self.chunk(symbols, self.MAX_SYMBOLS_PER_REQUEST):
+            params: dict = {"channel": wire_channel, "symbol": batch}
+            if wire_channel == "book" and method == "subscribe":
+                params["depth"] = self.book_depth
+            self.send(
+                {"method": method, "params": params, "req_id": self._next_req_id()}
+            )
+
+    def _next_req_id(self) -> int:
+        with self._lock:
+            self._req_id += 1
+            return self._req_id
+
+    def on_connect(self) -> None:
+        with self._lock:
+            self._pending = {}
+            for channel, symbols in self._subscriptions.items():
+                self._pending.setdefault(self._wire_channel(channel), set()).update(
+                    symbols
+                )
+        # Books are rebuilt from the snapshots sent after resubscribing.
+        self.books = {}
+
+    def on_idle(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for wire_channel, symbols in pending.items():
+            self._send_batched("subscribe", wire_channel, sorted(symbols))
+
+    def on_disconnect(self) -> None:
+        self._emit(MarketDataEvent("status", None, "disconnected", None))
+
+    def on_error(self, error: Exception, message: Any) -> None:
+        self._emit(MarketDataEvent("error", None, "handler", error))
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        super().stop(timeout)
+        if self._record_file is not None:
+            self._record_file.close()
+            self._record_file = None
+
+    def _emit(self, event: MarketDataEvent) -> None:
+        while True:
+            try:
+                self.events.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.events.get_nowait()
+                    self.dropped_count += 1
+                except queue.Empty:
+                    pass
+
+    def iter_events(self, timeout: float | None = None) -> Iterator[MarketDataEvent]:
+        """Yields events as they arrive, stopping after timeout seconds without one."""
+        while True:
+            try:
+                yield self.events.get(timeout=timeout)
+            except queue.Empty:
+                return
+
+    @classmethod
+    def _to_seconds(cls, timestamp: str | None) -> float:
+        if not timestamp:
+            return datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        return datetime.datetime.fromisoformat(
+            timestamp.replace("Z", "+00:00")
+        ).timestamp()
+
+    def handle_message(self, message: Any) -> None:
+        if self.record_path is not None:
+            # Kept open between messages, so recording costs a buffered write.
+            if self._record_file is None:
+                self._record_file = open(self.record_path, "a")
+            self._record_file.write(json.dumps(message) + "\n")
+
+        if not isinstance(message, dict):
+            return
+
+        if "method" in message:
+            if message.get("success") is False:
+                self._emit(MarketDataEvent("error", None, message["method"], message))
+            return
+
+        channel = message.get("channel")
+        data = message.get("data") or []
+        type = message.get("type", "update")
+        if channel == "ticker":
+            self._handle_ticker(data, type)
+        elif channel == "trade":
+            self._handle_trade(data, type)
+        elif channel == "book":
+            self._handle_book(data, type)
+
+    def _handle_ticker(self, data: list, type: str) -> None:
+        for item in data:
+            symbol = item.get("symbol")
+            if symbol in self._subscriptions["ticker"]:
+                self._emit(MarketDataEvent("ticker", symbol, type, item))
+
+            if symbol in self._subscriptions["spread"]:
+                row = [
+                    self._to_seconds(item.get("timestamp")),
+                    item.get("bid"),
+                    item.get("ask"),
+                ]
+                if symbol not in self.spreads:
+                    self.spreads[symbol] = SpreadSeries()
+                self.spreads[symbol].append_rows([row])
+                self._emit(MarketDataEvent("spread", symbol, type, row))
+
+    def _handle_trade(self, data: list, type: str) -> None:
+        rows_by_symbol: Dict[str, list] = {}
+        for item in data:
+            rows_by_symbol.setdefault(item.get("symbol"), []).append(
+                [
+                    item.get("price"),
+                    item.get("qty"),
+                    self._to_seconds(item.get("timestamp")),
+                    "b" if item.get("side") == "buy" else "s",
+                    "m" if item.get("ord_type") == "market" else "l",
+                    "",
+                    item.get("trade_id"),
+                ]
+            )
+        for symbol, rows in rows_by_symbol.items():
+            self._emit(
+                MarketDataEvent("trade", symbol, type, TradeColumns.from_rows(rows))
+            )
+
+    def _handle_book(self, data: list, type: str) -> None:
+        for item in data:
+            symbol = item.get("symbol")
+            asks = [[level["price"], level["qty"]] for level in item.get("asks", [])]
+            bids = [[level["price"], level["qty"]] for level in item.get("bids", [])]
+            decimals = self.pair_metadata.get_decimals(symbol)
+
+            if type == "snapshot" or symbol not in self.books:
+                if decimals is None:
+                    # Without metadata, use the most decimals seen in the snapshot.
+                    levels = asks + bids
+                    decimals = (
+                        max([OrderBook.get_decimals(str(l[0])) for l in levels] or [0]),
+                        max([OrderBook.get_decimals(str(l[1])) for l in levels] or [0]),
+                    )
+                book = OrderBook(symbol, decimals[0], decimals[1], self.book_depth)
+                book.apply_snapshot(asks, bids)
+                self.books[symbol] = book
+            else:
+                book = self.books[symbol]
+                book.apply_updates(asks, bids)
+
+            # The checksum only holds with the pair's real precision.
+            if "checksum" in item and self.pair_metadata.get_decimals(symbol):
+                if book.checksum() != int(item["checksum"]):
+                    self.checksum_failures += 1
+                    del self.books[symbol]
+                    self._send_batched("unsubscribe", "book", [symbol])
+                    self._send_batched("subscribe", "book", [symbol])
+                    self._emit(MarketDataEvent("book", symbol, "invalid", None))
+                    continue
+
+            self._emit(
+                MarketDataEvent(
+                    "book",
+                    symbol,
+                    type,
+                    {
+                        "asks": book.get_levels(False, self.book_depth),
+                        "bids": book.get_levels(True, self.book_depth),
+                    },
+                )
+            )
@@ -0,0 +1,67 @@
+from typing import Dict, Tuple
+
+
+class PairMetadata:
+    """Names and precisions of the pairs, shared by the REST and WebSocket models.
+
+    Built from an AssetPairListRequest response, it maps WebSocket symbols such
+    as "XBT/USD" to the REST pair names and holds the decimals used by the
+    fixed-point order book.
+    """
+
+    def __init__(self) -> None:
+        self.pairs: Dict[str, dict] = {}
+        """Pair info keyed by WebSocket symbol"""
+
+        self._symbols: Dict[str, str] = {}
+
+    @classmethod
+    def from_asset_pairs(cls, response: dict) -> "PairMetadata":
+        """Reads an AssetPairListRequest response (the "result" dict)."""
+        metadata = cls()
+        for name, info in response.items():
+            if not isinstance(info, dict) or "wsname" not in info:
+                continue
+            metadata.add(
+                symbol=info["wsname"],
+                pair=name,
+                altname=info.get("altname", name),
+                price_decimals=int(info.get("pair_decimals", 5)),
+                volume_decimals=int(info.get("lot_decimals", 8)),
+            )
+        return metadata
+
+    def add(
+        self,
+        symbol: str,
+        pair: str,
+        altname: str | None = None,
+        price_decimals: int = 5,
+        volume_decimals: int = 8,
+    ) -> None:
+        self.pairs[symbol] = {
+            "symbol": symbol,
+            "pair": pair,
+            "altname": altname if altname is not None else pair,
+            "price_decimals": price_decimals,
+            "volume_decimals": volume_decimals,
+        }
+        self._symbols[pair] = symbol
+        self._symbols[self.pairs[symbol]["altname"]] = symbol
+
+    def get_symbol(self, pair: str) -> str:
+        """WebSocket symbol for a REST pair name or altname"""
+        if pair in self.pairs:
+            return pair
+        return self._symbols[pair]
+
+    def get_pair(self, symbol: str) -> str:
+        """REST pair name for a WebSocket symbol"""
+        return self.pairs[symbol]["pair"] if symbol in self.pairs else symbol
+
+    def get_decimals(self, symbol: str) -> Tuple[int, int] | None:
+        """Price and volume decimals for a symbol, if known"""
+        if symbol not in self.pairs:
+            return None
+        info = self.pairs[symbol]
+        return info["price_decimals"], info["volume_decimals"]
@@ -0,0 +1,204 @@
+import time
+from decimal import Decimal
+import pytest
+from ..book.order_book import OrderBook
+from ..columnar.trade_columns import TradeColumns
+from ..errors import ApiException
+from ..requests import (
+    AssetPairListRequest,
+    OrderAddRequest,
+    OrderCancelRequest,
+    OrderEditRequest,
+    WebSocketTokenCreateRequest,
+)
+from .feed_server import FeedServer
+from .market_data_client import MarketDataClient
+from .pair_metadata import PairMetadata
+from .trading_server import TradingServer
+from .trading_session import TradingSession
+
+API_KEY = "key"
+SECURITY_KEY = "c2VjcmV0"
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def get_book_messages() -> list:
+    book = OrderBook("XBT/USD", 1, 8)
+    book.apply_snapshot([["30384.1", "2.05900000"]], [["30297.0", "1.11500000"]])
+    snapshot_checksum = book.checksum()
+    book.apply_updates(bids=[["30298.0", "0.50000000"]])
+    return [
+        {
+            "channel": "book",
+            "type": "snapshot",
+            "data": [
+                {
+                    "symbol": "XBT/USD",
+                    "asks": [{"price": 30384.1, "qty": 2.059}],
+                    "bids": [{"price": 30297.0, "qty": 1.115}],
+                    "checksum": snapshot_checksum,
+                }
+            ],
+        },
+        {
+            "channel": "book",
+            "type": "update",
+            "data": [
+                {
+                    "symbol": "XBT/USD",
+                    "asks": [],
+                    "bids": [{"price": 30298.0, "qty": 0.5}],
+                    "checksum": book.checksum(),
+                }
+            ],
+        },
+    ]
+
+
+def test_pair_metadata_reads_asset_pairs():
+    response = AssetPairListRequest().get_factory_response()["result"]
+    metadata = PairMetadata.from_asset_pairs(response)
+
+    assert metadata.get_symbol("1INCHEUR") == "1INCH/EUR"
+    assert metadata.get_pair("1INCH/EUR") == "1INCHEUR"
+    assert metadata.get_decimals("1INCH/EUR") == (3, 8)
+
+
+def test_market_data_client_decodes_channels_and_reconnects():
+    messages = FeedServer.synthetic_messages(["XBT/USD", "ETH/USD"], count=5)
+    server = FeedServer(messages + get_book_messages()).start()
+    metadata = PairMetadata()
+    metadata.add("XBT/USD", "XXBTZUSD", "XBTUSD", price_decimals=1)
+    client = MarketDataClient(
+        pair_metadata=metadata, url=server.url, reconnect_delay=0.05
+    )
+    try:
+        client.subscribe("spread", ["XBTUSD"])
+        client.subscribe("trade", ["XBT/USD"])
+        client.subscribe("book", ["XBT/USD"])
+        client.start()
+
+        assert wait_for(lambda: len(client.spreads.get("XBT/USD", [])) == 5)
+        assert wait_for(lambda: client.events.qsize() >= 12)
+        events = list(client.iter_events(timeout=0.2))
+        trades = [event.data for event in events if event.channel == "trade"]
+        assert len(trades) == 5
+        assert isinstance(trades[0], TradeColumns)
+        assert {event.symbol for event in events} == {"XBT/USD"}
+
+        books = [event for event in events if event.channel == "book"]
+        assert [event.type for event in books] == ["snapshot", "update"]
+        assert list(books[-1].data["bids"][0]) == [30298.0, 30297.0]
+        assert client.checksum_failures == 0
+
+        # One batched subscribe message per wire channel.
+        subscribes = [m for m in server.received if m["method"] == "subscribe"]
+        assert sorted(m["params"]["channel"] for m in subscribes) == [
+            "book",
+            "ticker",
+            "trade",
+        ]
+
+        server.drop_connections()
+        assert wait_for(lambda: client.connection_count == 2)
+        # Subscriptions are resent, and replayed spreads older than the last are dropped.
+        assert wait_for(
+            lambda: len([m for m in server.received if m["method"] == "subscribe"]) == 6
+        )
+        assert wait_for(lambda: client.spreads["XBT/USD"].late_count == 4)
+    finally:
+        client.stop()
+        server.stop()
+
+
+def test_trading_session_submits_order_models():
+    token = WebSocketTokenCreateRequest().get_factory_response()["result"]["token"]
+    server = TradingServer(token).start()
+    metadata = PairMetadata()
+    metadata.add("XBT/USD", "XXBTZUSD", "XBTUSD", price_decimals=1)
+    session = TradingSession(
+        API_KEY, SECURITY_KEY, use_mock=True, pair_metadata=metadata, url=server.url
+    ).start()
+    try:
+        add = OrderAddRequest()
+        add.pair = "XBTUSD"
+        add.type = "buy"
+        add.ordertype = "stop-loss-limit"
+        add.volume = "1.25"
+        add.price = "27000.0"
+        add.price2 = "27100.0"
+        add.reference_id = "42"
+        add.order_flags = "post"
+
+        added = session.submit(add)
+        txid = added["txid"][0]
+        assert server.orders[txid] == {
+            "order_type": "stop-loss-limit",
+            "side": "buy",
+            "symbol": "XBT/USD",
+            "order_qty": Decimal("1.25"),
+            "triggers": {"reference": "last", "price": Decimal("27000.0")},
+            "limit_price": Decimal("27100.0"),
+            "order_userref": 42,
+            "post_only": True,
+        }
+
+        edit = OrderEditRequest()
+        edit.transaction_id = txid
+        edited = session.submit(edit)
+        assert edited["originaltxid"] == txid
+
+        cancel = OrderCancelRequest()
+        cancel.transaction_id = edited["txid"]
+        assert session.submit(cancel)["count"] == 1
+        assert server.orders == {}
+
+        # Errors raise the same exceptions as the REST API.
+        with pytest.raises(ApiException):
+            session.submit(cancel)
+
+        # A new token is fetched after reconnecting.
+        session.token = "expired"
+        server.drop_connections()
+        assert wait_for(lambda: session.connection_count == 2)
+        assert session.submit(add)["txid"][0] in server.orders
+    finally:
+        session.stop()
+        server.stop()
+
+
+def test_market_data_client_survives_handler_errors(tmp_path):
+    class FailingClient(MarketDataClient):
+        def _handle_trade(self, data: list, type: str) -> None:
+            if self.error_count == 0:
+                raise KeyError("price")
+            super()._handle_trade(data, type)
+
+    messages = FeedServer.synthetic_messages(["XBT/USD"], count=5)
+    server = FeedServer(messages).start()
+    record_path = str(tmp_path / "feed.jsonl")
+    client = FailingClient(url=server.url, record_path=record_path)
+    try:
+        client.subscribe("trade", ["XBT/USD"])
+        client.start()
+
+        assert wait_for(lambda: client.events.qsize() >= 5)
+        events = list(client.iter_events(timeout=0.2))
+        assert [event.channel for event in events] == ["error"] + ["trade"] * 4
+        assert isinstance(events[0].data, KeyError)
+        assert client.error_count == 1
+        assert isinstance(client.last_error, KeyError)
+        assert client.connection_count == 1
+    finally:
+        client.stop()
+        server.stop()
+
+    assert len(FeedServer.from_file(record_path).messages) == 5
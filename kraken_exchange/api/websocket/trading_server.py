@@ -0,0 +1,91 @@
+import itertools
+from typing import Dict
+from websockets.sync.server import ServerConnection
+from .feed_server import FeedServer
+
+
+class TradingServer(FeedServer):
+    """Local stand-in for Kraken's authenticated WebSocket v2 API.
+
+    Orders are accepted when sent with the expected token and kept in orders,
+    keyed by order id, so tests can check what reached the "exchange".
+    """
+
+    def __init__(self, token: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.token = token
+        self.orders: Dict[str, dict] = {}
+        """Open orders by order id"""
+
+        self._order_ids = itertools.count(1)
+
+    def get_order_id(self) -> str:
+        return "O{0:05d}-MOCK-ORDER".format(next(self._order_ids))
+
+    def acknowledge(
+        self,
+        connection: ServerConnection,
+        message: dict,
+        result: dict | None = None,
+        error: str | None = None,
+    ) -> None:
+        ack: dict = {
+            "method": message.get("method"),
+            "req_id": message.get("req_id"),
+            "success": error is None,
+        }
+        if error is not None:
+            ack["error"] = error
+        else:
+            ack["result"] = result
+        self.send(connection, ack)
+
+    def handle_request(self, connection: ServerConnection, message: dict) -> None:
+        method = message.get("method")
+        if method not in ("add_order", "edit_order", "cancel_order"):
+            super().handle_request(connection, message)
+            return
+
+        params = dict(message.get("params") or {})
+        if params.pop("token", None) != self.token:
+            self.acknowledge(connection, message, error="ESession:Invalid session")
+            return
+
+        if method == "add_order":
+            if "symbol" not in params or "order_qty" not in params:
+                self.acknowledge(
+                    connection, message, error="EGeneral:Invalid arguments"
+                )
+                return
+            order_id = self.get_order_id()
+            with self._lock:
+                self.orders[order_id] = params
+            result = {"order_id": order_id}
+            if "order_userref" in params:
+                result["order_userref"] = params["order_userref"]
+            self.acknowledge(connection, message, result)
+
+        elif method == "edit_order":
+            original_order_id = params.pop("order_id", None)
+            with self._lock:
+                order = self.orders.pop(original_order_id, None)
+                if order is not None:
+                    order_id = self.get_order_id()
+                    self.orders[order_id] = dict(order, **params)
+            if order is None:
+                self.acknowledge(connection, message, error="EOrder:Unknown order")
+                return
+            self.acknowledge(
+                connection,
+                message,
+                {"order_id": order_id, "original_order_id": original_order_id},
+            )
+
+        else:
+            for order_id in params.get("order_id") or []:
+                with self._lock:
+                    found = self.orders.pop(order_id, None) is not None
+                if found:
+                    self.acknowledge(connection, message, {"order_id": order_id})
+                else:
+                    self.acknowledge(connection, message, error="EOrder:Unknown order")
@@ -0,0 +1,268 @@
+import threading
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List
+from ..abstract.nonce_generator import NonceGenerator
+from ..abstract.request import Request
+from ..errors import ApiException
+from ..requests.order_add_request import OrderAddRequest
+from ..requests.order_cancel_request import OrderCancelRequest
+from ..requests.order_edit_request import OrderEditRequest
+from ..requests.web_socket_token_create_request import WebSocketTokenCreateRequest
+from .pair_metadata import PairMetadata
+from .web_socket_session import WebSocketSession
+
+
+class TradingSession(WebSocketSession):
+    """Authenticated WebSocket v2 session for placing, editing and cancelling orders.
+
+    submit() takes the same OrderAddRequest, OrderEditRequest and
+    OrderCancelRequest models as the REST API, sends them over a persistent
+    socket and waits for the acknowledgement with the same req_id. The result
+    is shaped like the REST one (txid, count, originaltxid) and errors raise the
+    same ApiException classes, so callers can switch between the two.
+
+    The token is fetched with GetWebSocketsToken before the first request, and
+    again after every reconnection.
+    """
+
+    URL: str = "wss://ws-auth.kraken.com/v2"
+
+    METHODS: Dict[type, str] = {
+        OrderAddRequest: "add_order",
+        OrderEditRequest: "edit_order",
+        OrderCancelRequest: "cancel_order",
+    }
+
+    TRIGGER_ORDER_TYPES = (
+        "stop-loss",
+        "stop-loss-limit",
+        "take-profit",
+        "take-profit-limit",
+        "trailing-stop",
+        "trailing-stop-limit",
+    )
+
+    UNSUPPORTED_FIELDS = ("leverage", "starttm", "expiretm", "deadline")
+    """REST fields with no WebSocket equivalent. Use the REST API for these."""
+
+    def __init__(
+        self,
+        api_key: str,
+        security_key: str,
+        use_mock: bool = False,
+        nonce_generator: NonceGenerator | None = None,
+        pair_metadata: PairMetadata | None = None,
+        timeout: float = 5.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.api_key = api_key
+        self.security_key = security_key
+        self.use_mock = use_mock
+        """Whether the token request uses the mock factory response"""
+
+        self.nonce_generator = (
+            nonce_generator if nonce_generator is not None else NonceGenerator()
+        )
+        self.pair_metadata = (
+            pair_metadata if pair_metadata is not None else PairMetadata()
+        )
+        self.timeout = timeout
+        """Seconds to wait for the connection and for each acknowledgement"""
+
+        self.token: str | None = None
+        self._lock = threading.Lock()
+        self._token_lock = threading.Lock()
+        self._req_id = 0
+        self._pending: Dict[int, list] = {}
+
+    def get_token(self) -> str:
+        """Returns the current token, fetching a new one when needed."""
+        with self._token_lock:
+            if self.token is None:
+                response = WebSocketTokenCreateRequest().submit(
+                    use_mock=self.use_mock,
+                    nonce=self.nonce_generator.next(),
+                    api_key=self.api_key,
+                    security_key=self.security_key,
+                )
+                self.token = response["token"]
+            return self.token
+
+    def submit(self, request: Request, timeout: float | None = None) -> dict:
+        """Sends an order request and returns its REST shaped result.
+
+        Raises TimeoutError when no acknowledgement arrives in time, and
+        ConnectionError when the connection drops first. In both cases the
+        order may still have reached Kraken.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        message = self.to_message(request)
+        if not self.wait_connected(timeout):
+            raise TimeoutError("Not connected to {0}".format(self.url))
+
+        message["params"]["token"] = self.get_token()
+        waiter: list = [threading.Event(), None]
+        with self._lock:
+            self._req_id += 1
+            message["req_id"] = self._req_id
+            self._pending[self._req_id] = waiter
+
+        try:
+            if not self.send(message):
+                raise ConnectionError("Not connected to {0}".format(self.url))
+            if not waiter[0].wait(timeout):
+                raise TimeoutError(
+                    "No acknowledgement for {0} after {1}s".format(
+                        message["method"], timeout
+                    )
+                )
+        finally:
+            with self._lock:
+                self._pending.pop(message["req_id"], None)
+
+        response = waiter[1]
+        if isinstance(response, Exception):
+            raise response
+        if response.get("success") is False:
+            raise ApiException.get_exception_class(str(response.get("error", "")))()
+        return self.to_result(message["method"], response.get("result") or {})
+
+    @classmethod
+    def get_ws_method(cls, request: Request) -> str:
+        for request_class, method in cls.METHODS.items():
+            if isinstance(request, request_class):
+                return method
+        raise ValueError(
+            "{0} can't be sent over WebSocket".format(request.__class__.__name__)
+        )
+
+    def _to_symbol(self, pair: str) -> str:
+        try:
+            return self.pair_metadata.get_symbol(pair)
+        except KeyError:
+            return pair
+
+    @classmethod
+    def _to_number(cls, name: str, value: Any) -> Decimal:
+        try:
+            return Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(
+                "{0}={1} must be a number. Relative prices are only supported by the REST API".format(
+                    name, value
+                )
+            )
+
+    def to_message(self, request: Request) -> dict:
+        """Translates a request model to a v2 message, without token or req_id."""
+        method = self.get_ws_method(request)
+        body = request.get_properties_in("body")
+        body.pop("nonce", None)
+
+        # Models built from values always hold a close order, usually empty.
+        close = body.pop("close", None)
+        if close is not None and len(
+            close.__dict__ if isinstance(close, Request) else close
+        ):
+            body["close"] = close
+
+        unsupported = [
+            key for key in self.UNSUPPORTED_FIELDS + ("close",) if key in body
+        ]
+        if len(unsupported) > 0:
+            raise ValueError(
+                "{0} can't be sent over WebSocket".format(", ".join(unsupported))
+            )
+
+        params: dict = {}
+        if "txid" in body:
+            txid = body.pop("txid")
+            params["order_id"] = [txid] if method == "cancel_order" else txid
+
+        order_type = body.pop("ordertype", None)
+        if order_type is not None:
+            params["order_type"] = order_type
+        if "type" in body:
+            params["side"] = body.pop("type")
+        if "pair" in body:
+            params["symbol"] = self._to_symbol(body.pop("pair"))
+        if "volume" in body:
+            params["order_qty"] = self._to_number("volume", body.pop("volume"))
+        if "display_volume" in body:
+            params["display_qty"] = self._to_number(
+                "display_volume", body.pop("display_volume")
+            )
+
+        # Trigger orders use price as the trigger and price2 as the limit price.
+        if order_type in self.TRIGGER_ORDER_TYPES:
+            triggers: dict = {"reference": body.pop("trigger", "last")}
+            if "price" in body:
+                triggers["price"] = self._to_number("price", body.pop("price"))
+            params["triggers"] = triggers
+            if "price2" in body:
+                params["limit_price"] = self._to_number("price2", body.pop("price2"))
+        elif "price" in body:
+            params["limit_price"] = self._to_number("price", body.pop("price"))
+
+        if "timeinforce" in body:
+            params["time_in_force"] = str(body.pop("timeinforce")).lower()
+        if "userref" in body:
+            params["order_userref"] = int(body.pop("userref"))
+        if "stptype" in body:
+            params["stp_type"] = body.pop("stptype").replace("-", "_")
+        for flag in ("reduce_only", "validate"):
+            if flag in body:
+                params[flag] = str(body.pop(flag)).lower() == "true"
+
+        for flag in str(body.pop("oflags", "")).split(","):
+            match flag.strip():
+                case "post":
+                    params["post_only"] = True
+                case "fcib":
+                    params["fee_preference"] = "base"
+                case "fciq":
+                    params["fee_preference"] = "quote"
+                case "nompp":
+                    params["no_mpp"] = True
+                case "viqc":
+                    params["cash_order_qty"] = params.pop("order_qty", None)
+
+        if len(body) > 0:
+            raise ValueError(
+                "{0} can't be sent over WebSocket".format(", ".join(body.keys()))
+            )
+        return {"method": method, "params": params}
+
+    @classmethod
+    def to_result(cls, method: str, result: dict) -> dict:
+        """Adds the REST names of the fields to a v2 result."""
+        result = dict(result)
+        match method:
+            case "add_order":
+                result["txid"] = [result.get("order_id")]
+            case "edit_order":
+                result["txid"] = result.get("order_id")
+                result["originaltxid"] = result.get("original_order_id")
+            case "cancel_order":
+                result["count"] = 1
+        return result
+
+    def on_disconnect(self) -> None:
+        # Tokens expire 15 minutes after the connection closes.
+        with self._token_lock:
+            self.token = None
+        with self._lock:
+            pending: List[list] = list(self._pending.values())
+        for waiter in pending:
+            waiter[1] = ConnectionError("Connection lost before acknowledgement")
+            waiter[0].set()
+
+    def handle_message(self, message: Any) -> None:
+        if not isinstance(message, dict) or "req_id" not in message:
+            return
+        with self._lock:
+            waiter = self._pending.get(message["req_id"])
+        if waiter is not None:
+            waiter[1] = message
+            waiter[0].set()
@@ -0,0 +1,148 @@
+import threading
+from typing import Any, Callable, List
+import simplejson as json
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.sync.client import ClientConnection, connect
+from ..errors import NotImplemented
+
+
+class WebSocketSession:
+    """A WebSocket connection to Kraken, kept open by a background thread.
+
+    The thread connects, calls on_connect(), then passes every decoded message
+    to handle_message(). When the connection drops it reconnects with an
+    exponential backoff, so callers never block on connection handling. A
+    message that fails to decode or to handle is counted and passed to
+    on_error(), and reading carries on with the next one.
+
+    Messages are decoded with Decimals, so prices keep their exact precision.
+    """
+
+    URL: str = "wss://ws.kraken.com/v2"
+
+    def __init__(
+        self,
+        url: str | None = None,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        poll_interval: float = 0.05,
+        connector: Callable[[str], ClientConnection] = connect,
+    ) -> None:
+        self.url = url if url is not None else self.URL
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.poll_interval = poll_interval
+        """Longest wait between checks for work queued by other threads"""
+
+        self.connection_count = 0
+        """Number of successful connections, including reconnections"""
+
+        self.error_count = 0
+        """Number of messages that failed to decode or to handle"""
+
+        self.last_error: Exception | None = None
+        self.connected = threading.Event()
+        self._connector = connector
+        self._connection: ClientConnection | None = None
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._send_lock = threading.Lock()
+
+    def start(self) -> "WebSocketSession":
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=self.__class__.__name__, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stopping.set()
+        connection = self._connection
+        if connection is not None:
+            connection.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        return self.connected.wait(timeout)
+
+    def send(self, message: dict) -> bool:
+        """Sends a message now, returning False when not connected."""
+        connection = self._connection
+        if connection is None or not self.connected.is_set():
+            return False
+
+        try:
+            with self._send_lock:
+                connection.send(json.dumps(message))
+            return True
+        except (ConnectionClosed, OSError):
+            return False
+
+    def on_connect(self) -> None:
+        """Called on the session thread after every (re)connection."""
+        pass
+
+    def on_disconnect(self) -> None:
+        """Called on the session thread when the connection is lost."""
+        pass
+
+    def on_idle(self) -> None:
+        """Called on the session thread at least every poll_interval seconds."""
+        pass
+
+    def on_error(self, error: Exception, message: Any) -> None:
+        """Called on the session thread when a message fails to decode or to handle."""
+        pass
+
+    def handle_message(self, message: Any) -> None:
+        raise NotImplemented(
+            "{0}.handle_message() was not implemented".format(self.__class__.__name__)
+        )
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+        while not self._stopping.is_set():
+            try:
+                with self._connector(self.url) as connection:
+                    self._connection = connection
+                    self.connection_count += 1
+                    self.connected.set()
+                    delay = self.reconnect_delay
+                    self.on_connect()
+                    self._read(connection)
+            except (WebSocketException, OSError, TimeoutError):
+                pass
+            finally:
+                was_connected = self.connected.is_set()
+                self.connected.clear()
+                self._connection = None
+                if was_connected:
+                    self.on_disconnect()
+
+            if self._stopping.wait(delay):
+                return
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _read(self, connection: ClientConnection) -> None:
+        while not self._stopping.is_set():
+            self.on_idle()
+            try:
+                raw = connection.recv(timeout=self.poll_interval)
+            except TimeoutError:
+                continue
+
+            message = raw
+            try:
+                message = json.loads(raw, use_decimal=True)
+                self.handle_message(message)
+            except Exception as e:
+                self.error_count += 1
+                self.last_error = e
+                self.on_error(e, message)
+
+    @classmethod
+    def chunk(cls, items: List[Any], size: int) -> List[List[Any]]:
+        return [items[start : start + size] for start in range(0, len(items), size)]